@@ -13,9 +13,12 @@ if DuckDB is not available.
 
 import json
 import os
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 import logging
 
 from .edit_record import (
@@ -47,6 +50,12 @@ class SemanticEditGraph:
         """
         self.db_path = db_path
         self._connection = None
+        # Writes go through _connection one at a time; reads use a
+        # connection per thread so concurrent agents don't queue on it
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        # id -> open reader connection, so close() can reach every thread's
+        self._reader_connections: Dict[int, Any] = {}
         self._use_duckdb = use_duckdb and self._check_duckdb_available()
 
         if self._use_duckdb:
@@ -81,9 +90,11 @@ class SemanticEditGraph:
 
         if self.db_path:
             Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-            self._connection = sqlite3.connect(self.db_path)
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL lets readers run while a write is in progress
+            self._connection.execute("PRAGMA journal_mode=WAL")
         else:
-            self._connection = sqlite3.connect(":memory:")
+            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
 
         self._create_schema_sqlite()
 
@@ -205,10 +216,11 @@ class SemanticEditGraph:
         """
         data_json = json.dumps(edit.to_dict())
 
-        if self._use_duckdb:
-            self._record_edit_duckdb(edit, data_json)
-        else:
-            self._record_edit_sqlite(edit, data_json)
+        with self._write_lock:
+            if self._use_duckdb:
+                self._record_edit_duckdb(edit, data_json)
+            else:
+                self._record_edit_sqlite(edit, data_json)
 
         logger.debug(f"Recorded edit {edit.id} for {edit.file_path}")
         return edit.id
@@ -333,14 +345,15 @@ class SemanticEditGraph:
         Returns:
             The Edit object or None if not found
         """
-        if self._use_duckdb:
-            result = self._connection.execute(
-                "SELECT data FROM edits WHERE id = ?", [edit_id]
-            ).fetchone()
-        else:
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT data FROM edits WHERE id = ?", (edit_id,))
-            result = cursor.fetchone()
+        with self._reader() as conn:
+            if self._use_duckdb:
+                result = conn.execute(
+                    "SELECT data FROM edits WHERE id = ?", [edit_id]
+                ).fetchone()
+            else:
+                cursor = conn.cursor()
+                cursor.execute("SELECT data FROM edits WHERE id = ?", (edit_id,))
+                result = cursor.fetchone()
 
         if result:
             return Edit.from_dict(json.loads(result[0]))
@@ -363,27 +376,28 @@ class SemanticEditGraph:
         Returns:
             List of Edit objects
         """
-        if self._use_duckdb:
-            query = """
-                SELECT DISTINCT e.data
-                FROM edits e
-                JOIN symbols s ON e.id = s.edit_id
-                WHERE s.symbol_name LIKE ?
-                ORDER BY e.timestamp DESC
-                LIMIT ?
-            """
-            results = self._connection.execute(query, [f"%{symbol_name}%", limit]).fetchall()
-        else:
-            cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT DISTINCT e.data
-                FROM edits e
-                JOIN symbols s ON e.id = s.edit_id
-                WHERE s.symbol_name LIKE ?
-                ORDER BY e.timestamp DESC
-                LIMIT ?
-            """, (f"%{symbol_name}%", limit))
-            results = cursor.fetchall()
+        with self._reader() as conn:
+            if self._use_duckdb:
+                query = """
+                    SELECT DISTINCT e.data
+                    FROM edits e
+                    JOIN symbols s ON e.id = s.edit_id
+                    WHERE s.symbol_name LIKE ?
+                    ORDER BY e.timestamp DESC
+                    LIMIT ?
+                """
+                results = conn.execute(query, [f"%{symbol_name}%", limit]).fetchall()
+            else:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT DISTINCT e.data
+                    FROM edits e
+                    JOIN symbols s ON e.id = s.edit_id
+                    WHERE s.symbol_name LIKE ?
+                    ORDER BY e.timestamp DESC
+                    LIMIT ?
+                """, (f"%{symbol_name}%", limit))
+                results = cursor.fetchall()
 
         return [Edit.from_dict(json.loads(row[0])) for row in results]
 
@@ -402,22 +416,23 @@ class SemanticEditGraph:
         Returns:
             List of Edit objects, most recent first
         """
-        if self._use_duckdb:
-            results = self._connection.execute("""
-                SELECT data FROM edits
-                WHERE file_path = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, [file_path, limit]).fetchall()
-        else:
-            cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT data FROM edits
-                WHERE file_path = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (file_path, limit))
-            results = cursor.fetchall()
+        with self._reader() as conn:
+            if self._use_duckdb:
+                results = conn.execute("""
+                    SELECT data FROM edits
+                    WHERE file_path = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """, [file_path, limit]).fetchall()
+            else:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT data FROM edits
+                    WHERE file_path = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """, (file_path, limit))
+                results = cursor.fetchall()
 
         return [Edit.from_dict(json.loads(row[0])) for row in results]
 
@@ -436,22 +451,23 @@ class SemanticEditGraph:
         Returns:
             List of Edit objects
         """
-        if self._use_duckdb:
-            results = self._connection.execute("""
-                SELECT data FROM edits
-                WHERE user_intent LIKE ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, [f"%{intent_keywords}%", limit]).fetchall()
-        else:
-            cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT data FROM edits
-                WHERE user_intent LIKE ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (f"%{intent_keywords}%", limit))
-            results = cursor.fetchall()
+        with self._reader() as conn:
+            if self._use_duckdb:
+                results = conn.execute("""
+                    SELECT data FROM edits
+                    WHERE user_intent LIKE ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """, [f"%{intent_keywords}%", limit]).fetchall()
+            else:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT data FROM edits
+                    WHERE user_intent LIKE ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """, (f"%{intent_keywords}%", limit))
+                results = cursor.fetchall()
 
         return [Edit.from_dict(json.loads(row[0])) for row in results]
 
@@ -468,24 +484,25 @@ class SemanticEditGraph:
         Returns:
             List of Edit objects in chronological order
         """
-        if self._use_duckdb:
-            results = self._connection.execute("""
-                SELECT e.data
-                FROM edits e
-                JOIN conversations c ON e.id = c.edit_id
-                WHERE c.conversation_id = ?
-                ORDER BY c.turn_index ASC
-            """, [conversation_id]).fetchall()
-        else:
-            cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT e.data
-                FROM edits e
-                JOIN conversations c ON e.id = c.edit_id
-                WHERE c.conversation_id = ?
-                ORDER BY c.turn_index ASC
-            """, (conversation_id,))
-            results = cursor.fetchall()
+        with self._reader() as conn:
+            if self._use_duckdb:
+                results = conn.execute("""
+                    SELECT e.data
+                    FROM edits e
+                    JOIN conversations c ON e.id = c.edit_id
+                    WHERE c.conversation_id = ?
+                    ORDER BY c.turn_index ASC
+                """, [conversation_id]).fetchall()
+            else:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT e.data
+                    FROM edits e
+                    JOIN conversations c ON e.id = c.edit_id
+                    WHERE c.conversation_id = ?
+                    ORDER BY c.turn_index ASC
+                """, (conversation_id,))
+                results = cursor.fetchall()
 
         return [Edit.from_dict(json.loads(row[0])) for row in results]
 
@@ -602,35 +619,36 @@ class SemanticEditGraph:
         Returns:
             Dictionary with edit statistics
         """
-        if self._use_duckdb:
-            total = self._connection.execute("SELECT COUNT(*) FROM edits").fetchone()[0]
-            by_type = self._connection.execute("""
-                SELECT edit_type, COUNT(*) as count
-                FROM edits
-                GROUP BY edit_type
-                ORDER BY count DESC
-            """).fetchall()
-            unique_files = self._connection.execute(
-                "SELECT COUNT(DISTINCT file_path) FROM edits"
-            ).fetchone()[0]
-            unique_symbols = self._connection.execute(
-                "SELECT COUNT(DISTINCT symbol_name) FROM symbols"
-            ).fetchone()[0]
-        else:
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM edits")
-            total = cursor.fetchone()[0]
-            cursor.execute("""
-                SELECT edit_type, COUNT(*) as count
-                FROM edits
-                GROUP BY edit_type
-                ORDER BY count DESC
-            """)
-            by_type = cursor.fetchall()
-            cursor.execute("SELECT COUNT(DISTINCT file_path) FROM edits")
-            unique_files = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(DISTINCT symbol_name) FROM symbols")
-            unique_symbols = cursor.fetchone()[0]
+        with self._reader() as conn:
+            if self._use_duckdb:
+                total = conn.execute("SELECT COUNT(*) FROM edits").fetchone()[0]
+                by_type = conn.execute("""
+                    SELECT edit_type, COUNT(*) as count
+                    FROM edits
+                    GROUP BY edit_type
+                    ORDER BY count DESC
+                """).fetchall()
+                unique_files = conn.execute(
+                    "SELECT COUNT(DISTINCT file_path) FROM edits"
+                ).fetchone()[0]
+                unique_symbols = conn.execute(
+                    "SELECT COUNT(DISTINCT symbol_name) FROM symbols"
+                ).fetchone()[0]
+            else:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM edits")
+                total = cursor.fetchone()[0]
+                cursor.execute("""
+                    SELECT edit_type, COUNT(*) as count
+                    FROM edits
+                    GROUP BY edit_type
+                    ORDER BY count DESC
+                """)
+                by_type = cursor.fetchall()
+                cursor.execute("SELECT COUNT(DISTINCT file_path) FROM edits")
+                unique_files = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(DISTINCT symbol_name) FROM symbols")
+                unique_symbols = cursor.fetchone()[0]
 
         return {
             "total_edits": total,
@@ -639,8 +657,48 @@ class SemanticEditGraph:
             "unique_symbols": unique_symbols,
         }
 
+    @contextmanager
+    def _reader(self) -> Iterator[Any]:
+        """
+        Yield a connection for read queries.
+
+        Each thread gets its own connection: a DuckDB cursor, or a second
+        SQLite connection to the same file (WAL mode, so it reads while
+        the writer commits). An in-memory SQLite database can't be opened
+        twice, so its reads share the main connection under the write lock.
+        """
+        if not self._use_duckdb and not self.db_path:
+            with self._write_lock:
+                yield self._connection
+            return
+
+        slot = getattr(self._local, "reader", None)
+        if slot is None:
+            if self._use_duckdb:
+                conn = self._connection.cursor()
+            else:
+                import sqlite3
+
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # The slot lives only in this thread's local storage, so it is
+            # dropped when the thread exits and takes the connection along
+            slot = _ReaderSlot(conn)
+            weakref.finalize(
+                slot, _close_reader, conn, self._reader_connections,
+                self._write_lock,
+            )
+            self._local.reader = slot
+            with self._write_lock:
+                self._reader_connections[id(conn)] = conn
+        yield slot.connection
+
     def close(self):
         """Close the database connection."""
+        with self._write_lock:
+            for conn in self._reader_connections.values():
+                conn.close()
+            self._reader_connections.clear()
+        self._local = threading.local()
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -650,3 +708,22 @@ class SemanticEditGraph:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class _ReaderSlot:
+    """A thread's reader connection, held in its thread-local storage."""
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+
+
+def _close_reader(
+    conn: Any, open_readers: Dict[int, Any], lock: threading.Lock
+) -> None:
+    """Close a reader whose thread has exited, unless close() got to it."""
+    with lock:
+        if open_readers.pop(id(conn), None) is None:
+            return
+    conn.close()
@@ -12,11 +12,48 @@ No Docker required - uses git and filesystem operations.
 import os
 import shutil
 import subprocess
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Read once: os.umask() can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_file_atomic(path: Path, content: str) -> None:
+    """
+    Replace a file's content in one step.
+
+    The content goes to a uniquely named staging file next to the target,
+    which is then renamed over it, so readers never see a half-written
+    file and concurrent writers don't share a staging file. Symlinks are
+    resolved first, so the link is kept and its target is replaced.
+
+    The replaced file is a new inode: only its permission bits carry
+    over, and any hardlinks, ownership or extended attributes of the old
+    file are not kept.
+    """
+    path = Path(path).resolve()
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=path.name + '.', suffix='.edit.tmp'
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        try:
+            shutil.copymode(path, tmp_path)
+        except OSError:
+            # New file - mkstemp's 0600 becomes what open() would create
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 @dataclass
 class FileBackup:
@@ -130,8 +167,7 @@ class EditRollback:
         full_path = Path(self.project_root) / file_path
 
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(backup.original_content)
+            write_file_atomic(full_path, backup.original_content)
 
             # Clean up disk backup if it exists
             if backup.backup_path and Path(backup.backup_path).exists():
@@ -5,20 +5,44 @@ Supports multiple languages:
 - Python: Uses ast.parse()
 - JavaScript/TypeScript: Uses node --check
 - JSON: Uses json.loads()
+- Shell: Uses bashlex (if installed), confirmed by bash -n
 - Others: Basic checks or no validation
 """
 
 import ast
+import atexit
 import json
+import os
+import re
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+try:
+    import bashlex
+    HAS_BASHLEX = True
+except ImportError:
+    HAS_BASHLEX = False
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Location patterns in Node.js error output ("file.js:3:7" or "file.js:3")
+_NODE_LINE_COL_RE = re.compile(r':(\d+):(\d+)')
+_NODE_LINE_RE = re.compile(r':(\d+)')
+
+# tsc diagnostics: "path/file.ts(3,7): error TS1005: ';' expected."
+_TSC_ERROR_RE = re.compile(r'^(.+?)\((\d+),(\d+)\): error (TS\d+: .*)$', re.MULTILINE)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SyntaxErrorInfo:
     """Details about a syntax error."""
     line: int
@@ -31,7 +55,7 @@ class SyntaxErrorInfo:
         return f"{location}{self.line}:{self.column}: {self.message}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SyntaxCheckResult:
     """Result of a syntax check."""
     valid: bool
@@ -74,9 +98,31 @@ class SyntaxChecker:
 
     def __init__(self):
         """Initialize the syntax checker."""
-        # Cache available tools
-        self._node_available = shutil.which('node') is not None
-        self._tsc_available = shutil.which('tsc') is not None
+        # Last (key, code, result) checked, per thread so check_batch
+        # workers don't clobber each other
+        self._last = threading.local()
+        self._tsc_lock = threading.Lock()
+
+    # Tool availability is looked up on first use, so checkers that only
+    # ever see Python never scan PATH.
+    @cached_property
+    def _node_available(self) -> bool:
+        return shutil.which('node') is not None
+
+    @cached_property
+    def _tsc_available(self) -> bool:
+        return shutil.which('tsc') is not None
+
+    @cached_property
+    def _bash_available(self) -> bool:
+        return shutil.which('bash') is not None
+
+    @cached_property
+    def _tsc_scratch_dir(self) -> str:
+        """Directory holding tsc inputs and its incremental build info."""
+        path = tempfile.mkdtemp(prefix='oi_tsc_')
+        atexit.register(shutil.rmtree, path, True)
+        return path
 
     def check(
         self,
@@ -97,10 +143,23 @@ class SyntaxChecker:
         """
         # Determine language
         if language is None:
-            ext = Path(file_path).suffix.lower()
-            language = self.LANGUAGE_MAP.get(ext, 'unknown')
+            language = self._detect_language(file_path)
+
+        # Edit loops often re-check the exact same buffer - reuse the result
+        key = (language, file_path, hash(code))
+        last = self._last
+        if getattr(last, 'key', None) == key and last.code == code:
+            return last.result
+
+        result = self._dispatch(code, file_path, language)
 
-        # Dispatch to appropriate checker
+        last.key = key
+        last.code = code
+        last.result = result
+        return result
+
+    def _dispatch(self, code: str, file_path: str, language: str) -> SyntaxCheckResult:
+        """Run the checker for a language."""
         if language == 'python':
             return self._check_python(code, file_path)
         elif language == 'javascript':
@@ -119,33 +178,104 @@ class SyntaxChecker:
                 language=language
             )
 
+    def _detect_language(self, file_path: str) -> str:
+        """Map a file path to a language name via its extension."""
+        _, ext = os.path.splitext(file_path)
+        return self.LANGUAGE_MAP.get(ext.lower(), 'unknown')
+
+    def check_batch(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+    ) -> List[SyntaxCheckResult]:
+        """
+        Check syntax of several files concurrently.
+
+        Subprocess-backed checks (JS/TS/shell) run on a thread pool since
+        they spend their time waiting on the child process. TypeScript
+        files share a single tsc run. Python checks hold the GIL inside
+        ast.parse(), so they go to a process pool.
+
+        Args:
+            items: List of (code, file_path) pairs
+            max_workers: Worker count (defaults to os.cpu_count())
+
+        Returns:
+            List of SyntaxCheckResult, in the same order as items
+        """
+        if not items:
+            return []
+
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1 or len(items) == 1:
+            return [self.check(code, path) for code, path in items]
+
+        results: List[Optional[SyntaxCheckResult]] = [None] * len(items)
+        languages = [self._detect_language(path) for _, path in items]
+        python_indices = []
+        typescript_indices = []
+        other_indices = []
+        for i, language in enumerate(languages):
+            if language == 'python':
+                python_indices.append(i)
+            elif language == 'typescript' and self._tsc_available:
+                typescript_indices.append(i)
+            else:
+                other_indices.append(i)
+
+        if len(typescript_indices) == 1:
+            other_indices.extend(typescript_indices)
+            typescript_indices = []
+
+        if len(python_indices) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(python_indices))
+                ) as executor:
+                    python_results = executor.map(
+                        _check_python_source,
+                        [items[i][0] for i in python_indices],
+                        [items[i][1] for i in python_indices],
+                    )
+                    for i, result in zip(python_indices, python_results):
+                        results[i] = result
+            except Exception:
+                # Process pools are unavailable in some sandboxes - parse inline
+                for i in python_indices:
+                    results[i] = _check_python_source(*items[i])
+        else:
+            other_indices.extend(python_indices)
+
+        if other_indices or typescript_indices:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(other_indices) + 1)
+            ) as executor:
+                # All TypeScript files share one tsc run
+                typescript_future = None
+                if typescript_indices:
+                    typescript_future = executor.submit(
+                        self._check_typescript_batch,
+                        [items[i] for i in typescript_indices],
+                    )
+
+                other_results = executor.map(
+                    lambda i: self.check(*items[i], language=languages[i]),
+                    other_indices,
+                )
+                for i, result in zip(other_indices, other_results):
+                    results[i] = result
+
+                if typescript_future is not None:
+                    for i, result in zip(
+                        typescript_indices, typescript_future.result()
+                    ):
+                        results[i] = result
+
+        return results
+
     def _check_python(self, code: str, file_path: str) -> SyntaxCheckResult:
         """Check Python syntax using AST."""
-        try:
-            ast.parse(code)
-            return SyntaxCheckResult(valid=True, language='python')
-        except SyntaxError as e:
-            return SyntaxCheckResult(
-                valid=False,
-                errors=[SyntaxErrorInfo(
-                    line=e.lineno or 0,
-                    column=e.offset or 0,
-                    message=e.msg or str(e),
-                    file_path=file_path,
-                )],
-                language='python'
-            )
-        except Exception as e:
-            return SyntaxCheckResult(
-                valid=False,
-                errors=[SyntaxErrorInfo(
-                    line=0,
-                    column=0,
-                    message=str(e),
-                    file_path=file_path,
-                )],
-                language='python'
-            )
+        return _check_python_source(code, file_path)
 
     def _check_javascript(self, code: str, file_path: str) -> SyntaxCheckResult:
         """Check JavaScript syntax using Node.js."""
@@ -207,45 +337,104 @@ class SyntaxChecker:
 
     def _check_typescript(self, code: str, file_path: str) -> SyntaxCheckResult:
         """Check TypeScript syntax."""
-        # For now, just check if it parses as JavaScript
-        # Full TypeScript checking would require tsc
         if not self._tsc_available:
             # Fall back to basic JS check
             return self._check_javascript(code, file_path)
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.ts',
-            delete=False
-        ) as f:
-            f.write(code)
-            temp_path = f.name
+        return self._check_typescript_batch([(code, file_path)])[0]
+
+    def _check_typescript_batch(
+        self,
+        items: List[Tuple[str, str]],
+    ) -> List[SyntaxCheckResult]:
+        """
+        Check several TypeScript files with a single tsc run.
+
+        tsc startup (loading lib.d.ts) dominates per-file cost, so files are
+        checked together and errors are split back out by file. Runs use
+        --incremental with a build-info file kept for the checker's
+        lifetime, so later runs reuse the lib analysis.
+
+        Each file gets a trailing "export {}" so it is compiled as its own
+        module. Otherwise files without imports/exports are global scripts
+        sharing one scope, and unrelated files declaring the same top-level
+        name would report redeclaration errors. The line is appended, so
+        error positions in the code are unchanged.
+        """
+        batch_dir = tempfile.mkdtemp(dir=self._tsc_scratch_dir)
+        temp_paths = []
+        for i, (code, file_path) in enumerate(items):
+            suffix = '.tsx' if file_path.lower().endswith('.tsx') else '.ts'
+            temp_path = os.path.join(batch_dir, f"{i}{suffix}")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(code)
+                f.write('\nexport {};\n')
+            temp_paths.append(temp_path)
 
         try:
-            result = subprocess.run(
-                ['tsc', '--noEmit', '--skipLibCheck', temp_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # The build-info file isn't safe to share between concurrent runs
+            with self._tsc_lock:
+                result = subprocess.run(
+                    [
+                        'tsc', '--noEmit', '--skipLibCheck', '--jsx', 'preserve',
+                        '--incremental', '--tsBuildInfoFile',
+                        os.path.join(self._tsc_scratch_dir, 'oi.tsbuildinfo'),
+                        *temp_paths,
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=30 + 5 * len(items)
+                )
 
             if result.returncode == 0:
-                return SyntaxCheckResult(valid=True, language='typescript')
-            else:
-                return SyntaxCheckResult(
-                    valid=False,
-                    errors=[SyntaxErrorInfo(0, 0, result.stderr.strip()[:500], file_path)],
+                return [
+                    SyntaxCheckResult(valid=True, language='typescript')
+                    for _ in items
+                ]
+
+            # tsc reports "<file>(line,col): error TSxxxx: message" on stdout
+            errors: List[List[SyntaxErrorInfo]] = [[] for _ in items]
+            index_by_name = {
+                os.path.basename(p): i for i, p in enumerate(temp_paths)
+            }
+            for match in _TSC_ERROR_RE.finditer(result.stdout):
+                i = index_by_name.get(os.path.basename(match.group(1)))
+                if i is not None:
+                    errors[i].append(SyntaxErrorInfo(
+                        line=int(match.group(2)),
+                        column=int(match.group(3)),
+                        message=match.group(4),
+                        file_path=items[i][1],
+                    ))
+
+            if not any(errors):
+                # Not attributable to a file (e.g. bad options) - fail them all
+                output = (result.stdout + result.stderr).strip()[:500]
+                errors = [
+                    [SyntaxErrorInfo(0, 0, output, file_path)]
+                    for _, file_path in items
+                ]
+
+            return [
+                SyntaxCheckResult(
+                    valid=not file_errors,
+                    errors=file_errors,
                     language='typescript'
                 )
+                for file_errors in errors
+            ]
 
         except Exception as e:
-            return SyntaxCheckResult(
-                valid=True,
-                warnings=[f"Error running tsc: {e}"],
-                language='typescript'
-            )
+            return [
+                SyntaxCheckResult(
+                    valid=True,
+                    warnings=[f"Error running tsc: {e}"],
+                    language='typescript'
+                )
+                for _ in items
+            ]
         finally:
-            Path(temp_path).unlink(missing_ok=True)
+            shutil.rmtree(batch_dir, ignore_errors=True)
 
     def _check_json(self, code: str, file_path: str) -> SyntaxCheckResult:
         """Check JSON syntax."""
@@ -265,25 +454,36 @@ class SyntaxChecker:
             )
 
     def _check_shell(self, code: str, file_path: str) -> SyntaxCheckResult:
-        """Check shell script syntax using bash -n."""
-        if not shutil.which('bash'):
+        """
+        Check shell script syntax.
+
+        Parses in-process with bashlex when it's installed. bashlex doesn't
+        cover all of bash ([[ ]], case, arithmetic expansion), so it's only
+        trusted when it accepts the script - rejections are confirmed with
+        bash -n.
+        """
+        bashlex_error = None
+        if HAS_BASHLEX and code.strip():
+            try:
+                bashlex.parse(code)
+                return SyntaxCheckResult(valid=True, language='shell')
+            except Exception as e:
+                bashlex_error = e
+
+        if not self._bash_available:
+            if bashlex_error is not None:
+                return self._bashlex_result(code, file_path, bashlex_error)
             return SyntaxCheckResult(
                 valid=True,
                 warnings=["bash not available for shell syntax checking"],
                 language='shell'
             )
 
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.sh',
-            delete=False
-        ) as f:
-            f.write(code)
-            temp_path = f.name
-
         try:
+            # bash -n reads the script from stdin - no temp file needed
             result = subprocess.run(
-                ['bash', '-n', temp_path],
+                ['bash', '-n'],
+                input=code,
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -304,26 +504,85 @@ class SyntaxChecker:
                 warnings=[f"Error running bash: {e}"],
                 language='shell'
             )
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+
+    def _bashlex_result(
+        self,
+        code: str,
+        file_path: str,
+        error: Exception,
+    ) -> SyntaxCheckResult:
+        """
+        Build a result from a bashlex error that bash can't confirm.
+
+        Reported as a warning rather than an error, since bashlex also
+        rejects valid scripts it doesn't support.
+        """
+        position = getattr(error, 'position', None)
+        if position is None:
+            location = ""
+        else:
+            line = code.count('\n', 0, position) + 1
+            column = position - (code.rfind('\n', 0, position) + 1) + 1
+            location = f"{file_path}:{line}:{column}: "
+
+        return SyntaxCheckResult(
+            valid=True,
+            warnings=[f"Possible shell syntax error: {location}{error}"],
+            language='shell'
+        )
 
     def _parse_node_error(self, error_msg: str) -> Tuple[int, int]:
         """Parse line and column from Node.js error message."""
-        import re
-
         # Try to find line:column pattern
-        match = re.search(r':(\d+):(\d+)', error_msg)
+        match = _NODE_LINE_COL_RE.search(error_msg)
         if match:
             return int(match.group(1)), int(match.group(2))
 
         # Try just line number
-        match = re.search(r':(\d+)', error_msg)
+        match = _NODE_LINE_RE.search(error_msg)
         if match:
             return int(match.group(1)), 0
 
         return 0, 0
 
 
+def _check_python_source(code: str, file_path: str) -> SyntaxCheckResult:
+    """
+    Check Python syntax using AST.
+
+    Module-level so it can be pickled into a ProcessPoolExecutor worker.
+    """
+    try:
+        ast.parse(code)
+        return SyntaxCheckResult(valid=True, language='python')
+    except SyntaxError as e:
+        return SyntaxCheckResult(
+            valid=False,
+            errors=[SyntaxErrorInfo(
+                line=e.lineno or 0,
+                column=e.offset or 0,
+                message=e.msg or str(e),
+                file_path=file_path,
+            )],
+            language='python'
+        )
+    except Exception as e:
+        return SyntaxCheckResult(
+            valid=False,
+            errors=[SyntaxErrorInfo(
+                line=0,
+                column=0,
+                message=str(e),
+                file_path=file_path,
+            )],
+            language='python'
+        )
+
+
+# Shared instance for check_syntax(), so tool lookups happen once
+_DEFAULT_CHECKER = SyntaxChecker()
+
+
 # Convenience function
 def check_syntax(code: str, file_path: str) -> SyntaxCheckResult:
     """
@@ -336,5 +595,4 @@ def check_syntax(code: str, file_path: str) -> SyntaxCheckResult:
     Returns:
         SyntaxCheckResult
     """
-    checker = SyntaxChecker()
-    return checker.check(code, file_path)
+    return _DEFAULT_CHECKER.check(code, file_path)
@@ -9,15 +9,151 @@ Finds tests that are likely to be affected by a code change:
 Supports pytest and unittest discovery patterns.
 """
 
+import ast
+import asyncio
+import fnmatch
+import hashlib
+import importlib.util
+import json
+import mmap
 import os
 import re
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Dict, Any
+from typing import FrozenSet, Iterator, List, Optional, Set, Dict, Any, Tuple, Union
 
+from ...terminal_interface.utils.local_storage_path import get_storage_path
+from .rollback import write_file_atomic
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Patterns used on every scanned test file / pytest run
+_TEST_DEF_RE = re.compile(rb'^\s*(?:async\s+)?def\s+test_', re.MULTILINE)
+_SUMMARY_RE = re.compile(r'(\d+)\s+passed.*?(\d+)\s+failed.*?in\s+([\d.]+)s')
+_PASSED_RE = re.compile(r'(\d+)\s+passed')
+_FAILED_RE = re.compile(r'(\d+)\s+failed')
+_SKIPPED_RE = re.compile(r'(\d+)\s+skipped')
+_FAILED_NAME_RE = re.compile(r'FAILED\s+(\S+)')
+_COLLECTED_RE = re.compile(r'^[ \t]*([^=\s][^\n]*::[^\n]*?)[ \t]*$', re.MULTILINE)
+
+# Plugins that only cost startup time for one-off validation runs
+_PYTEST_LEAN_ARGS = ["-p", "no:cacheprovider", "-p", "no:stepwise", "--no-header"]
+
+# Spread runs over more than this many files across workers with pytest-xdist
+_XDIST_MIN_FILES = 4
+
+# Persistent find_related_tests() results, one file per project root
+_CACHE_SUBDIR = 'related_tests'
+
+# How long a scan of the test tree is trusted before re-checking it
+_TREE_FINGERPRINT_TTL = 5.0
+
+# Directories never searched for test files
+_SKIP_DIRS = frozenset({
+    '__pycache__', '.git', 'node_modules', '.venv', 'venv',
+})
+
+
+@lru_cache(maxsize=1024)
+def _import_pattern(module_name: str, file_stem: str) -> "re.Pattern[bytes]":
+    """
+    Build a single regex matching any way a test file can import a module.
+
+    Matches:
+        import module_name
+        from module_name import ...
+        from parent.file_stem import ...
+        import parent.file_stem
+    """
+    module = re.escape(module_name)
+    stem = re.escape(file_stem)
+    return re.compile('|'.join([
+        rf'\bimport\s+{module}\b',
+        rf'\bfrom\s+{module}\s+import\b',
+        rf'\bfrom\s+\S*\.{stem}\s+import\b',
+        rf'\bimport\s+\S*\.{stem}\b',
+    ]).encode())
+
+
+def _extract_imports(source: bytes) -> Optional[FrozenSet[str]]:
+    """
+    Collect the dotted module names imported by a Python source file.
+
+    Relative imports keep their leading dots ("from .mod import x" gives
+    ".mod"), and names imported from a package are included as possible
+    submodules ("from pkg import mod" gives "pkg" and "pkg.mod"). Returns
+    None if the source doesn't parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            modules.add(module)
+            # "from pkg import mod" may import a submodule
+            separator = "" if module.endswith(".") else "."
+            modules.update(
+                module + separator + alias.name
+                for alias in node.names if alias.name != "*"
+            )
+    return frozenset(modules)
+
+
+def _imports_match(imports: FrozenSet[str], module_name: str, file_stem: str) -> bool:
+    """
+    Check whether a set of imported modules refers to the target module.
+
+    Same rules as _import_pattern: the full module name (or a submodule of
+    it), or any dotted path whose non-leading component is the file stem.
+    """
+    if module_name in imports:
+        return True
+
+    prefix = module_name + "."
+    for name in imports:
+        if name.startswith(prefix) or file_stem in name.split(".")[1:]:
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def _xdist_available() -> bool:
+    """Check whether the pytest-xdist plugin is installed."""
+    return importlib.util.find_spec("xdist") is not None
+
+
+@contextmanager
+def _mapped_file(path: Union[str, Path]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Map a file read-only so it can be scanned as bytes without a copy.
+
+    Empty files cannot be mapped, so they yield b"" instead.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+@dataclass(**_SLOTS)
 class TestFile:
     """Information about a test file."""
     path: str
@@ -26,7 +162,7 @@ class TestFile:
     name_matches: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestRunResult:
     """Result of running tests."""
     passed: bool
@@ -39,6 +175,75 @@ class TestRunResult:
     failed_test_names: List[str] = field(default_factory=list)
 
 
+def _no_tests_result() -> TestRunResult:
+    """Result for a run with nothing to test."""
+    return TestRunResult(
+        passed=True,
+        total_tests=0,
+        passed_tests=0,
+        failed_tests=0,
+        skipped_tests=0,
+        duration_seconds=0,
+        output="No tests to run",
+    )
+
+
+def _timed_out_result(timeout_seconds: int) -> TestRunResult:
+    """Result for a pytest run that hit its timeout."""
+    return TestRunResult(
+        passed=False,
+        total_tests=0,
+        passed_tests=0,
+        failed_tests=1,
+        skipped_tests=0,
+        duration_seconds=timeout_seconds,
+        output=f"Test run timed out after {timeout_seconds}s",
+    )
+
+
+def _pytest_missing_result() -> TestRunResult:
+    """Result when pytest isn't installed."""
+    return TestRunResult(
+        passed=True,  # Can't validate without pytest
+        total_tests=0,
+        passed_tests=0,
+        failed_tests=0,
+        skipped_tests=0,
+        duration_seconds=0,
+        output="pytest not available",
+    )
+
+
+def _run_error_result(error: Exception) -> TestRunResult:
+    """Result for a pytest run that couldn't be started or read."""
+    return TestRunResult(
+        passed=False,
+        total_tests=0,
+        passed_tests=0,
+        failed_tests=1,
+        skipped_tests=0,
+        duration_seconds=0,
+        output=f"Error running tests: {error}",
+    )
+
+
+def _merge_run_results(results: List[TestRunResult]) -> TestRunResult:
+    """Combine results from pytest runs over disjoint sets of files."""
+    return TestRunResult(
+        passed=all(r.passed for r in results),
+        total_tests=sum(r.total_tests for r in results),
+        passed_tests=sum(r.passed_tests for r in results),
+        failed_tests=sum(r.failed_tests for r in results),
+        skipped_tests=sum(r.skipped_tests for r in results),
+        # The runs overlap, so wall time is the slowest one
+        duration_seconds=max(r.duration_seconds for r in results),
+        output="\n".join(r.output for r in results),
+        failed_test_names=[
+            name for r in results for name in r.failed_test_names
+        ],
+    )
+
+
 class TestDiscovery:
     """
     Discovers and runs tests related to code changes.
@@ -53,6 +258,7 @@ class TestDiscovery:
         self,
         project_root: Optional[str] = None,
         test_patterns: Optional[List[str]] = None,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize test discovery.
@@ -60,17 +266,40 @@ class TestDiscovery:
         Args:
             project_root: Root directory of the project
             test_patterns: Glob patterns for test files
+            cache_dir: Where related-test results are persisted
+                (default: the user's open-interpreter storage directory)
         """
         self.project_root = project_root or os.getcwd()
+        self.cache_dir = cache_dir
         self.test_patterns = test_patterns or [
             "test_*.py",
             "*_test.py",
             "tests.py",
         ]
+        self._test_file_re = re.compile(
+            '|'.join(fnmatch.translate(p) for p in self.test_patterns)
+        )
 
         # Common test directory names
         self.test_directories = ["tests", "test", "spec", "specs"]
 
+        # test_path -> (st_mtime_ns, st_size, test_count, imported_modules)
+        self._file_cache: Dict[
+            str, Tuple[int, int, int, Optional[FrozenSet[str]]]
+        ] = {}
+
+        # test_path -> imported modules, rebuilt by _build_import_index()
+        self._import_index: Dict[str, FrozenSet[str]] = {}
+
+        # file_path -> {"fingerprint", "max_tests", "tests"}, loaded lazily
+        # from disk; entries are valid while the test tree fingerprint holds.
+        # Guarded by _related_lock, since validators call in from threads;
+        # _save_lock keeps saves in order, so the newest snapshot lands last
+        self._related_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._related_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._tree_fingerprint: Optional[Tuple[float, str, List[str]]] = None
+
     def find_related_tests(
         self,
         file_path: str,
@@ -86,39 +315,133 @@ class TestDiscovery:
         Returns:
             List of TestFile objects
         """
+        # Which tests relate to a file depends only on the test files, so
+        # reuse the last answer until one of them is added, changed or removed
+        fingerprint, test_files = self._test_tree_state()
+        with self._related_lock:
+            entry = self._load_related_cache().get(file_path)
+        if (
+            entry
+            and entry["fingerprint"] == fingerprint
+            and entry["max_tests"] == max_tests
+        ):
+            return [TestFile(*fields) for fields in entry["tests"]]
+
         related_tests = []
 
         # Get module name from file path
         module_name = self._file_to_module(file_path)
         file_stem = Path(file_path).stem
 
-        # Find all test files
-        test_files = self._find_all_test_files()
+        # Parse the test files' imports once
+        self._build_import_index(test_files)
 
         for test_path in test_files:
-            test_file = TestFile(path=test_path)
+            # Cheap name check first - no file access needed
+            name_matches = file_stem in Path(test_path).stem
 
             # Check if test imports the target file
-            if self._test_imports_module(test_path, module_name, file_path):
-                test_file.imports_target = True
-
-            # Check if test name matches
-            if file_stem in Path(test_path).stem:
-                test_file.name_matches = True
-
-            # Count tests in file
-            test_file.test_count = self._count_tests_in_file(test_path)
-
-            # Add if related
-            if test_file.imports_target or test_file.name_matches:
-                related_tests.append(test_file)
+            imports = self._import_index.get(test_path)
+            if imports is not None:
+                imports_target = _imports_match(imports, module_name, file_stem)
+            else:
+                imports_target = self._test_imports_module(
+                    test_path, module_name, file_path
+                )
+
+            if not (imports_target or name_matches):
+                continue
+
+            # Only related files need their tests counted
+            related_tests.append(TestFile(
+                path=test_path,
+                test_count=self._count_tests_in_file(test_path),
+                imports_target=imports_target,
+                name_matches=name_matches,
+            ))
 
         # Sort by relevance (imports > name match, then by test count)
         related_tests.sort(
             key=lambda t: (not t.imports_target, not t.name_matches, -t.test_count)
         )
+        related_tests = related_tests[:max_tests]
+
+        entry = {
+            "fingerprint": fingerprint,
+            "max_tests": max_tests,
+            "tests": [
+                [t.path, t.test_count, t.imports_target, t.name_matches]
+                for t in related_tests
+            ],
+        }
+        with self._related_lock:
+            self._load_related_cache()[file_path] = entry
+        self._save_related_cache()
+
+        return related_tests
 
-        return related_tests[:max_tests]
+    def _test_tree_state(self) -> Tuple[str, List[str]]:
+        """
+        Get (fingerprint, test_files) for the project's test files.
+
+        The fingerprint covers every test file's path, mtime and size. A
+        scan is reused for _TREE_FINGERPRINT_TTL seconds.
+        """
+        now = time.monotonic()
+        if (
+            self._tree_fingerprint is not None
+            and now - self._tree_fingerprint[0] < _TREE_FINGERPRINT_TTL
+        ):
+            return self._tree_fingerprint[1], self._tree_fingerprint[2]
+
+        test_files = self._find_all_test_files()
+        digest = hashlib.blake2b(digest_size=16)
+        for test_path in sorted(test_files):
+            try:
+                st = os.stat(os.path.join(self.project_root, test_path))
+            except OSError:
+                continue
+            digest.update(f"{test_path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+
+        self._tree_fingerprint = (now, digest.hexdigest(), test_files)
+        return self._tree_fingerprint[1], test_files
+
+    def _related_cache_path(self) -> Path:
+        """
+        Location of the persisted related-tests cache.
+
+        Kept outside the project, named by a hash of its resolved root,
+        so discovery never adds files to the user's tree.
+        """
+        cache_dir = self.cache_dir or get_storage_path(_CACHE_SUBDIR)
+        root = os.path.realpath(self.project_root)
+        name = hashlib.sha256(root.encode()).hexdigest()[:32]
+        return Path(cache_dir) / f"{name}.json"
+
+    def _load_related_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the persisted related-tests cache on first use (lock held)."""
+        if self._related_cache is None:
+            try:
+                with open(self._related_cache_path(), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._related_cache = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._related_cache = {}
+        return self._related_cache
+
+    def _save_related_cache(self) -> None:
+        """Persist a snapshot of the related-tests cache (best effort)."""
+        with self._save_lock:
+            with self._related_lock:
+                # Entries are never mutated once stored, so a shallow copy
+                # is a consistent snapshot to serialize outside the lock
+                snapshot = dict(self._load_related_cache())
+            try:
+                path = self._related_cache_path()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_file_atomic(path, json.dumps(snapshot))
+            except (OSError, TypeError, ValueError, RuntimeError):
+                pass  # Keep the in-memory cache only
 
     def find_same_directory_tests(self, file_path: str) -> List[TestFile]:
         """Find tests in the same directory as the file."""
@@ -155,82 +478,190 @@ class TestDiscovery:
             TestRunResult with test outcomes
         """
         if not test_files:
-            return TestRunResult(
-                passed=True,
-                total_tests=0,
-                passed_tests=0,
-                failed_tests=0,
-                skipped_tests=0,
-                duration_seconds=0,
-                output="No tests to run",
-            )
+            return _no_tests_result()
 
-        # Build pytest command
-        test_paths = [t.path for t in test_files]
-        cmd = ["pytest", "-x", "--tb=short"]  # Stop on first failure
+        chunks = self._split_test_paths([t.path for t in test_files])
+        if len(chunks) == 1:
+            return self._run_pytest(chunks[0], timeout_seconds, verbose)
 
-        if verbose:
-            cmd.append("-v")
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(
+                lambda chunk: self._run_pytest(chunk, timeout_seconds, verbose),
+                chunks,
+            ))
+        return _merge_run_results(results)
 
-        cmd.extend(test_paths)
+    async def run_tests_async(
+        self,
+        test_files: List[TestFile],
+        timeout_seconds: int = 300,
+        verbose: bool = False,
+    ) -> TestRunResult:
+        """
+        Run the specified tests using pytest, without blocking the event loop.
 
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=timeout_seconds,
-            )
+        Same as run_tests(), but pytest runs as an asyncio subprocess.
 
-            # Parse output
-            output = result.stdout + result.stderr
-            parsed = self._parse_pytest_output(output)
+        Args:
+            test_files: List of test files to run
+            timeout_seconds: Maximum time for test run
+            verbose: Show verbose output
 
-            return TestRunResult(
-                passed=result.returncode == 0,
-                total_tests=parsed.get("total", 0),
-                passed_tests=parsed.get("passed", 0),
-                failed_tests=parsed.get("failed", 0),
-                skipped_tests=parsed.get("skipped", 0),
-                duration_seconds=parsed.get("duration", 0),
-                output=output,
-                failed_test_names=parsed.get("failed_names", []),
-            )
+        Returns:
+            TestRunResult with test outcomes
+        """
+        if not test_files:
+            return _no_tests_result()
+
+        chunks = self._split_test_paths([t.path for t in test_files])
+        results = await asyncio.gather(*(
+            self._run_pytest_async(chunk, timeout_seconds, verbose)
+            for chunk in chunks
+        ))
+        return results[0] if len(results) == 1 else _merge_run_results(results)
+
+    def _split_test_paths(self, test_paths: List[str]) -> List[List[str]]:
+        """
+        Group test files into one list per pytest process to run.
+
+        Without pytest-xdist, larger runs are dealt round-robin into one
+        chunk per CPU so the chunks can run side by side.
+        """
+        if len(test_paths) <= _XDIST_MIN_FILES or _xdist_available():
+            return [test_paths]
+
+        workers = min(len(test_paths), os.cpu_count() or 1)
+        if workers < 2:
+            return [test_paths]
+
+        return [test_paths[i::workers] for i in range(workers)]
+
+    def _run_pytest(
+        self,
+        test_paths: List[str],
+        timeout_seconds: int,
+        verbose: bool,
+    ) -> TestRunResult:
+        """Run pytest once over test_paths and collect the outcome."""
+        junit_fd, junit_path = tempfile.mkstemp(prefix="oi_junit_", suffix=".xml")
+        os.close(junit_fd)
+        cmd = self._pytest_command(test_paths, junit_path, verbose)
+
+        try:
+            # Spool output to disk rather than pipes so verbose runs never
+            # block on a full pipe buffer while we wait for them. stderr is
+            # merged in, so the output is read back in one piece.
+            with tempfile.TemporaryFile() as output_f:
+                result = subprocess.run(
+                    cmd,
+                    cwd=self.project_root,
+                    stdout=output_f,
+                    stderr=subprocess.STDOUT,
+                    timeout=timeout_seconds,
+                )
+                output_f.seek(0)
+                output = output_f.read().decode('utf-8', errors='replace')
+
+            return self._collect_run_result(result.returncode, output, junit_path)
 
         except subprocess.TimeoutExpired:
-            return TestRunResult(
-                passed=False,
-                total_tests=0,
-                passed_tests=0,
-                failed_tests=1,
-                skipped_tests=0,
-                duration_seconds=timeout_seconds,
-                output=f"Test run timed out after {timeout_seconds}s",
-            )
+            return _timed_out_result(timeout_seconds)
 
         except FileNotFoundError:
-            # pytest not installed
-            return TestRunResult(
-                passed=True,  # Can't validate without pytest
-                total_tests=0,
-                passed_tests=0,
-                failed_tests=0,
-                skipped_tests=0,
-                duration_seconds=0,
-                output="pytest not available",
-            )
+            return _pytest_missing_result()
 
         except Exception as e:
-            return TestRunResult(
-                passed=False,
-                total_tests=0,
-                passed_tests=0,
-                failed_tests=1,
-                skipped_tests=0,
-                duration_seconds=0,
-                output=f"Error running tests: {e}",
+            return _run_error_result(e)
+
+        finally:
+            Path(junit_path).unlink(missing_ok=True)
+
+    async def _run_pytest_async(
+        self,
+        test_paths: List[str],
+        timeout_seconds: int,
+        verbose: bool,
+    ) -> TestRunResult:
+        """Async version of _run_pytest() using an asyncio subprocess."""
+        junit_fd, junit_path = tempfile.mkstemp(prefix="oi_junit_", suffix=".xml")
+        os.close(junit_fd)
+        cmd = self._pytest_command(test_paths, junit_path, verbose)
+
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.project_root,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
             )
+            stdout, _ = await asyncio.wait_for(
+                proc.communicate(), timeout=timeout_seconds
+            )
+            output = stdout.decode('utf-8', errors='replace')
+
+            return self._collect_run_result(proc.returncode, output, junit_path)
+
+        except asyncio.TimeoutError:
+            return _timed_out_result(timeout_seconds)
+
+        except FileNotFoundError:
+            return _pytest_missing_result()
+
+        except Exception as e:
+            return _run_error_result(e)
+
+        finally:
+            if proc is not None and proc.returncode is None:
+                # Timed out or cancelled - don't leave pytest running
+                proc.kill()
+                await proc.wait()
+            Path(junit_path).unlink(missing_ok=True)
+
+    def _pytest_command(
+        self,
+        test_paths: List[str],
+        junit_path: str,
+        verbose: bool,
+    ) -> List[str]:
+        """Build the pytest argv for a run writing its report to junit_path."""
+        cmd = [
+            "pytest", "-x", "--tb=short",  # Stop on first failure
+            f"--junitxml={junit_path}",
+            *_PYTEST_LEAN_ARGS,
+        ]
+
+        if verbose:
+            cmd.append("-v")
+
+        if len(test_paths) > _XDIST_MIN_FILES and _xdist_available():
+            cmd.extend(["-n", "auto", "--dist=loadfile"])
+
+        cmd.extend(test_paths)
+        return cmd
+
+    def _collect_run_result(
+        self,
+        returncode: int,
+        output: str,
+        junit_path: str,
+    ) -> TestRunResult:
+        """Build the TestRunResult for a finished pytest run."""
+        # Parse structured report, falling back to scraping the output
+        parsed = self._parse_junit_xml(junit_path)
+        if parsed is None:
+            parsed = self._parse_pytest_output(output)
+
+        return TestRunResult(
+            passed=returncode == 0,
+            total_tests=parsed.get("total", 0),
+            passed_tests=parsed.get("passed", 0),
+            failed_tests=parsed.get("failed", 0),
+            skipped_tests=parsed.get("skipped", 0),
+            duration_seconds=parsed.get("duration", 0),
+            output=output,
+            failed_test_names=parsed.get("failed_names", []),
+        )
 
     def collect_tests(self, test_file: str) -> List[str]:
         """
@@ -244,7 +675,7 @@ class TestDiscovery:
         """
         try:
             result = subprocess.run(
-                ["pytest", "--collect-only", "-q", test_file],
+                ["pytest", "--collect-only", "-q", *_PYTEST_LEAN_ARGS, test_file],
                 cwd=self.project_root,
                 capture_output=True,
                 text=True,
@@ -254,13 +685,7 @@ class TestDiscovery:
             if result.returncode != 0:
                 return []
 
-            tests = []
-            for line in result.stdout.split("\n"):
-                line = line.strip()
-                if "::" in line and not line.startswith("="):
-                    tests.append(line)
-
-            return tests
+            return _COLLECTED_RE.findall(result.stdout)
 
         except Exception:
             return []
@@ -268,22 +693,26 @@ class TestDiscovery:
     def _find_all_test_files(self) -> List[str]:
         """Find all test files in the project."""
         test_files = []
-
-        for root, dirs, files in os.walk(self.project_root):
-            # Skip common non-test directories
-            dirs[:] = [d for d in dirs if d not in {
-                '__pycache__', '.git', 'node_modules', '.venv', 'venv'
-            }]
-
-            for pattern in self.test_patterns:
-                for file in files:
-                    import fnmatch
-                    if fnmatch.fnmatch(file, pattern):
-                        rel_path = os.path.relpath(
-                            os.path.join(root, file),
-                            self.project_root
+        match = self._test_file_re.match
+        stack = [self.project_root]
+
+        while stack:
+            root = stack.pop()
+            try:
+                entries = os.scandir(root)
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip common non-test directories
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif match(entry.name) and entry.is_file():
+                        test_files.append(
+                            os.path.relpath(entry.path, self.project_root)
                         )
-                        test_files.append(rel_path)
 
         return test_files
 
@@ -293,6 +722,56 @@ class TestDiscovery:
         module = Path(file_path).with_suffix("").as_posix()
         return module.replace("/", ".")
 
+    def _build_import_index(self, test_files: List[str]) -> Dict[str, FrozenSet[str]]:
+        """
+        Map each test file to the modules it imports.
+
+        Uses the per-file scan cache, so only new or changed files are
+        parsed. Files that don't parse are left out of the index.
+        """
+        index = {}
+        for test_path in test_files:
+            try:
+                _, imports = self._scan_test_file(test_path)
+            except OSError:
+                continue
+            if imports is not None:
+                index[test_path] = imports
+
+        self._import_index = index
+        return index
+
+    def _scan_test_file(self, test_path: str) -> Tuple[int, Optional[FrozenSet[str]]]:
+        """
+        Get (test_count, imported_modules) for a test file.
+
+        Results are cached on the file's (st_mtime_ns, st_size), so repeated
+        calls cost a single stat until the file changes. imported_modules is
+        None when the file doesn't parse as Python.
+        """
+        full_path = Path(self.project_root) / test_path
+        st = os.stat(full_path)
+
+        cached = self._file_cache.get(test_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+
+        # ast.parse() copies any non-bytes buffer, so mapping the file
+        # would only add a copy; read it once into bytes instead
+        with open(full_path, 'rb') as f:
+            content = f.read()
+
+        # Count test functions and methods
+        # def test_*
+        # async def test_*
+        test_count = len(_TEST_DEF_RE.findall(content))
+        imports = _extract_imports(content)
+
+        self._file_cache[test_path] = (
+            st.st_mtime_ns, st.st_size, test_count, imports
+        )
+        return test_count, imports
+
     def _test_imports_module(
         self,
         test_path: str,
@@ -300,50 +779,86 @@ class TestDiscovery:
         file_path: str
     ) -> bool:
         """Check if a test file imports the target module."""
-        full_path = Path(self.project_root) / test_path
+        file_stem = Path(file_path).stem
 
         try:
-            with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Check for import statements
-            # import module_name
-            # from module_name import ...
-            # from parent.module_name import ...
-
-            file_stem = Path(file_path).stem
-            patterns = [
-                rf'\bimport\s+{re.escape(module_name)}\b',
-                rf'\bfrom\s+{re.escape(module_name)}\s+import\b',
-                rf'\bfrom\s+\S*\.{re.escape(file_stem)}\s+import\b',
-                rf'\bimport\s+\S*\.{re.escape(file_stem)}\b',
-            ]
-
-            for pattern in patterns:
-                if re.search(pattern, content):
-                    return True
+            _, imports = self._scan_test_file(test_path)
+            if imports is not None:
+                return _imports_match(imports, module_name, file_stem)
 
-            return False
+            # Unparseable file - fall back to scanning the raw text
+            with _mapped_file(Path(self.project_root) / test_path) as content:
+                # Every import pattern contains the file stem (the module
+                # name ends with it), so a plain substring scan rejects most
+                # files before the regex runs.
+                if content.find(file_stem.encode()) == -1:
+                    return False
+
+                pattern = _import_pattern(module_name, file_stem)
+                return pattern.search(content) is not None
 
         except Exception:
             return False
 
     def _count_tests_in_file(self, test_path: str) -> int:
         """Count the number of tests in a file."""
-        full_path = Path(self.project_root) / test_path
+        try:
+            return self._scan_test_file(test_path)[0]
+        except Exception:
+            return 0
+
+    def _parse_junit_xml(self, junit_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a pytest --junitxml report.
 
+        Returns None if the report is missing or unreadable, so the caller
+        can fall back to parsing the text output.
+        """
         try:
-            with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            if not os.path.getsize(junit_path):
+                return None
+        except OSError:
+            return None
 
-            # Count test functions and methods
-            # def test_*
-            # async def test_*
-            count = len(re.findall(r'^\s*(async\s+)?def\s+test_', content, re.MULTILINE))
-            return count
+        result = {
+            "total": 0,
+            "passed": 0,
+            "failed": 0,
+            "skipped": 0,
+            "duration": 0,
+            "failed_names": [],
+        }
 
-        except Exception:
-            return 0
+        try:
+            for _, elem in ET.iterparse(junit_path, events=("end",)):
+                if elem.tag != "testcase":
+                    continue
+
+                result["total"] += 1
+                result["duration"] += float(elem.get("time") or 0)
+
+                outcome = "passed"
+                for child in elem:
+                    if child.tag in ("failure", "error"):
+                        outcome = "failed"
+                        break
+                    if child.tag == "skipped":
+                        outcome = "skipped"
+
+                result[outcome] += 1
+                if outcome == "failed":
+                    classname = elem.get("classname", "")
+                    name = elem.get("name", "")
+                    result["failed_names"].append(
+                        f"{classname}::{name}" if classname else name
+                    )
+
+                elem.clear()
+
+        except (ET.ParseError, OSError, ValueError):
+            return None
+
+        return result
 
     def _parse_pytest_output(self, output: str) -> Dict[str, Any]:
         """Parse pytest output to extract test counts."""
@@ -357,10 +872,7 @@ class TestDiscovery:
         }
 
         # Look for summary line like: "5 passed, 2 failed in 1.23s"
-        summary_match = re.search(
-            r'(\d+)\s+passed.*?(\d+)\s+failed.*?in\s+([\d.]+)s',
-            output
-        )
+        summary_match = _SUMMARY_RE.search(output)
         if summary_match:
             result["passed"] = int(summary_match.group(1))
             result["failed"] = int(summary_match.group(2))
@@ -368,22 +880,22 @@ class TestDiscovery:
             result["total"] = result["passed"] + result["failed"]
 
         # Simpler patterns
-        passed_match = re.search(r'(\d+)\s+passed', output)
+        passed_match = _PASSED_RE.search(output)
         if passed_match:
             result["passed"] = int(passed_match.group(1))
 
-        failed_match = re.search(r'(\d+)\s+failed', output)
+        failed_match = _FAILED_RE.search(output)
         if failed_match:
             result["failed"] = int(failed_match.group(1))
 
-        skipped_match = re.search(r'(\d+)\s+skipped', output)
+        skipped_match = _SKIPPED_RE.search(output)
         if skipped_match:
             result["skipped"] = int(skipped_match.group(1))
 
         result["total"] = result["passed"] + result["failed"] + result["skipped"]
 
         # Extract failed test names
-        failed_names = re.findall(r'FAILED\s+(\S+)', output)
+        failed_names = _FAILED_NAME_RE.findall(output)
         result["failed_names"] = failed_names
 
         return result
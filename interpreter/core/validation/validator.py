@@ -10,17 +10,52 @@ Validates code edits using:
 No Docker required - uses temp files and subprocess isolation.
 """
 
+import ast
+import asyncio
+import atexit
+import hashlib
+import mmap
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, ClassVar, Iterator, List, Optional, Dict, Any, Tuple
 
 from .syntax_checker import SyntaxChecker, SyntaxCheckResult
 from .test_discovery import TestDiscovery, TestRunResult
-from .rollback import EditRollback
+from .rollback import EditRollback, write_file_atomic
+
+try:
+    import fcntl
+    # ioctl number for FICLONE (copy-on-write clone on btrfs/xfs/etc.)
+    _FICLONE: Optional[int] = 0x40049409
+except ImportError:
+    _FICLONE = None
+
+# mypy output flags shared by one-off runs and the daemon
+_MYPY_FLAGS = ['--no-error-summary', '--no-color-output']
+
+# dmypy rejects follow-imports=silent; errors in imported modules are
+# filtered out of its output instead
+_DMYPY_FLAGS = ['--follow-imports=normal', *_MYPY_FLAGS]
+
+# Entries kept per result cache (keyed on file path + content digest)
+_RESULT_CACHE_SIZE = 256
+
+# Stop reading mypy output after this many errors
+_MAX_TYPE_ERRORS = 20
+
+# Sources at least this large are syntax checked by changed region only
+_REGION_PARSE_MIN_SIZE = 4096
+
+# Seconds a type check waits for the background warm-up before going ahead
+_WARMUP_WAIT = 10
 
 
 @dataclass
@@ -37,35 +72,37 @@ class ValidationResult:
 
     def to_context_string(self) -> str:
         """Convert to string for LLM context."""
-        parts = [f"## Validation Result: {'PASSED' if self.valid else 'FAILED'}"]
+        return "\n".join(self._iter_context_lines())
+
+    def _iter_context_lines(self) -> Iterator[str]:
+        """Yield the lines of to_context_string() in order."""
+        yield f"## Validation Result: {'PASSED' if self.valid else 'FAILED'}"
 
         if self.syntax_result:
-            parts.append(f"\n### Syntax: {'OK' if self.syntax_result.valid else 'FAILED'}")
+            yield f"\n### Syntax: {'OK' if self.syntax_result.valid else 'FAILED'}"
             if not self.syntax_result.valid:
                 for error in self.syntax_result.errors:
-                    parts.append(f"- {error}")
+                    yield f"- {error}"
 
         if self.type_check_result:
             type_ok = self.type_check_result.get("passed", False)
-            parts.append(f"\n### Type Check: {'OK' if type_ok else 'FAILED'}")
+            yield f"\n### Type Check: {'OK' if type_ok else 'FAILED'}"
             if not type_ok:
                 for error in self.type_check_result.get("errors", [])[:5]:
-                    parts.append(f"- {error}")
+                    yield f"- {error}"
 
         if self.test_result:
-            parts.append(f"\n### Tests: {'PASSED' if self.test_result.passed else 'FAILED'}")
-            parts.append(f"- {self.test_result.passed_tests}/{self.test_result.total_tests} passed")
+            yield f"\n### Tests: {'PASSED' if self.test_result.passed else 'FAILED'}"
+            yield f"- {self.test_result.passed_tests}/{self.test_result.total_tests} passed"
             if self.test_result.failed_test_names:
-                parts.append("- Failed tests:")
+                yield "- Failed tests:"
                 for name in self.test_result.failed_test_names[:5]:
-                    parts.append(f"  - {name}")
+                    yield f"  - {name}"
 
         if self.errors:
-            parts.append("\n### Errors")
+            yield "\n### Errors"
             for error in self.errors:
-                parts.append(f"- {error}")
-
-        return "\n".join(parts)
+                yield f"- {error}"
 
 
 class EditValidator:
@@ -85,12 +122,18 @@ class EditValidator:
             print(result.to_context_string())
     """
 
+    # project_root -> whether a dmypy daemon is usable there. Shared across
+    # instances so each project starts at most one daemon per process.
+    _dmypy_daemons: ClassVar[Dict[str, bool]] = {}
+    _dmypy_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         project_root: Optional[str] = None,
         run_tests: bool = True,
         run_type_check: bool = True,
         test_timeout: int = 300,
+        warm_type_check: bool = False,
     ):
         """
         Initialize the validator.
@@ -100,29 +143,120 @@ class EditValidator:
             run_tests: Run related tests as part of validation
             run_type_check: Run type checking (if mypy available)
             test_timeout: Timeout for test runs in seconds
+            warm_type_check: Type check the whole project in the background
+                so the first edit finds a warm mypy cache. Only worth it for
+                a long-lived validator; type checks wait up to _WARMUP_WAIT
+                seconds for it.
         """
         self.project_root = project_root or os.getcwd()
         self.run_tests = run_tests
         self.run_type_check = run_type_check
         self.test_timeout = test_timeout
+        self.warm_type_check = warm_type_check
 
         # Initialize components
         self.syntax_checker = SyntaxChecker()
         self.test_discovery = TestDiscovery(project_root=self.project_root)
         self.rollback = EditRollback(project_root=self.project_root)
 
-        # Check for type checker
-        self._mypy_available = shutil.which('mypy') is not None
+        # Check for type checker (the daemon keeps the type graph in memory
+        # between edits, so prefer it over a cold mypy run per edit)
+        self._dmypy_available = shutil.which('dmypy') is not None
+        self._mypy_available = (
+            self._dmypy_available or shutil.which('mypy') is not None
+        )
+
+        # (file_path, content digest) -> result, for content validated before
+        self._syntax_cache: "OrderedDict[Tuple[str, str], SyntaxCheckResult]" = OrderedDict()
+        self._type_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # (file_path, content digest) -> top-level statement line spans
+        self._span_cache: "OrderedDict[Tuple[str, str], List[Tuple[int, int]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # (file_path, content, result) waiting for flush_type_checks()
+        self._deferred_type_checks: List[Tuple[str, str, ValidationResult]] = []
+
+        # Reusable temp files for type checking (see _write_temp_source)
+        self._temp_dir: Optional[str] = None
+        self._free_temp_paths: List[str] = []
+        self._temp_mtimes: Dict[str, int] = {}
+        self._temp_lock = threading.Lock()
+
+        self._warm_thread: Optional[threading.Thread] = None
+        if warm_type_check and run_type_check and self._mypy_available:
+            self._warm_thread = threading.Thread(
+                target=self._warm_type_checker, daemon=True
+            )
+            self._warm_thread.start()
 
     def validate_edit(
         self,
         file_path: str,
         original_content: str,
         new_content: str,
+        defer_type_check: bool = False,
     ) -> ValidationResult:
         """
         Validate a proposed edit.
 
+        Args:
+            file_path: Path to the file being edited
+            original_content: Original file content
+            new_content: Proposed new content
+            defer_type_check: Leave the type check for flush_type_checks(),
+                which checks all deferred edits in one mypy run
+
+        Returns:
+            ValidationResult with all validation details
+        """
+        result = self._check_syntax(file_path, new_content, original_content)
+        if not result.valid:
+            return result  # Don't proceed with broken syntax
+
+        # Steps 2 and 3 are independent subprocess runs (mypy on a temp
+        # file, pytest on the project), so run them side by side
+        type_check = self.run_type_check and self._mypy_available
+        if type_check and defer_type_check:
+            with self._cache_lock:
+                self._deferred_type_checks.append((file_path, new_content, result))
+            type_check = False
+
+        if type_check and self.run_tests:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                type_future = executor.submit(
+                    self._type_check, file_path, new_content
+                )
+                test_future = executor.submit(
+                    self._validate_with_tests,
+                    file_path, original_content, new_content,
+                )
+                type_result = type_future.result()
+                test_result = test_future.result()
+        else:
+            type_result = (
+                self._type_check(file_path, new_content) if type_check else None
+            )
+            test_result = (
+                self._validate_with_tests(file_path, original_content, new_content)
+                if self.run_tests else None
+            )
+
+        self._apply_check_results(result, type_result, test_result)
+        return result
+
+    async def validate_edit_async(
+        self,
+        file_path: str,
+        original_content: str,
+        new_content: str,
+    ) -> ValidationResult:
+        """
+        Validate a proposed edit without blocking the event loop.
+
+        Same steps as validate_edit(); mypy and pytest run as asyncio
+        subprocesses and are awaited together, so no worker threads are
+        held while they run.
+
         Args:
             file_path: Path to the file being edited
             original_content: Original file content
@@ -131,41 +265,315 @@ class EditValidator:
         Returns:
             ValidationResult with all validation details
         """
+        result = self._check_syntax(file_path, new_content, original_content)
+        if not result.valid:
+            return result  # Don't proceed with broken syntax
+
+        async def skipped():
+            return None
+
+        type_check = self.run_type_check and self._mypy_available
+        type_result, test_result = await asyncio.gather(
+            self._type_check_async(file_path, new_content)
+            if type_check else skipped(),
+            self._validate_with_tests_async(file_path, original_content, new_content)
+            if self.run_tests else skipped(),
+        )
+
+        self._apply_check_results(result, type_result, test_result)
+        return result
+
+    def validate_edits_batch(
+        self,
+        edits: List[Tuple[str, str, str]],
+        max_workers: Optional[int] = None,
+    ) -> List[ValidationResult]:
+        """
+        Validate several proposed edits at once.
+
+        Type checks for all edits run concurrently (one mypy process each)
+        and finish before any tests start. Related tests then run one edit
+        at a time, since each test run writes its edit into the project,
+        where mypy would otherwise see it through imports.
+
+        Args:
+            edits: List of (file_path, original_content, new_content)
+            max_workers: Maximum concurrent type checks (default: CPU count)
+
+        Returns:
+            List of ValidationResult in the same order as edits
+        """
+        results = [
+            self._check_syntax(file_path, new_content, original_content)
+            for file_path, original_content, new_content in edits
+        ]
+        pending = [i for i, result in enumerate(results) if result.valid]
+        if not pending:
+            return results
+
+        type_results: Dict[int, Any] = {}
+        if self.run_type_check and self._mypy_available:
+            with ThreadPoolExecutor(
+                max_workers=min(len(pending), max_workers or os.cpu_count() or 1)
+            ) as executor:
+                type_futures = {
+                    i: executor.submit(self._type_check, edits[i][0], edits[i][2])
+                    for i in pending
+                }
+                type_results = {i: f.result() for i, f in type_futures.items()}
+
+        for i in pending:
+            test_result = (
+                self._validate_with_tests(*edits[i]) if self.run_tests else None
+            )
+            self._apply_check_results(results[i], type_results.get(i), test_result)
+
+        return results
+
+    def flush_type_checks(self) -> List[ValidationResult]:
+        """
+        Type check every edit deferred with validate_edit(defer_type_check=True).
+
+        Uncached files are checked together in one mypy run, so startup is
+        paid once. Each result gets its type check outcome filled in.
+
+        Returns:
+            The updated results, in the order their edits were deferred
+        """
+        with self._cache_lock:
+            pending, self._deferred_type_checks = self._deferred_type_checks, []
+
+        unchecked = []
+        for file_path, content, result in pending:
+            type_result = self._cache_get(
+                self._type_cache, _content_key(file_path, content)
+            )
+            if type_result is None:
+                unchecked.append((file_path, content, result))
+            else:
+                self._apply_check_results(result, type_result, None)
+
+        # One-off checks go through the usual path (daemon or single file)
+        if len(unchecked) < 2 or shutil.which('mypy') is None:
+            for file_path, content, result in unchecked:
+                type_result = self._type_check(file_path, content)
+                self._apply_check_results(result, type_result, None)
+            return [result for _, _, result in pending]
+
+        type_results = self._run_type_check_batch(
+            [(file_path, content) for file_path, content, _ in unchecked]
+        )
+        for (file_path, content, result), type_result in zip(unchecked, type_results):
+            if "warning" not in type_result:
+                self._cache_put(
+                    self._type_cache, _content_key(file_path, content), type_result
+                )
+            self._apply_check_results(result, type_result, None)
+
+        return [result for _, _, result in pending]
+
+    def _run_type_check_batch(
+        self,
+        files: List[Tuple[str, str]],
+    ) -> List[Dict[str, Any]]:
+        """Run one mypy process over several (file_path, content) pairs."""
+        self._wait_for_warmup()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        temp_paths: Dict[str, int] = {}
+        try:
+            for i, (file_path, content) in enumerate(files):
+                if file_path.endswith('.py'):
+                    temp_paths[self._write_temp_source(content)] = i
+                else:
+                    results[i] = {"passed": True, "skipped": True}
+
+            errors: Dict[int, List[str]] = {i: [] for i in temp_paths.values()}
+            if temp_paths:
+                output = subprocess.run(
+                    ['mypy', *_MYPY_FLAGS, *temp_paths],
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                ).stdout
+
+                # Lines start with the file they are about - route each
+                # error back to its edit
+                for line in output.splitlines():
+                    if 'error:' not in line:
+                        continue
+                    for temp_path, i in temp_paths.items():
+                        if line.startswith(temp_path + ':'):
+                            if len(errors[i]) < _MAX_TYPE_ERRORS:
+                                errors[i].append(
+                                    line.replace(temp_path, files[i][0])
+                                )
+                            break
+
+            for i, file_errors in errors.items():
+                results[i] = {"passed": not file_errors, "errors": file_errors}
+
+        except subprocess.TimeoutExpired:
+            return [{"passed": True, "warning": "Type check timed out"} for _ in files]
+
+        except Exception as e:
+            return [{"passed": True, "warning": str(e)} for _ in files]
+
+        finally:
+            for temp_path in temp_paths:
+                self._release_temp_source(temp_path)
+
+        return results
+
+    def _check_syntax(
+        self,
+        file_path: str,
+        new_content: str,
+        original_content: str = "",
+    ) -> ValidationResult:
+        """Step 1: syntax check, which gates the rest of validation."""
         result = ValidationResult(valid=True)
 
-        # Step 1: Syntax check
-        syntax_result = self.syntax_checker.check(new_content, file_path)
+        key = _content_key(file_path, new_content)
+        syntax_result = self._cache_get(self._syntax_cache, key)
+        if syntax_result is None:
+            if self._changed_region_parses(file_path, original_content, new_content):
+                syntax_result = SyntaxCheckResult(valid=True, language='python')
+            else:
+                syntax_result = self.syntax_checker.check(new_content, file_path)
+            self._cache_put(self._syntax_cache, key, syntax_result)
         result.syntax_result = syntax_result
 
         if not syntax_result.valid:
             result.valid = False
             result.errors.extend([str(e) for e in syntax_result.errors])
-            return result  # Don't proceed with broken syntax
+            return result
 
         result.warnings.extend(syntax_result.warnings)
+        return result
 
-        # Step 2: Type check (if enabled and available)
-        if self.run_type_check and self._mypy_available:
-            type_result = self._run_type_check(file_path, new_content)
+    def _changed_region_parses(
+        self,
+        file_path: str,
+        original_content: str,
+        new_content: str,
+    ) -> bool:
+        """
+        Syntax check a large Python edit by parsing only what changed.
+
+        Lines shared with the start and end of the original are skipped,
+        and the changed lines are widened to whole top-level statements of
+        the original. Those statements parse independently of their
+        neighbours, so if the replacement parses on its own the whole file
+        does. Returns False when that can't be shown - the caller then
+        parses the full file, which also gives accurate error positions.
+        """
+        if (
+            len(new_content) < _REGION_PARSE_MIN_SIZE
+            or not original_content
+            or not file_path.endswith('.py')
+        ):
+            return False
+
+        key = _content_key(file_path, original_content)
+        spans = self._cache_get(self._span_cache, key)
+        if spans is None:
+            spans = _top_level_spans(original_content)
+            self._cache_put(self._span_cache, key, spans)
+        if not spans:
+            return False  # Original doesn't parse, or uses __future__ imports
+
+        old_lines = original_content.splitlines(keepends=True)
+        new_lines = new_content.splitlines(keepends=True)
+        limit = min(len(old_lines), len(new_lines))
+
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < limit - prefix
+            and old_lines[-1 - suffix] == new_lines[-1 - suffix]
+        ):
+            suffix += 1
+
+        # Widen [start, end) until it no longer cuts through a statement
+        start, end = prefix, len(old_lines) - suffix
+        widened = True
+        while widened:
+            widened = False
+            for span_start, span_end in spans:
+                if span_start < max(end, start + 1) and span_end > start and (
+                    span_start < start or span_end > end
+                ):
+                    start, end = min(start, span_start), max(end, span_end)
+                    widened = True
+
+        region = ''.join(new_lines[start:len(new_lines) - (len(old_lines) - end)])
+        try:
+            ast.parse(region)
+        except (SyntaxError, ValueError):
+            return False
+        return True
+
+    def _type_check(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Step 2: type check, reusing the result for content seen before."""
+        key = _content_key(file_path, content)
+        type_result = self._cache_get(self._type_cache, key)
+        if type_result is None:
+            type_result = self._run_type_check(file_path, content)
+            # Timeouts and tool errors come back with a warning - retry those
+            if "warning" not in type_result:
+                self._cache_put(self._type_cache, key, type_result)
+        return type_result
+
+    async def _type_check_async(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Async version of _type_check()."""
+        key = _content_key(file_path, content)
+        type_result = self._cache_get(self._type_cache, key)
+        if type_result is None:
+            type_result = await self._run_type_check_async(file_path, content)
+            if "warning" not in type_result:
+                self._cache_put(self._type_cache, key, type_result)
+        return type_result
+
+    def _cache_get(self, cache: OrderedDict, key: Tuple[str, str]) -> Any:
+        """Look up a result cache entry, marking it recently used."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key: Tuple[str, str], value: Any) -> None:
+        """Store a result cache entry, evicting the least recently used."""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _apply_check_results(
+        self,
+        result: ValidationResult,
+        type_result: Optional[Dict[str, Any]],
+        test_result: Optional[TestRunResult],
+    ) -> None:
+        """Fold type check (step 2) and test (step 3) outcomes into result."""
+        if type_result is not None:
             result.type_check_result = type_result
 
             if not type_result.get("passed", True):
                 result.warnings.append("Type check failed (non-blocking)")
                 result.warnings.extend(type_result.get("errors", [])[:3])
 
-        # Step 3: Apply edit temporarily and run tests
-        if self.run_tests:
-            test_result = self._validate_with_tests(
-                file_path, original_content, new_content
-            )
+        if test_result is not None:
             result.test_result = test_result
 
             if not test_result.passed:
                 result.valid = False
                 result.errors.append(f"Tests failed: {test_result.failed_tests} failures")
 
-        return result
-
     def validate_syntax_only(
         self,
         file_path: str,
@@ -192,34 +600,109 @@ class EditValidator:
         if not file_path.endswith('.py'):
             return {"passed": True, "skipped": True}
 
-        # Write to temp file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.py',
-            delete=False
-        ) as f:
-            f.write(content)
-            temp_path = f.name
+        self._wait_for_warmup()
+        temp_path: Optional[str] = None
+        try:
+            result = None
+            if self._dmypy_available and self._ensure_dmypy():
+                temp_path = self._write_temp_source(content)
+                result = self._stream_mypy(
+                    ['dmypy', 'run', '--', *_DMYPY_FLAGS, temp_path],
+                    file_path,
+                    temp_path=temp_path,
+                    cwd=self.project_root,
+                )
+                if result[0] not in (0, 1, None):
+                    # Daemon crashed or refused - use plain mypy from now on
+                    self._dmypy_daemons[self.project_root] = False
+                    result = None
+
+            if result is None and self._can_shadow(file_path):
+                # Check the real path, but have mypy read the new content
+                # from stdin instead of the file on disk
+                result = self._stream_mypy(
+                    [
+                        'mypy', '--follow-imports=silent', *_MYPY_FLAGS,
+                        '--shadow-file', file_path, '/dev/stdin',
+                        file_path,
+                    ],
+                    file_path,
+                    cwd=self.project_root,
+                    stdin_data=content.encode('utf-8'),
+                )
 
+            if result is None:
+                if temp_path is None:
+                    temp_path = self._write_temp_source(content)
+                result = self._stream_mypy(
+                    ['mypy', *_MYPY_FLAGS, temp_path],
+                    file_path,
+                    temp_path=temp_path,
+                    cwd=self.project_root,
+                )
+
+            return _type_check_result(*result)
+
+        except subprocess.TimeoutExpired:
+            return {"passed": True, "warning": "Type check timed out"}
+
+        except Exception as e:
+            return {"passed": True, "warning": str(e)}
+
+        finally:
+            if temp_path is not None:
+                self._release_temp_source(temp_path)
+
+    async def _run_type_check_async(
+        self,
+        file_path: str,
+        content: str,
+    ) -> Dict[str, Any]:
+        """Async version of _run_type_check() using asyncio subprocesses."""
+        if not file_path.endswith('.py'):
+            return {"passed": True, "skipped": True}
+
+        if self._warm_thread is not None:
+            await asyncio.to_thread(self._wait_for_warmup)
+        temp_path: Optional[str] = None
         try:
-            result = subprocess.run(
-                ['mypy', '--no-error-summary', '--no-color-output', temp_path],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            result = None
+            if self._dmypy_available and await asyncio.to_thread(self._ensure_dmypy):
+                temp_path = self._write_temp_source(content)
+                result = await self._stream_mypy_async(
+                    ['dmypy', 'run', '--', *_DMYPY_FLAGS, temp_path],
+                    file_path,
+                    temp_path=temp_path,
+                    cwd=self.project_root,
+                )
+                if result[0] not in (0, 1, None):
+                    # Daemon crashed or refused - use plain mypy from now on
+                    self._dmypy_daemons[self.project_root] = False
+                    result = None
+
+            if result is None and self._can_shadow(file_path):
+                result = await self._stream_mypy_async(
+                    [
+                        'mypy', '--follow-imports=silent', *_MYPY_FLAGS,
+                        '--shadow-file', file_path, '/dev/stdin',
+                        file_path,
+                    ],
+                    file_path,
+                    cwd=self.project_root,
+                    stdin_data=content.encode('utf-8'),
+                )
 
-            errors = []
-            for line in result.stdout.split('\n'):
-                if 'error:' in line:
-                    # Clean up temp path in error messages
-                    clean_line = line.replace(temp_path, file_path)
-                    errors.append(clean_line)
+            if result is None:
+                if temp_path is None:
+                    temp_path = self._write_temp_source(content)
+                result = await self._stream_mypy_async(
+                    ['mypy', *_MYPY_FLAGS, temp_path],
+                    file_path,
+                    temp_path=temp_path,
+                    cwd=self.project_root,
+                )
 
-            return {
-                "passed": result.returncode == 0,
-                "errors": errors,
-            }
+            return _type_check_result(*result)
 
         except subprocess.TimeoutExpired:
             return {"passed": True, "warning": "Type check timed out"}
@@ -228,7 +711,254 @@ class EditValidator:
             return {"passed": True, "warning": str(e)}
 
         finally:
-            Path(temp_path).unlink(missing_ok=True)
+            if temp_path is not None:
+                self._release_temp_source(temp_path)
+
+    async def _stream_mypy_async(
+        self,
+        cmd: List[str],
+        file_path: str,
+        temp_path: Optional[str] = None,
+        cwd: Optional[str] = None,
+        stdin_data: Optional[bytes] = None,
+    ) -> Tuple[Optional[int], List[str]]:
+        """
+        Async version of _stream_mypy().
+
+        Raises:
+            subprocess.TimeoutExpired: If mypy runs longer than 60 seconds
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdin=asyncio.subprocess.PIPE if stdin_data is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        # Only report errors in the file being checked
+        prefix = os.fsencode(temp_path) + b':' if temp_path is not None else None
+        errors: List[str] = []
+
+        async def feed() -> None:
+            try:
+                proc.stdin.write(stdin_data)
+                await proc.stdin.drain()
+                proc.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # Process exited (or was stopped) before reading everything
+
+        async def read() -> bool:
+            async for raw in proc.stdout:
+                if raw.find(b'error:') == -1:
+                    continue
+                if prefix is not None and not raw.startswith(prefix):
+                    continue
+                line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                if temp_path is not None:
+                    # Clean up temp path in error messages
+                    line = line.replace(temp_path, file_path)
+                errors.append(line)
+                if len(errors) >= _MAX_TYPE_ERRORS:
+                    return True
+            return False
+
+        try:
+            if stdin_data is not None:
+                read_task = asyncio.gather(read(), feed())
+                stopped = (await asyncio.wait_for(read_task, timeout=60))[0]
+            else:
+                stopped = await asyncio.wait_for(read(), timeout=60)
+            if stopped:
+                proc.terminate()
+            await proc.wait()
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, 60)
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+        return (None if stopped else proc.returncode), errors
+
+    def _warm_type_checker(self) -> None:
+        """
+        Type check the whole project once, off the critical path.
+
+        Fills the project's .mypy_cache (or the daemon's in-memory graph),
+        which the first real check then reuses.
+        """
+        try:
+            if self._dmypy_available and self._ensure_dmypy():
+                cmd = ['dmypy', 'check', '.']
+            else:
+                cmd = ['mypy', '--follow-imports=silent', *_MYPY_FLAGS, '.']
+            subprocess.run(
+                cmd,
+                cwd=self.project_root,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60,
+            )
+        except (OSError, subprocess.SubprocessError):
+            pass  # Warming is best effort
+
+    def _wait_for_warmup(self) -> None:
+        """Give a running warm-up a head start so checks don't duplicate it."""
+        if self._warm_thread is not None:
+            self._warm_thread.join(timeout=_WARMUP_WAIT)
+            if not self._warm_thread.is_alive():
+                self._warm_thread = None
+
+    def _can_shadow(self, file_path: str) -> bool:
+        """Whether mypy can read new content for file_path from stdin."""
+        # --shadow-file still needs the real file to exist for module
+        # discovery, and /dev/stdin is POSIX only
+        return os.name == 'posix' and os.path.isfile(
+            os.path.join(self.project_root, file_path)
+        )
+
+    def _write_temp_source(self, content: str) -> str:
+        """
+        Write content to a reusable temporary .py file and return its path.
+
+        Files live in one directory per validator and are handed back with
+        _release_temp_source(), so concurrent checks never share a file.
+        """
+        with self._temp_lock:
+            if self._free_temp_paths:
+                temp_path = self._free_temp_paths.pop()
+            else:
+                if self._temp_dir is None:
+                    self._temp_dir = tempfile.mkdtemp(prefix='oi_validator_')
+                    atexit.register(shutil.rmtree, self._temp_dir, True)
+                temp_path = os.path.join(
+                    self._temp_dir, f'check_{len(self._temp_mtimes)}.py'
+                )
+                self._temp_mtimes[temp_path] = 0
+
+            # mypy trusts its cache when path, size and whole-second mtime
+            # all match, so give every rewrite of a path a new second
+            mtime = max(int(time.time()), self._temp_mtimes[temp_path] + 1)
+            self._temp_mtimes[temp_path] = mtime
+
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.utime(temp_path, (mtime, mtime))
+        return temp_path
+
+    def _release_temp_source(self, temp_path: str) -> None:
+        """Return a file from _write_temp_source() for reuse."""
+        with self._temp_lock:
+            self._free_temp_paths.append(temp_path)
+
+    def _stream_mypy(
+        self,
+        cmd: List[str],
+        file_path: str,
+        temp_path: Optional[str] = None,
+        cwd: Optional[str] = None,
+        stdin_data: Optional[bytes] = None,
+    ) -> Tuple[Optional[int], List[str]]:
+        """
+        Run a mypy command, collecting error lines as they are printed.
+
+        Reading stops once _MAX_TYPE_ERRORS errors are seen and the process
+        is terminated; the returned exit code is then None.
+
+        Raises:
+            subprocess.TimeoutExpired: If mypy runs longer than 60 seconds
+        """
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if stdin_data is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        if stdin_data is not None:
+            # Feed stdin from a thread so a large buffer can't deadlock
+            # against the stdout reader below
+            threading.Thread(
+                target=_feed_stdin, args=(proc, stdin_data), daemon=True
+            ).start()
+
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(60, kill)
+        timer.start()
+
+        # Only report errors in the file being checked
+        prefix = os.fsencode(temp_path) + b':' if temp_path is not None else None
+
+        errors: List[str] = []
+        stopped = False
+        try:
+            for raw in proc.stdout:
+                if raw.find(b'error:') == -1:
+                    continue
+                if prefix is not None and not raw.startswith(prefix):
+                    continue
+                line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                if temp_path is not None:
+                    # Clean up temp path in error messages
+                    line = line.replace(temp_path, file_path)
+                errors.append(line)
+                if len(errors) >= _MAX_TYPE_ERRORS:
+                    stopped = True
+                    proc.terminate()
+                    break
+        finally:
+            proc.stdout.close()
+            proc.wait()
+            timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 60)
+
+        return (None if stopped else proc.returncode), errors
+
+    def _ensure_dmypy(self) -> bool:
+        """
+        Make sure a dmypy daemon is running for this project.
+
+        Started once per project root; a daemon we start is stopped at exit.
+        Returns False if the daemon can't be used.
+        """
+        root = self.project_root
+        with self._dmypy_lock:
+            if root in self._dmypy_daemons:
+                return self._dmypy_daemons[root]
+
+            try:
+                started = subprocess.run(
+                    ['dmypy', 'start', '--', *_DMYPY_FLAGS],
+                    cwd=root,
+                    capture_output=True,
+                    timeout=60,
+                ).returncode == 0
+
+                if started:
+                    atexit.register(_stop_dmypy, root)
+                    available = True
+                else:
+                    # Possibly already running from an earlier session
+                    available = subprocess.run(
+                        ['dmypy', 'status'],
+                        cwd=root,
+                        capture_output=True,
+                        timeout=10,
+                    ).returncode == 0
+
+            except (OSError, subprocess.SubprocessError):
+                available = False
+
+            self._dmypy_daemons[root] = available
+            return available
 
     def _validate_with_tests(
         self,
@@ -247,6 +977,16 @@ class EditValidator:
         Returns:
             TestRunResult
         """
+        if _is_test_neutral(file_path, original_content, new_content):
+            # Nothing the tests could observe changed
+            return _no_test_run("Skipped: edit is equivalent to the original")
+
+        # Which tests relate to the file depends on its path and the test
+        # files, not its content - so look before touching the disk
+        related_tests = self.test_discovery.find_related_tests(file_path)
+        if not related_tests:
+            return _no_test_run("No related tests found")
+
         full_path = Path(self.project_root) / file_path
 
         # Backup original
@@ -254,23 +994,7 @@ class EditValidator:
 
         try:
             # Apply new content
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-
-            # Find and run related tests
-            related_tests = self.test_discovery.find_related_tests(file_path)
-
-            if not related_tests:
-                # No related tests found
-                return TestRunResult(
-                    passed=True,
-                    total_tests=0,
-                    passed_tests=0,
-                    failed_tests=0,
-                    skipped_tests=0,
-                    duration_seconds=0,
-                    output="No related tests found",
-                )
+            write_file_atomic(full_path, new_content)
 
             # Run the tests
             result = self.test_discovery.run_tests(
@@ -284,6 +1008,41 @@ class EditValidator:
             # Always restore original
             self.rollback.restore_file(file_path)
 
+    async def _validate_with_tests_async(
+        self,
+        file_path: str,
+        original_content: str,
+        new_content: str,
+    ) -> TestRunResult:
+        """Async version of _validate_with_tests()."""
+        if _is_test_neutral(file_path, original_content, new_content):
+            # Nothing the tests could observe changed
+            return _no_test_run("Skipped: edit is equivalent to the original")
+
+        related_tests = await asyncio.to_thread(
+            self.test_discovery.find_related_tests, file_path
+        )
+        if not related_tests:
+            return _no_test_run("No related tests found")
+
+        full_path = Path(self.project_root) / file_path
+
+        # Backup original
+        self.rollback.backup_file(file_path)
+
+        try:
+            # Apply new content
+            write_file_atomic(full_path, new_content)
+
+            return await self.test_discovery.run_tests_async(
+                related_tests,
+                timeout_seconds=self.test_timeout,
+            )
+
+        finally:
+            # Always restore original
+            self.rollback.restore_file(file_path)
+
     def create_sandbox_validator(self) -> "SandboxValidator":
         """
         Create a sandbox validator for isolated testing.
@@ -307,6 +1066,7 @@ class SandboxValidator:
         self,
         parent_validator: EditValidator,
         copy_full_project: bool = False,
+        link_files: bool = True,
     ):
         """
         Initialize the sandbox validator.
@@ -314,10 +1074,18 @@ class SandboxValidator:
         Args:
             parent_validator: Parent EditValidator
             copy_full_project: Copy full project (slow) or just relevant files
+            link_files: Hardlink read-only project files into the sandbox
+                when they can't be cloned copy-on-write. Writable files
+                are always cloned or copied.
         """
         self.parent = parent_validator
         self.copy_full_project = copy_full_project
+        self.link_files = link_files
         self._sandbox_dir: Optional[str] = None
+        self._sandbox_validator: Optional[EditValidator] = None
+
+        # project path -> (st_mtime_ns, st_size, blake2b digest)
+        self._original_hashes: Dict[str, Tuple[int, int, bytes]] = {}
 
     def __enter__(self):
         self._create_sandbox()
@@ -348,48 +1116,325 @@ class SandboxValidator:
         # Write new content to sandbox
         sandbox_path = Path(self._sandbox_dir) / file_path
         sandbox_path.parent.mkdir(parents=True, exist_ok=True)
+        # Replacing (rather than rewriting) the file also breaks any hardlink
+        # to the project copy, so the edit only lands in the sandbox
+        write_file_atomic(sandbox_path, new_content)
 
-        with open(sandbox_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-
-        # Create a validator for the sandbox
-        sandbox_validator = EditValidator(
-            project_root=self._sandbox_dir,
-            run_tests=self.parent.run_tests,
-            run_type_check=self.parent.run_type_check,
-            test_timeout=self.parent.test_timeout,
-        )
+        # An edit that reproduces the project file has nothing to validate
+        # beyond syntax, and doesn't need the original decoded
+        original_path = Path(self.parent.project_root) / file_path
+        original_hash = self._original_hash(original_path)
+        if original_hash is not None and original_hash == hashlib.blake2b(
+            new_content.encode('utf-8')
+        ).digest():
+            return self._sandbox_validator._check_syntax(file_path, new_content)
 
         # Read original for comparison
-        original_path = Path(self.parent.project_root) / file_path
-        if original_path.exists():
+        if original_hash is not None:
             original = original_path.read_text()
         else:
             original = ""
 
-        return sandbox_validator.validate_edit(file_path, original, new_content)
+        return self._sandbox_validator.validate_edit(
+            file_path, original, new_content
+        )
+
+    def _original_hash(self, original_path: Path) -> Optional[bytes]:
+        """
+        BLAKE2b digest of a project file, or None if it doesn't exist.
+
+        Digests are cached on the file's (st_mtime_ns, st_size).
+        """
+        try:
+            st = os.stat(original_path)
+        except OSError:
+            return None
+
+        key = str(original_path)
+        cached = self._original_hashes.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        digest = hashlib.blake2b()
+        with open(original_path, 'rb') as f:
+            if st.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    digest.update(data)
+
+        self._original_hashes[key] = (st.st_mtime_ns, st.st_size, digest.digest())
+        return self._original_hashes[key][2]
 
     def _create_sandbox(self):
         """Create the sandbox directory."""
         self._sandbox_dir = tempfile.mkdtemp(prefix="edit_sandbox_")
 
+        # One validator for the sandbox's lifetime, so tool lookups and the
+        # test/result caches carry over between edits. Never warmed: the
+        # sandbox is short-lived and may still be being copied.
+        self._sandbox_validator = EditValidator(
+            project_root=self._sandbox_dir,
+            run_tests=self.parent.run_tests,
+            run_type_check=self.parent.run_type_check,
+            test_timeout=self.parent.test_timeout,
+        )
+
         if self.copy_full_project:
             # Copy entire project (excluding large/unnecessary files)
-            shutil.copytree(
+            _copy_project(
                 self.parent.project_root,
                 self._sandbox_dir,
-                dirs_exist_ok=True,
-                ignore=shutil.ignore_patterns(
-                    '__pycache__', '*.pyc', '.git', 'node_modules',
-                    '.venv', 'venv', '*.egg-info', 'dist', 'build',
-                ),
+                _link_file if self.link_files else _clone_file,
             )
 
     def _cleanup_sandbox(self):
         """Clean up the sandbox directory."""
         if self._sandbox_dir and Path(self._sandbox_dir).exists():
+            # A daemon started for the sandbox can't be stopped once its
+            # directory is gone
+            with EditValidator._dmypy_lock:
+                started = EditValidator._dmypy_daemons.pop(self._sandbox_dir, False)
+            if started:
+                _stop_dmypy(self._sandbox_dir)
             shutil.rmtree(self._sandbox_dir, ignore_errors=True)
             self._sandbox_dir = None
+            self._sandbox_validator = None
+
+
+# Never copied into a full-project sandbox
+_SANDBOX_IGNORE_DIRS = frozenset({
+    '__pycache__', '.git', 'node_modules', '.venv', 'venv', 'dist', 'build',
+})
+_SANDBOX_IGNORE_SUFFIXES = ('.egg-info', '.pyc')
+
+
+def _copy_project(src: str, dst: str, copy_function: Callable[[str, str], Any]) -> None:
+    """
+    Copy a project tree into an existing directory, skipping ignored entries.
+
+    Ignored directories are pruned without being entered. A symlink that
+    resolves to a copied entry inside the project is recreated as a
+    relative link to that entry's sandbox copy. Any other symlink is
+    followed and its contents copied, so edits made in the sandbox never
+    write through to files outside it.
+    """
+    src_root = os.path.realpath(src)
+    # Resolved directories already copied, so looping links terminate
+    seen_dirs = {src_root}
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if _sandbox_ignored(name):
+                    continue
+
+                target = os.path.join(dst_dir, name)
+                source = entry.path
+                if entry.is_symlink():
+                    resolved = os.path.realpath(entry.path)
+                    relative = os.path.relpath(resolved, src_root)
+                    parts = Path(relative).parts
+                    if (
+                        relative != '.'
+                        and parts[0] != os.pardir
+                        and not any(_sandbox_ignored(part) for part in parts)
+                    ):
+                        link = os.path.join(dst, relative)
+                        os.symlink(os.path.relpath(link, dst_dir), target)
+                        continue
+                    if not os.path.exists(resolved):
+                        os.symlink(os.readlink(entry.path), target)  # Dangling
+                        continue
+                    if os.path.isdir(resolved):
+                        if resolved in seen_dirs:
+                            continue
+                        seen_dirs.add(resolved)
+                    # Copy what the link points at. os.link() would
+                    # hardlink the link itself rather than its target.
+                    source = resolved
+
+                if entry.is_dir():
+                    os.mkdir(target)
+                    stack.append((source, target))
+                else:
+                    copy_function(source, target)
+
+
+def _sandbox_ignored(name: str) -> bool:
+    """Whether a path component is left out of full-project sandboxes."""
+    return name in _SANDBOX_IGNORE_DIRS or name.endswith(_SANDBOX_IGNORE_SUFFIXES)
+
+
+# Cleared after the first failed clone (filesystem without reflink support)
+_reflink_supported = _FICLONE is not None
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    copytree copy_function: copy-on-write clone, else a regular copy.
+
+    A clone shares data blocks with the source until either side is
+    written, so it costs metadata only.
+    """
+    global _reflink_supported
+
+    if _reflink_supported:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            _reflink_supported = False
+            Path(dst).unlink(missing_ok=True)
+
+    return shutil.copy2(src, dst)
+
+
+def _link_file(src: str, dst: str) -> str:
+    """
+    copytree copy_function: clone if possible, else hardlink, else copy.
+
+    Only files without any write permission are hardlinked. A hardlink
+    shares the project file's inode, so an in-place write in the sandbox
+    (a test fixture, a tool's cache) would change the real project.
+    """
+    if _reflink_supported or os.stat(src).st_mode & 0o222:
+        return _clone_file(src, dst)
+
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        return shutil.copy2(src, dst)
+
+
+def _top_level_spans(source: str) -> List[Tuple[int, int]]:
+    """
+    0-based [start, end) line spans of a module's top-level statements.
+
+    Spans include decorators. Returns an empty list when the source
+    doesn't parse or has __future__ imports (which can change parsing).
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    spans = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == '__future__':
+            return []
+        start = min(
+            [node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])]
+        )
+        spans.append((start - 1, node.end_lineno))
+    return spans
+
+
+def _no_test_run(reason: str) -> TestRunResult:
+    """A passing TestRunResult for validation that ran no tests."""
+    return TestRunResult(
+        passed=True,
+        total_tests=0,
+        passed_tests=0,
+        failed_tests=0,
+        skipped_tests=0,
+        duration_seconds=0,
+        output=reason,
+    )
+
+
+def _is_test_neutral(file_path: str, original: str, new: str) -> bool:
+    """
+    Whether an edit can't change test outcomes.
+
+    Python sources are compared by AST, ignoring formatting, comments,
+    docstrings and argument/return annotations. Other files must match
+    apart from trailing whitespace.
+    """
+    if not original:
+        return False
+
+    if file_path.endswith('.py'):
+        try:
+            return _normalized_dump(original) == _normalized_dump(new)
+        except (SyntaxError, ValueError):
+            return False
+
+    return _strip_trailing(original) == _strip_trailing(new)
+
+
+def _normalized_dump(source: str) -> str:
+    """Dump a module's AST without docstrings or signature annotations."""
+    tree = ast.parse(source)
+    for node in ast.walk(tree):
+        if isinstance(
+            node,
+            (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef),
+        ):
+            body = node.body
+            if (
+                body
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                # Keep the body non-empty if the docstring was all there was
+                node.body = body[1:] or [ast.Pass()]
+            if not isinstance(node, (ast.Module, ast.ClassDef)):
+                node.returns = None
+        elif isinstance(node, ast.arg):
+            node.annotation = None
+    return ast.dump(tree, annotate_fields=False)
+
+
+def _strip_trailing(text: str) -> str:
+    """Remove trailing whitespace from every line."""
+    return '\n'.join(line.rstrip() for line in text.strip().splitlines())
+
+
+def _feed_stdin(proc: subprocess.Popen, data: bytes) -> None:
+    """Write data to a process's stdin and close it."""
+    try:
+        proc.stdin.write(data)
+        proc.stdin.close()
+    except (BrokenPipeError, OSError):
+        # Process exited (or was stopped) before reading everything
+        pass
+
+
+def _type_check_result(returncode: Optional[int], errors: List[str]) -> Dict[str, Any]:
+    """
+    Result dict for one mypy run.
+
+    Pass/fail follows the errors reported for the edited file, not the exit
+    status: errors in imported modules are filtered out but still make mypy
+    exit 1. A crash with nothing reported is a warning, like a timeout.
+    """
+    if returncode not in (0, 1, None) and not errors:
+        return {"passed": True, "warning": f"mypy exited with status {returncode}"}
+    return {"passed": not errors, "errors": errors}
+
+
+def _content_key(file_path: str, content: str) -> Tuple[str, str]:
+    """Cache key for validation results of a file's content."""
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    return file_path, digest
+
+
+def _stop_dmypy(project_root: str) -> None:
+    """Stop a dmypy daemon started by EditValidator (atexit hook)."""
+    try:
+        subprocess.run(
+            ['dmypy', 'stop'],
+            cwd=project_root,
+            capture_output=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        pass
 
 
 # Convenience function
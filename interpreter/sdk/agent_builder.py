@@ -34,13 +34,53 @@ Example:
 
 import asyncio
 import copy
+import hashlib
+import json
+import math
+import os
+import pickle
+import queue
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from contextlib import asynccontextmanager, contextmanager
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Default sentence-transformers model for SemanticCache (384-d)
+_CACHE_MODEL = "BAAI/bge-small-en-v1.5"
+# Width of the hashed bag-of-words vectors used without sentence-transformers
+_HASHED_DIMS = 512
+
 
 class AgentState(Enum):
     """Current state of an agent."""
@@ -51,7 +91,7 @@ class AgentState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentConfig:
     """Configuration for an agent."""
     name: str
@@ -66,20 +106,556 @@ class AgentConfig:
     context_window: int = 128000
     auto_run: bool = True
     safe_mode: str = "auto"
+    semantic_cache_enabled: bool = False
+    cache_threshold: float = 0.95
+    # Keep raw interpreter chunks in AgentResult.messages
+    return_messages: bool = False
+    # Buffer streamed output so history and cache get the full text
+    collect_full_output: bool = False
+    # Reuse results of identical runs across processes (see ResultCache)
+    persistent_cache: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentResult:
     """Result of an agent execution."""
     success: bool
     output: str
-    messages: List[Dict[str, Any]] = field(default_factory=list)
+    # Raw interpreter chunks; None unless AgentConfig.return_messages is set
+    messages: Optional[List[Dict[str, Any]]] = None
     execution_time: float = 0.0
     tokens_used: int = 0
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class SemanticCache:
+    """
+    In-memory cache of agent results keyed by prompt similarity.
+
+    Prompts are embedded and normalized, so a lookup is one matrix-vector
+    product over the stored embeddings. The best match is returned if its
+    cosine similarity is at least ``min_proximity``. Embeddings come from
+    sentence-transformers (bge-small) when it is installed. Otherwise
+    prompts only match when their text is equal up to case and
+    whitespace. numpy is used when available.
+
+    Example:
+        cache = SemanticCache(min_proximity=0.95)
+        cache.set("review auth.py", result)
+        cache.get("please review auth.py")  # result, or None on a miss
+    """
+
+    def __init__(
+        self,
+        min_proximity: float = 0.95,
+        max_entries: int = 1024,
+        embed: Optional[Callable[[str], List[float]]] = None,
+        batch_window_ms: float = 20.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            min_proximity: Minimum cosine similarity for a hit
+            max_entries: Oldest entries are overwritten beyond this size
+            embed: Optional text -> vector function (default: bge-small)
+            batch_window_ms: How long aget()/aset() wait to batch prompts
+                from concurrent agents into one embedding call
+        """
+        self.min_proximity = min_proximity
+        self.max_entries = max_entries
+        self.batch_window_ms = batch_window_ms
+        self._embed_batch: Optional[Callable[[List[str]], List[Any]]] = None
+        if embed is not None:
+            self._embed_batch = lambda texts: [embed(text) for text in texts]
+        self._batchers: "weakref.WeakKeyDictionary[Any, EmbeddingBatcher]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._vectors: Any = None  # float32 matrix, or list of rows
+        self._results: List[AgentResult] = []
+        self._next = 0  # Slot the next set() writes once full
+        self._recent: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, prompt: str) -> Optional[AgentResult]:
+        """Return the cached result closest to prompt, or None on a miss."""
+        return self._lookup(self._encode(prompt))
+
+    def set(self, prompt: str, result: AgentResult) -> None:
+        """Cache result under prompt."""
+        self._store(self._encode(prompt), result)
+
+    async def aget(self, prompt: str) -> Optional[AgentResult]:
+        """Async get(), batching the embedding with concurrent callers."""
+        return self._lookup(await self._aencode(prompt))
+
+    async def aset(self, prompt: str, result: AgentResult) -> None:
+        """Async set(), batching the embedding with concurrent callers."""
+        self._store(await self._aencode(prompt), result)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._vectors = None
+            self._results = []
+            self._next = 0
+
+    def _lookup(self, query: Any) -> Optional[AgentResult]:
+        """Return a copy of the closest cached result, if close enough."""
+        with self._lock:
+            if not self._results:
+                return None
+            count = len(self._results)
+            if np is not None:
+                scores = self._vectors[:count] @ query
+                best = int(scores.argmax())
+                score = float(scores[best])
+            else:
+                score, best = max(
+                    (sum(a * b for a, b in zip(row, query)), i)
+                    for i, row in enumerate(self._vectors)
+                )
+            if score < self.min_proximity:
+                return None
+            return copy.copy(self._results[best])
+
+    def _store(self, vector: Any, result: AgentResult) -> None:
+        """Add a result, overwriting the oldest entry once full."""
+        with self._lock:
+            if np is not None and self._vectors is None:
+                self._vectors = np.zeros(
+                    (self.max_entries, len(vector)), dtype=np.float32
+                )
+            elif self._vectors is None:
+                self._vectors = []
+
+            if len(self._results) < self.max_entries:
+                slot = len(self._results)
+                self._results.append(result)
+                if np is None:
+                    self._vectors.append(vector)
+            else:
+                slot = self._next
+                self._next = (self._next + 1) % self.max_entries
+                self._results[slot] = result
+                if np is None:
+                    self._vectors[slot] = vector
+            if np is not None:
+                self._vectors[slot] = vector
+
+    def _encode(self, prompt: str) -> Any:
+        """Embed and normalize prompt, remembering recent prompts."""
+        vector = self._recall(prompt)
+        if vector is None:
+            vector = self._remember(prompt, self._get_embedder()([prompt])[0])
+        return vector
+
+    async def _aencode(self, prompt: str) -> Any:
+        """_encode() through the running loop's EmbeddingBatcher."""
+        vector = self._recall(prompt)
+        if vector is not None:
+            return vector
+
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = EmbeddingBatcher(
+                self._get_embedder(), batch_window_ms=self.batch_window_ms
+            )
+            self._batchers[loop] = batcher
+        return self._remember(prompt, await batcher.embed(prompt))
+
+    def _get_embedder(self) -> Callable[[List[str]], List[Any]]:
+        if self._embed_batch is None:
+            self._embed_batch = _default_embedder()
+        return self._embed_batch
+
+    def _recall(self, prompt: str) -> Any:
+        with self._lock:
+            vector = self._recent.get(prompt)
+            if vector is not None:
+                self._recent.move_to_end(prompt)
+            return vector
+
+    def _remember(self, prompt: str, raw: Any) -> Any:
+        """Normalize an embedding and add it to the recent-prompt memo."""
+        raw = [float(x) for x in raw]
+        norm = math.sqrt(sum(x * x for x in raw)) or 1.0
+        if np is not None:
+            vector = np.asarray(raw, dtype=np.float32) / np.float32(norm)
+        else:
+            vector = [x / norm for x in raw]
+
+        with self._lock:
+            self._recent[prompt] = vector
+            if len(self._recent) > 64:
+                self._recent.popitem(last=False)
+        return vector
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests into batched model calls.
+
+    Requests arriving within ``batch_window_ms`` of the first one (or
+    until ``max_batch_size`` are waiting) are embedded with a single
+    call to the batch embedding function, run in a worker thread. A
+    batcher belongs to the event loop it is first used on.
+
+    Example:
+        batcher = EmbeddingBatcher(model.encode)
+        vectors = await asyncio.gather(*(batcher.embed(t) for t in texts))
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[Any]],
+        batch_window_ms: float = 20.0,
+        max_batch_size: int = 64,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            embed_batch: Function embedding a list of texts
+            batch_window_ms: How long to wait for more requests
+            max_batch_size: Flush as soon as this many are waiting
+        """
+        self.embed_batch = embed_batch
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, "asyncio.Future[Any]"]] = []
+        self._window: Optional["asyncio.Task[None]"] = None
+
+    async def embed(self, text: str) -> Any:
+        """Embed one text as part of the next batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            batch, self._pending = self._pending, []
+            loop.create_task(self._run(batch))
+        elif self._window is None or self._window.done():
+            self._window = loop.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.batch_window_ms / 1000)
+        batch, self._pending = self._pending, []
+        if batch:
+            await self._run(batch)
+
+    async def _run(self, batch: List[Tuple[str, "asyncio.Future[Any]"]]) -> None:
+        """Embed a batch in a worker thread and resolve its futures."""
+        try:
+            vectors = await asyncio.to_thread(
+                self.embed_batch, [text for text, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+def _default_embedder() -> Callable[[List[str]], List[Any]]:
+    """Load bge-small if sentence-transformers is installed, else hash prompts."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return lambda texts: [_hashed_embedding(text) for text in texts]
+
+    model = SentenceTransformer(_CACHE_MODEL)
+    return lambda texts: model.encode(texts, batch_size=max(len(texts), 1))
+
+
+def _hashed_embedding(text: str) -> List[float]:
+    """
+    Pseudo-random +/-1 vector seeded by the prompt's normalized text.
+
+    Without a real embedder, word overlap says little about whether two
+    prompts ask for the same thing ("delete a, keep b" vs "delete b,
+    keep a"), so only prompts that are equal up to case and whitespace
+    should hit. Distinct texts get near-orthogonal vectors, which keeps
+    their cosine similarity far below any usable threshold.
+    """
+    normalized = " ".join(text.lower().split())
+    digest = hashlib.shake_256(normalized.encode()).digest(_HASHED_DIMS // 8)
+    return [
+        1.0 if digest[i // 8] >> (i % 8) & 1 else -1.0 for i in range(_HASHED_DIMS)
+    ]
+
+
+class HistoryStore:
+    """
+    Columnar execution history for an agent.
+
+    Each result field lives in its own column. Numeric fields are stored
+    in compact arrays, so scans such as stats() never touch per-entry
+    objects. Message transcripts are the bulky part of a result, so
+    only the last ``max_messages`` entries keep theirs. Entries are
+    rebuilt as the usual history dicts on demand.
+    """
+
+    def __init__(self, max_messages: int = 100):
+        """
+        Initialize an empty history.
+
+        Args:
+            max_messages: Number of recent entries that keep their messages
+        """
+        self.max_messages = max_messages
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.tasks: List[str] = []
+        self.outputs: List[str] = []
+        self.errors: List[Optional[str]] = []
+        self.timestamps = array("d")  # POSIX seconds
+        self.execution_times = array("d")
+        self.tokens_used = array("q")
+        self.successes = array("b")
+        self._metadata: Dict[int, Dict[str, Any]] = {}  # Only non-empty ones
+        self._messages: Dict[int, List[Dict[str, Any]]] = {}
+
+    def append(self, task: str, result: AgentResult, timestamp: datetime) -> None:
+        """Record one execution."""
+        index = len(self.tasks)
+        self.tasks.append(task)
+        self.outputs.append(result.output)
+        self.errors.append(result.error)
+        self.timestamps.append(timestamp.timestamp())
+        self.execution_times.append(result.execution_time)
+        self.tokens_used.append(result.tokens_used)
+        self.successes.append(result.success)
+        if result.metadata:
+            self._metadata[index] = result.metadata
+        if result.messages and self.max_messages > 0:
+            self._messages[index] = result.messages
+            self._messages.pop(index - self.max_messages, None)
+
+    def extend(self, other: "HistoryStore") -> None:
+        """Append every entry of another history."""
+        for entry in other.to_list():
+            self.append(entry["task"], entry["result"], entry["timestamp"])
+
+    def entry(self, index: int) -> Dict[str, Any]:
+        """Rebuild one history entry as a dict."""
+        result = AgentResult(
+            success=bool(self.successes[index]),
+            output=self.outputs[index],
+            messages=self._messages.get(index),
+            execution_time=self.execution_times[index],
+            tokens_used=self.tokens_used[index],
+            error=self.errors[index],
+            metadata=self._metadata.get(index, {}),
+        )
+        return {
+            "task": self.tasks[index],
+            "result": result,
+            "timestamp": datetime.fromtimestamp(self.timestamps[index]),
+        }
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Rebuild every history entry as a dict."""
+        return [self.entry(i) for i in range(len(self.tasks))]
+
+    def view(self) -> "HistoryView":
+        """Get a read-only sequence view of the entries."""
+        return HistoryView(self)
+
+    def stats(self) -> Dict[str, float]:
+        """Summarize execution times, token use and success rate."""
+        count = len(self.tasks)
+        if not count:
+            return {"count": 0}
+
+        if np is not None:
+            times = np.frombuffer(self.execution_times, dtype=np.float64)
+            mean_time = float(times.mean())
+            p95_time = float(np.percentile(times, 95))
+        else:
+            mean_time = sum(self.execution_times) / count
+            p95_time = _percentile(sorted(self.execution_times), 95)
+
+        return {
+            "count": count,
+            "success_rate": sum(self.successes) / count,
+            "mean_execution_time": mean_time,
+            "p95_execution_time": p95_time,
+            "total_tokens": sum(self.tokens_used),
+        }
+
+
+class HistoryView(Sequence):
+    """
+    Read-only, live sequence of history entries.
+
+    Creating a view copies nothing; entries are rebuilt as dicts when
+    indexed or iterated. Use list(view) for a snapshot that can be
+    modified or that won't see later executions.
+    """
+
+    def __init__(self, store: HistoryStore):
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._store.entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._store.entry(index)
+
+    def __repr__(self) -> str:
+        return f"HistoryView({len(self)} entries)"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Linearly interpolated percentile of sorted values (numpy's default)."""
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of agent results.
+
+    Results are pickled into one file per key under ``directory``
+    (default: the Open Interpreter config dir). Keys hash the settings
+    that shape a response together with the task and context, so
+    re-running the same swarm, e.g. in CI, skips the LLM entirely.
+    Unreadable entries count as misses.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: <config dir>/agent_cache)
+        """
+        if directory is None:
+            from ..terminal_interface.utils.local_storage_path import (
+                get_storage_path,
+            )
+
+            directory = get_storage_path("agent_cache")
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(config: AgentConfig, task: str, context: Optional[str] = None) -> str:
+        """Hash the config fields that affect output plus the prompt."""
+        settings = json.dumps(
+            [
+                config.system_prompt,
+                config.model,
+                config.temperature,
+                config.max_tokens,
+                sorted(config.tools),
+            ],
+            separators=(",", ":"),
+        )
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (settings, task, context or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[AgentResult]:
+        """Return the cached result for key, or None."""
+        try:
+            with open(self._path(key), "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        return result if isinstance(result, AgentResult) else None
+
+    def set(self, key: str, result: AgentResult) -> None:
+        """Store result under key, replacing any existing entry atomically."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Caching is best effort
+
+    def _path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.directory / key[:2] / key
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket shared by agents calling the same provider.
+
+    Tokens refill at ``rate_per_sec`` up to ``burst``. Callers that find
+    the bucket empty reserve their token anyway and sleep until it
+    refills, so waiters are served in arrival order and throughput
+    holds at the limit instead of bursting into 429 backoff. Reservation
+    happens under a thread lock without awaiting, so one bucket works
+    across event loops (e.g. execute_sync() from several threads).
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate_per_sec: Sustained requests per second
+            burst: Maximum requests allowed back to back
+        """
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, n: int = 1) -> None:
+        """Wait until n tokens are available and take them."""
+        delay = self._reserve(n)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self, n: int) -> float:
+        """Take n tokens, going into debt if needed; return the wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.rate_per_sec,
+            )
+            self._updated = now
+            self._tokens -= n
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+
+
 class Agent:
     """
     A specialized AI coding agent built on Open Interpreter.
@@ -95,6 +671,7 @@ class Agent:
         interpreter: Any = None,
         memory: Any = None,
         plugins: Optional[List["AgentPlugin"]] = None,
+        builder: Optional["AgentBuilder"] = None,
     ):
         """
         Initialize an agent.
@@ -104,15 +681,30 @@ class Agent:
             interpreter: Optional pre-configured interpreter
             memory: Optional shared SemanticEditGraph
             plugins: Optional list of plugins to activate
+            builder: Optional builder whose interpreter pool batch
+                workers borrow from
         """
         self.config = config
         self.name = config.name
         self._interpreter = interpreter
         self._memory = memory
         self._plugins = plugins or []
+        self._builder = builder
         self._state = AgentState.IDLE
-        self._history: List[Dict[str, Any]] = []
+        self._history = HistoryStore()
         self._created_at = datetime.now()
+        # Serializes execute() - the interpreter holds one conversation.
+        # A thread lock, since execute_sync() callers each run their own
+        # event loop; async callers take it through _hold_lock().
+        self._execute_lock = threading.Lock()
+        self._cache: Optional[SemanticCache] = None
+        if config.semantic_cache_enabled:
+            self._cache = SemanticCache(min_proximity=config.cache_threshold)
+        self._result_cache: Optional[ResultCache] = None
+        if config.persistent_cache:
+            self._result_cache = ResultCache()
+        # Provider rate limit, assigned by the Swarm that owns the agent
+        self._bucket: Optional[AsyncTokenBucket] = None
 
     @property
     def state(self) -> AgentState:
@@ -137,43 +729,14 @@ class Agent:
 
     def _create_interpreter(self):
         """Create a configured interpreter instance."""
-        # Import here to avoid circular imports
-        try:
-            from interpreter import OpenInterpreter
-        except ImportError:
-            # Fallback for internal use
-            from interpreter.core.core import OpenInterpreter
-
-        interp = OpenInterpreter()
-
-        # Apply configuration
-        interp.system_message = self.config.system_prompt
-
-        if self.config.model:
-            interp.llm.model = self.config.model
-        if self.config.temperature is not None:
-            interp.llm.temperature = self.config.temperature
-        if self.config.max_tokens:
-            interp.llm.max_tokens = self.config.max_tokens
-        if self.config.context_window:
-            interp.llm.context_window = self.config.context_window
-
-        interp.auto_run = self.config.auto_run
-        interp.safe_mode = self.config.safe_mode
-
-        # Configure memory
-        if self.config.memory_enabled:
-            interp.enable_semantic_memory = True
-            if self.config.memory_path:
-                interp.semantic_memory_path = self.config.memory_path
-
-        return interp
+        return _configure_interpreter(_new_interpreter(), self.config)
 
     async def execute(
         self,
         task: str,
         context: Optional[str] = None,
         stream: bool = False,
+        messages: Optional[List[Dict[str, Any]]] = None,
     ) -> AgentResult:
         """
         Execute a task.
@@ -182,71 +745,328 @@ class Agent:
             task: The task description
             context: Optional additional context
             stream: Whether to stream output
+            messages: Optional context messages sent to the interpreter
+                ahead of the task, instead of a context string joined into
+                the prompt. Results with messages are not cached.
 
         Returns:
             AgentResult with execution details
         """
-        self._state = AgentState.RUNNING
-        start_time = datetime.now()
+        async with _hold_lock(self._execute_lock):
+            return await self._execute(task, context, messages)
 
-        try:
-            # Build the full prompt
-            full_prompt = task
-            if context:
-                full_prompt = f"{context}\n\n{task}"
+    async def _execute(
+        self,
+        task: str,
+        context: Optional[str] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> AgentResult:
+        """Run one task on the interpreter (caller holds the execute lock)."""
+        outcome: List[AgentResult] = []
+        async for _ in self._run(
+            task, context, outcome, True, messages, emit=False
+        ):
+            pass
+        return outcome[0]
+
+    async def execute_stream(
+        self,
+        task: str,
+        context: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Execute a task, yielding output text as it arrives.
 
-            # Run plugins pre-execution hooks
-            for plugin in self._plugins:
-                full_prompt = await plugin.on_before_execute(self, full_prompt)
+        Nothing is buffered unless ``config.collect_full_output`` is set,
+        in which case the full output is also recorded in the history
+        (and semantic cache) as with execute().
 
-            # Execute via interpreter
-            messages = []
-            output_parts = []
-
-            for chunk in self.interpreter.chat(full_prompt, stream=True, display=False):
-                messages.append(chunk)
-                if isinstance(chunk, dict):
-                    if chunk.get("type") == "message" and chunk.get("role") == "assistant":
-                        content = chunk.get("content", "")
-                        if content:
-                            output_parts.append(content)
-                    elif chunk.get("type") == "console":
-                        content = chunk.get("content", "")
-                        if content:
-                            output_parts.append(f"[output] {content}")
-
-            output = "\n".join(output_parts)
-            execution_time = (datetime.now() - start_time).total_seconds()
-
-            result = AgentResult(
-                success=True,
-                output=output,
-                messages=messages,
-                execution_time=execution_time,
+        Args:
+            task: The task description
+            context: Optional additional context
+
+        Yields:
+            Output deltas; console output is prefixed with "[output] "
+        """
+        async with _hold_lock(self._execute_lock):
+            outcome: List[AgentResult] = []
+            run = self._run(
+                task, context, outcome, collect=self.config.collect_full_output
             )
+            try:
+                async for _, text in run:
+                    yield text
+            finally:
+                # If our consumer stopped early, wind the chat down before
+                # the lock is released
+                await run.aclose()
+
+    async def stream(
+        self,
+        task: str,
+        context: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Execute a task, yielding output deltas as server-sent events.
+
+        Each event is a ``data: {...}\\n\\n`` string, so the generator can be
+        handed straight to a streaming HTTP response. Deltas carry the
+        chunk ``type``, ``role`` and ``content``; the last event has
+        ``type`` "result" with the outcome. Output is buffered for the
+        history only if ``config.collect_full_output`` is set.
 
-            # Run plugins post-execution hooks
-            for plugin in self._plugins:
-                result = await plugin.on_after_execute(self, result)
+        Args:
+            task: The task description
+            context: Optional additional context
 
-            self._history.append({
-                "task": task,
-                "result": result,
-                "timestamp": start_time,
+        Yields:
+            SSE-formatted event strings
+        """
+        async with _hold_lock(self._execute_lock):
+            outcome: List[AgentResult] = []
+            run = self._run(
+                task, context, outcome, collect=self.config.collect_full_output
+            )
+            try:
+                async for chunk, _ in run:
+                    yield _sse({
+                        "type": chunk.get("type"),
+                        "role": chunk.get("role"),
+                        "content": chunk.get("content"),
+                    })
+            finally:
+                # If our consumer stopped early, wind the chat down before
+                # the lock is released
+                await run.aclose()
+
+            result = outcome[0]
+            yield _sse({
+                "type": "result",
+                "success": result.success,
+                "error": result.error,
+                "execution_time": result.execution_time,
             })
 
-            self._state = AgentState.COMPLETED
-            return result
+    async def _run(
+        self,
+        task: str,
+        context: Optional[str],
+        outcome: List[AgentResult],
+        collect: bool,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        emit: bool = True,
+    ) -> AsyncIterator[Tuple[Dict[str, Any], str]]:
+        """
+        Run one task, yielding (chunk, text) for each chunk with output.
+
+        The final AgentResult is appended to outcome. Output text is only
+        accumulated when collect is true, and raw chunks only when
+        ``config.return_messages`` is set. With emit false nothing is
+        yielded, so aggregate callers process each batch of chunks in a
+        plain loop. Context messages, if given, are sent to the
+        interpreter ahead of the task. Caller holds the execute lock.
+        """
+        self._state = AgentState.RUNNING
+        start_time = datetime.now()  # For history; durations use perf_counter
+        t0 = time.perf_counter()
+
+        try:
+            cache_key = _join_prompt(task, context)
+            disk_key = None
+            cached = None
+            if self._result_cache is not None and messages is None:
+                disk_key = self._result_cache.key(self.config, task, context)
+                cached = await asyncio.to_thread(self._result_cache.get, disk_key)
+            if cached is None and self._cache is not None and messages is None:
+                cached = await self._cache.aget(cache_key)
+            if cached is not None:
+                self._history.append(task, cached, start_time)
+                self._state = AgentState.COMPLETED
+                outcome.append(cached)
+                if cached.output and emit:
+                    chunk = {
+                        "role": "assistant",
+                        "type": "message",
+                        "content": cached.output,
+                    }
+                    yield chunk, cached.output
+                return
+
+            full_prompt = await self._build_prompt(task, context)
+            chat_input: Any = full_prompt
+            if messages is not None:
+                # A list replaces the interpreter's conversation, so keep it
+                chat_input = [
+                    *self.interpreter.messages,
+                    *messages,
+                    {"role": "user", "type": "message", "content": full_prompt},
+                ]
+
+            if self._bucket is not None:
+                await self._bucket.acquire()
+
+            # Execute via interpreter
+            chunks = [] if self.config.return_messages else None
+            output = bytearray()  # UTF-8, one growing buffer
+
+            chat = self._achat(chat_input)
+            try:
+                async for batch in chat:
+                    if chunks is not None:
+                        chunks.extend(batch)
+                    for chunk in batch:
+                        text = _chunk_output(chunk)
+                        if text is None:
+                            continue
+                        if collect:
+                            if output:
+                                output += b"\n"
+                            output += text.encode("utf-8")
+                        if emit:
+                            yield chunk, text
+            finally:
+                await chat.aclose()  # Joins the chat thread
+
+            result = await self._finish(
+                task, start_time, t0, chunks, output.decode("utf-8")
+            )
+            if (
+                self._cache is not None
+                and result.success
+                and collect
+                and messages is None
+            ):
+                await self._cache.aset(cache_key, result)
+            if disk_key is not None and result.success and collect:
+                await asyncio.to_thread(self._result_cache.set, disk_key, result)
+            outcome.append(result)
 
         except Exception as e:
             self._state = AgentState.ERROR
-            execution_time = (datetime.now() - start_time).total_seconds()
-            return AgentResult(
+            execution_time = time.perf_counter() - t0
+            outcome.append(AgentResult(
                 success=False,
                 output="",
                 error=str(e),
                 execution_time=execution_time,
-            )
+            ))
+
+    async def _build_prompt(self, task: str, context: Optional[str]) -> str:
+        """Combine task and context, then apply plugin pre-execution hooks."""
+        full_prompt = _join_prompt(task, context)
+        for plugin in self._plugins:
+            full_prompt = await plugin.on_before_execute(self, full_prompt)
+        return full_prompt
+
+    async def _finish(
+        self,
+        task: str,
+        start_time: datetime,
+        t0: float,
+        messages: Optional[List[Any]],
+        output: str,
+    ) -> AgentResult:
+        """Build the result, run post-execution hooks and record history."""
+        execution_time = time.perf_counter() - t0
+
+        result = AgentResult(
+            success=True,
+            output=output,
+            messages=messages,
+            execution_time=execution_time,
+        )
+
+        # Run plugins post-execution hooks
+        for plugin in self._plugins:
+            result = await plugin.on_after_execute(self, result)
+
+        self._history.append(task, result, start_time)
+
+        self._state = AgentState.COMPLETED
+        return result
+
+    async def _achat(self, prompt: Any) -> AsyncIterator[List[Any]]:
+        """
+        Iterate interpreter.chat() in batches without blocking the loop.
+
+        The synchronous chat generator runs in a worker thread, so
+        concurrent agents overlap their LLM and tool latency. The worker
+        appends chunks to a buffer and only wakes the loop when the
+        consumer has drained it, so a fast token stream costs one
+        cross-thread wakeup, and one yielded list, per batch of chunks
+        rather than per chunk.
+        Exceptions raised by chat() are re-raised here. If the consumer
+        stops early (or is cancelled) any running code is terminated and
+        the worker closes the generator after its current chunk. Either
+        way this doesn't return until the worker has exited, so the
+        interpreter is idle once the caller moves on.
+        """
+        loop = asyncio.get_running_loop()
+        buffered: Deque[Tuple[Any, Optional[BaseException]]] = deque()
+        ready = asyncio.Event()
+        lock = threading.Lock()
+        wakeup_pending = False
+        stopped = threading.Event()
+        interpreter = self.interpreter
+
+        def push(item: Tuple[Any, Optional[BaseException]]) -> None:
+            nonlocal wakeup_pending
+            with lock:
+                buffered.append(item)
+                if wakeup_pending:
+                    return
+                wakeup_pending = True
+            loop.call_soon_threadsafe(ready.set)
+
+        def produce() -> None:
+            try:
+                chunks = interpreter.chat(prompt, stream=True, display=False)
+                try:
+                    for chunk in chunks:
+                        if stopped.is_set():
+                            break
+                        push((chunk, None))
+                finally:
+                    close = getattr(chunks, "close", None)
+                    if close is not None:
+                        close()
+            except BaseException as e:
+                error: Optional[BaseException] = e
+            else:
+                error = None
+            try:
+                push((_CHAT_DONE, error))
+            except RuntimeError:
+                pass  # Loop already closed; nobody is waiting
+
+        worker = threading.Thread(
+            target=produce, name=f"agent-{self.name}-chat", daemon=True
+        )
+        worker.start()
+        finished = False
+        try:
+            while True:
+                await ready.wait()
+                with lock:
+                    ready.clear()
+                    wakeup_pending = False
+                    batch = list(buffered)
+                    buffered.clear()
+                if batch[-1][0] is _CHAT_DONE:
+                    finished = True
+                    error = batch.pop()[1]
+                    if batch:
+                        yield [chunk for chunk, _ in batch]
+                    if error is not None:
+                        raise error
+                    return
+                yield [chunk for chunk, _ in batch]
+        finally:
+            stopped.set()
+            if not finished:
+                _terminate_code(interpreter)
+            if worker.is_alive():
+                await asyncio.to_thread(worker.join)
 
     def execute_sync(
         self,
@@ -263,23 +1083,98 @@ class Agent:
         Returns:
             AgentResult with execution details
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        return _run_coro(self.execute(task, context))
 
-        return loop.run_until_complete(self.execute(task, context))
+    async def execute_batch(
+        self,
+        tasks: List[str],
+        context: Optional[str] = None,
+        max_concurrency: int = 16,
+    ) -> List[AgentResult]:
+        """
+        Execute several independent tasks concurrently.
+
+        This agent's interpreter holds a single conversation, so tasks
+        beyond the first worker run on clones of the agent (same config,
+        memory and plugins). Clones borrow interpreters from the builder's
+        pool when the agent came from an AgentBuilder, and create fresh
+        ones otherwise. Clone history is merged back into this agent's
+        history.
+
+        Args:
+            tasks: Task descriptions
+            context: Optional additional context for every task
+            max_concurrency: Maximum tasks in flight at once
+
+        Returns:
+            AgentResult per task, in the same order as tasks
+        """
+        if not tasks:
+            return []
+
+        workers = [self] + [
+            self.clone() for _ in range(min(max_concurrency, len(tasks)) - 1)
+        ]
+        pending: "asyncio.Queue[int]" = asyncio.Queue()
+        for i in range(len(tasks)):
+            pending.put_nowait(i)
+        results: List[Optional[AgentResult]] = [None] * len(tasks)
+
+        async def work(agent: Agent) -> None:
+            # Each worker pulls the next task as soon as it finishes one
+            while not pending.empty():
+                i = pending.get_nowait()
+                results[i] = await agent.execute(tasks[i], context)
+
+        async def borrowed(clone: Agent) -> None:
+            # Clones are throwaway, so they use a pooled interpreter
+            with self._builder.acquire(clone.config) as interp:
+                clone._interpreter = interp
+                try:
+                    await work(clone)
+                finally:
+                    clone._interpreter = None
+
+        await asyncio.gather(
+            work(self),
+            *(
+                borrowed(clone) if self._builder is not None else work(clone)
+                for clone in workers[1:]
+            ),
+        )
+
+        for clone in workers[1:]:
+            self._history.extend(clone._history)
+        return results
+
+    def execute_batch_sync(
+        self,
+        tasks: List[str],
+        context: Optional[str] = None,
+        max_concurrency: int = 16,
+    ) -> List[AgentResult]:
+        """Synchronous wrapper for execute_batch()."""
+        return _run_coro(self.execute_batch(tasks, context, max_concurrency))
 
     def reset(self):
         """Reset agent state and history."""
         self._state = AgentState.IDLE
+        self._history.clear()
         if self._interpreter:
             self._interpreter.messages = []
 
-    def get_history(self) -> List[Dict[str, Any]]:
-        """Get execution history."""
-        return self._history.copy()
+    def get_history(self) -> "HistoryView":
+        """
+        Get execution history.
+
+        Returns a live read-only view; use list(agent.get_history()) for
+        a mutable snapshot.
+        """
+        return self._history.view()
+
+    def get_history_stats(self) -> Dict[str, float]:
+        """Get execution time, token and success statistics."""
+        return self._history.stats()
 
     def add_plugin(self, plugin: "AgentPlugin"):
         """Add a plugin to the agent."""
@@ -299,16 +1194,25 @@ class Agent:
         Returns:
             New Agent instance
         """
-        new_config = copy.deepcopy(self.config)
-        if new_name:
-            new_config.name = new_name
+        new_config = replace(
+            self.config,
+            name=new_name or self.config.name,
+            tools=list(self.config.tools),
+        )
 
-        return Agent(
+        clone = Agent(
             config=new_config,
             interpreter=None,  # Create fresh interpreter
             memory=self._memory,  # Share memory
             plugins=list(self._plugins),
+            builder=self._builder,
         )
+        if self._cache is not None:
+            clone._cache = self._cache  # Share cached results too
+        if self._result_cache is not None:
+            clone._result_cache = self._result_cache
+        clone._bucket = self._bucket
+        return clone
 
 
 class Orchestrator(ABC):
@@ -338,6 +1242,36 @@ class Orchestrator(ABC):
         """
         pass
 
+    async def run_batch(
+        self,
+        agents: List[Agent],
+        tasks: List[str],
+        shared_memory: Any = None,
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, AgentResult]]:
+        """
+        Orchestrate agents over several independent tasks.
+
+        Task runs overlap; an agent still handles one task at a time, so
+        different tasks pipeline through the agents.
+
+        Args:
+            agents: List of agents to coordinate
+            tasks: The tasks to complete
+            shared_memory: Optional shared memory
+            max_concurrency: Maximum task runs in flight at once
+
+        Returns:
+            One run() result per task, in the same order as tasks
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(task: str) -> Dict[str, AgentResult]:
+            async with semaphore:
+                return await self.run(agents, task, shared_memory)
+
+        return list(await asyncio.gather(*(bounded(task) for task in tasks)))
+
 
 class SequentialOrchestrator(Orchestrator):
     """
@@ -352,14 +1286,18 @@ class SequentialOrchestrator(Orchestrator):
     ) -> Dict[str, AgentResult]:
         """Run agents in sequence."""
         results = {}
-        context = ""
+        context = None
 
         for agent in agents:
-            result = await agent.execute(task, context=context if context else None)
+            result = await agent.execute(task, messages=context)
             results[agent.name] = result
 
             if result.success:
-                context = f"Previous agent ({agent.name}) output:\n{result.output}"
+                # Output is passed as its own message rather than copied
+                # into a prompt string
+                context = _handoff_messages(
+                    f"Previous agent ({agent.name}) output:", result.output
+                )
             else:
                 # Stop on failure
                 break
@@ -370,8 +1308,31 @@ class SequentialOrchestrator(Orchestrator):
 class ParallelOrchestrator(Orchestrator):
     """
     Run agents in parallel, aggregate results.
+
+    At most ``max_concurrency`` executions are in flight; each finished
+    agent immediately frees its slot for the next. ``rate_limit_rpm``
+    additionally spaces out execution starts to stay under a provider's
+    requests-per-minute limit.
     """
 
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        rate_limit_rpm: Optional[float] = None,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            max_concurrency: Maximum agent executions in flight at once
+            rate_limit_rpm: Optional cap on execution starts per minute
+        """
+        self.max_concurrency = max_concurrency
+        self.rate_limit_rpm = rate_limit_rpm
+        self._bucket: Optional[AsyncTokenBucket] = None
+        if rate_limit_rpm:
+            self._bucket = AsyncTokenBucket(rate_limit_rpm / 60.0)
+
     async def run(
         self,
         agents: List[Agent],
@@ -379,21 +1340,239 @@ class ParallelOrchestrator(Orchestrator):
         shared_memory: Any = None,
     ) -> Dict[str, AgentResult]:
         """Run agents in parallel."""
-        tasks = [agent.execute(task) for agent in agents]
-        agent_results = await asyncio.gather(*tasks, return_exceptions=True)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        agent_results: Dict[str, Union[AgentResult, BaseException]] = {}
 
-        results = {}
-        for agent, result in zip(agents, agent_results):
-            if isinstance(result, Exception):
-                results[agent.name] = AgentResult(
-                    success=False,
-                    output="",
-                    error=str(result),
-                )
-            else:
-                results[agent.name] = result
+        pending = [self._bounded(semaphore, agent, task) for agent in agents]
+        for finished in asyncio.as_completed(pending):
+            agent, result = await finished
+            agent_results[agent.name] = result
+
+        return _collect_results(
+            agents, [agent_results[agent.name] for agent in agents]
+        )
+
+    async def run_batch(
+        self,
+        agents: List[Agent],
+        tasks: List[str],
+        shared_memory: Any = None,
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, AgentResult]]:
+        """Run every agent on every task, sharing one concurrency limit."""
+        semaphore = asyncio.Semaphore(min(max_concurrency, self.max_concurrency))
+
+        pairs = await asyncio.gather(*(
+            self._bounded(semaphore, agent, task)
+            for task in tasks
+            for agent in agents
+        ))
+        agent_results = [result for _, result in pairs]
+
+        n = len(agents)
+        return [
+            _collect_results(agents, agent_results[i * n:(i + 1) * n])
+            for i in range(len(tasks))
+        ]
+
+    async def _bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        agent: Agent,
+        task: str,
+    ) -> Tuple[Agent, Union[AgentResult, BaseException]]:
+        """Execute once a slot is free, returning errors instead of raising."""
+        async with semaphore:
+            if self._bucket is not None:
+                await self._bucket.acquire()
+            try:
+                return agent, await agent.execute(task)
+            except Exception as e:
+                return agent, e
+
+
+def _new_interpreter() -> Any:
+    """Construct an unconfigured OpenInterpreter."""
+    # Import here to avoid circular imports
+    try:
+        from interpreter import OpenInterpreter
+    except ImportError:
+        # Fallback for internal use
+        from interpreter.core.core import OpenInterpreter
+
+    return OpenInterpreter()
+
+
+def _terminate_code(interp: Any) -> None:
+    """Stop any code the interpreter is running and close its kernels."""
+    terminate = getattr(getattr(interp, "computer", None), "terminate", None)
+    if terminate is None:
+        return
+    try:
+        terminate()
+    except Exception:
+        pass  # Best effort; the languages may already be gone
+
+
+def _configure_interpreter(interp: Any, config: AgentConfig) -> Any:
+    """
+    Apply an agent configuration to an interpreter.
+
+    Settings outside _pool_key() are assigned unconditionally, so a pooled
+    interpreter never keeps a previous borrower's value.
+    """
+    interp.system_message = config.system_prompt
+
+    if config.model:
+        interp.llm.model = config.model
+    if config.temperature is not None:
+        interp.llm.temperature = config.temperature
+    interp.llm.max_tokens = config.max_tokens
+    interp.llm.context_window = config.context_window
+
+    interp.auto_run = config.auto_run
+    interp.safe_mode = config.safe_mode
+
+    # Configure memory
+    if config.memory_enabled:
+        interp.enable_semantic_memory = True
+        if config.memory_path:
+            interp.semantic_memory_path = config.memory_path
+
+    return interp
+
+
+def _provider(model: Optional[str]) -> str:
+    """Provider name for a model: the LiteLLM prefix, or a best guess."""
+    if not model:
+        return "openai"  # The interpreter's default model
+    if "/" in model:
+        return model.split("/", 1)[0]
+    if model.startswith("claude"):
+        return "anthropic"
+    if model.startswith("gemini"):
+        return "gemini"
+    return "openai"
+
+
+def _pool_key(config: AgentConfig) -> tuple:
+    """Interpreter settings that can't be changed after construction cheaply."""
+    return (
+        config.model,
+        config.temperature,
+        config.context_window,
+        config.safe_mode,
+        config.memory_enabled,
+        config.memory_path,
+    )
+
+
+@asynccontextmanager
+async def _hold_lock(lock: threading.Lock) -> AsyncIterator[None]:
+    """Hold a thread lock from async code without blocking the event loop."""
+    if not lock.acquire(blocking=False):
+        acquire = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The worker still takes the lock; give it back once it has
+            acquire.add_done_callback(lambda _: lock.release())
+            raise
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+# Per-thread event loop reused by the synchronous wrappers
+_sync_loops = threading.local()
+
+
+def _run_coro(coro: Any) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Each calling thread keeps one event loop across calls instead of
+    creating a loop per call, so locks and executors bound to the loop
+    stay valid. Calling from inside a running loop is an error: the
+    caller should await the async method instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "Synchronous agent methods can't be called from a running event "
+            "loop; await the async version instead"
+        )
+
+    loop = getattr(_sync_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _sync_loops.loop = loop
+    return loop.run_until_complete(coro)
+
+
+# Marks the end of an _achat() stream on the chunk queue.
+_CHAT_DONE = object()
 
-        return results
+
+def _chunk_output(chunk: Any) -> Optional[str]:
+    """Return the text a chat chunk contributes to the agent's output."""
+    # Runs once per streamed token, so check the type first and only read
+    # the content of chunks that contribute output
+    if not isinstance(chunk, dict):
+        return None
+    kind = chunk.get("type")
+    if kind == "message":
+        if chunk.get("role") != "assistant":
+            return None
+        return chunk.get("content") or None
+    if kind == "console":
+        content = chunk.get("content")
+        return f"[output] {content}" if content else None
+    return None
+
+
+def _handoff_messages(*contents: str) -> List[Dict[str, Any]]:
+    """Wrap context strings as user messages for Agent.execute(messages=...)."""
+    return [
+        {"role": "user", "type": "message", "content": content}
+        for content in contents
+    ]
+
+
+def _join_prompt(task: str, context: Optional[str]) -> str:
+    """Prefix task with its context, if any."""
+    if context:
+        return f"{context}\n\n{task}"
+    return task
+
+
+def _sse(payload: Dict[str, Any]) -> str:
+    """Format a payload as a server-sent event."""
+    return f"data: {json.dumps(payload, default=str)}\n\n"
+
+
+def _collect_results(
+    agents: List[Agent],
+    agent_results: List[Union[AgentResult, BaseException]],
+) -> Dict[str, AgentResult]:
+    """Map gathered results to agent names, turning exceptions into failures."""
+    results = {}
+    for agent, result in zip(agents, agent_results):
+        if isinstance(result, BaseException):
+            results[agent.name] = AgentResult(
+                success=False,
+                output="",
+                error=str(result),
+            )
+        else:
+            results[agent.name] = result
+
+    return results
 
 
 class PipelineOrchestrator(Orchestrator):
@@ -427,7 +1606,8 @@ class PipelineOrchestrator(Orchestrator):
             if agent.name in self.task_transforms:
                 current_task = self.task_transforms[agent.name](task, previous_output)
 
-            result = await agent.execute(current_task, context=previous_output if previous_output else None)
+            context = _handoff_messages(previous_output) if previous_output else None
+            result = await agent.execute(current_task, messages=context)
             results[agent.name] = result
 
             if result.success:
@@ -438,6 +1618,187 @@ class PipelineOrchestrator(Orchestrator):
         return results
 
 
+class BatchAPIOrchestrator(Orchestrator):
+    """
+    Run agents through the OpenAI Batch API for offline evaluation.
+
+    Every (agent, task) pair becomes one chat completion request in a
+    single batch job: the agent's system prompt plus the task. The
+    provider bills batch requests at a discount and processes them
+    within the completion window, so this suits large offline runs
+    rather than interactive use.
+
+    Requests are single-turn completions: the interpreter does not run,
+    so no code is executed and nothing is added to agent history.
+    Plugin hooks run before the batch is built and on the materialized
+    results.
+    """
+
+    # Batch states after which no more output will appear
+    TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(
+        self,
+        client: Any = None,
+        model: str = "gpt-4o",
+        poll_interval: float = 30.0,
+        completion_window: str = "24h",
+    ):
+        """
+        Initialize batch orchestrator.
+
+        Args:
+            client: OpenAI client (default: openai.OpenAI() on first use)
+            model: Model for agents that don't configure one
+            poll_interval: Seconds between batch status checks
+            completion_window: Batch completion window
+        """
+        self._client = client
+        self.model = model
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+
+    @property
+    def client(self):
+        """Get or create the OpenAI client."""
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI()
+        return self._client
+
+    async def run(
+        self,
+        agents: List[Agent],
+        task: str,
+        shared_memory: Any = None,
+    ) -> Dict[str, AgentResult]:
+        """Run agents on a task as one batch job."""
+        return (await self.run_batch(agents, [task], shared_memory))[0]
+
+    async def run_batch(
+        self,
+        agents: List[Agent],
+        tasks: List[str],
+        shared_memory: Any = None,
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, AgentResult]]:
+        """Run every agent on every task as one batch job."""
+        if not agents or not tasks:
+            return [{} for _ in tasks]
+
+        lines = []
+        for idx, task in enumerate(tasks):
+            for agent in agents:
+                prompt = task
+                for plugin in agent._plugins:
+                    prompt = await plugin.on_before_execute(agent, prompt)
+                lines.append(json.dumps({
+                    "custom_id": f"{agent.name}:{idx}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._request_body(agent, prompt),
+                }))
+
+        t0 = time.perf_counter()
+        try:
+            batch = await self._submit("\n".join(lines).encode())
+            outputs = await self._wait_for_outputs(batch)
+            error = None
+        except Exception as e:
+            outputs = {}
+            error = str(e)
+        execution_time = time.perf_counter() - t0
+
+        batch_results = []
+        for idx in range(len(tasks)):
+            results = {}
+            for agent in agents:
+                result = _batch_result(
+                    outputs.get(f"{agent.name}:{idx}"),
+                    error or "No output for request in batch",
+                )
+                result.execution_time = execution_time
+                for plugin in agent._plugins:
+                    result = await plugin.on_after_execute(agent, result)
+                results[agent.name] = result
+            batch_results.append(results)
+        return batch_results
+
+    def _request_body(self, agent: Agent, prompt: str) -> Dict[str, Any]:
+        """Build the chat completion request for one agent."""
+        body: Dict[str, Any] = {
+            "model": agent.config.model or self.model,
+            "messages": [
+                {"role": "system", "content": agent.config.system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+        }
+        if agent.config.temperature is not None:
+            body["temperature"] = agent.config.temperature
+        if agent.config.max_tokens:
+            body["max_tokens"] = agent.config.max_tokens
+        return body
+
+    async def _submit(self, payload: bytes) -> Any:
+        """Upload the request file and create the batch."""
+        upload = await asyncio.to_thread(
+            self.client.files.create,
+            file=("swarm_batch.jsonl", payload),
+            purpose="batch",
+        )
+        return await asyncio.to_thread(
+            self.client.batches.create,
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,
+        )
+
+    async def _wait_for_outputs(self, batch: Any) -> Dict[str, Dict[str, Any]]:
+        """Poll until the batch finishes, then map custom_id -> output line."""
+        while batch.status not in self.TERMINAL_STATES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await asyncio.to_thread(self.client.batches.retrieve, batch.id)
+
+        outputs: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await asyncio.to_thread(self.client.files.content, file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    outputs[record["custom_id"]] = record
+
+        if not outputs and batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} {batch.status}")
+        return outputs
+
+
+def _batch_result(record: Optional[Dict[str, Any]], missing: str) -> AgentResult:
+    """Convert one Batch API output line to an AgentResult."""
+    if record is None:
+        return AgentResult(success=False, output="", error=missing)
+
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        error = record.get("error") or response.get("body", {}).get("error")
+        return AgentResult(success=False, output="", error=str(error))
+
+    body = response["body"]
+    content = body["choices"][0]["message"].get("content") or ""
+    return AgentResult(
+        success=True,
+        output=content,
+        messages=[{"role": "assistant", "type": "message", "content": content}],
+        tokens_used=body.get("usage", {}).get("total_tokens", 0),
+        metadata={
+            "batch_request_id": record.get("id"),
+            "custom_id": record["custom_id"],
+        },
+    )
+
+
 class Swarm:
     """
     A coordinated group of agents working together.
@@ -452,6 +1813,7 @@ class Swarm:
         orchestrator: Orchestrator,
         shared_memory: Any = None,
         name: Optional[str] = None,
+        rate_limits: Optional[Dict[str, AsyncTokenBucket]] = None,
     ):
         """
         Initialize a swarm.
@@ -461,9 +1823,18 @@ class Swarm:
             orchestrator: Strategy for coordinating agents
             shared_memory: Optional shared SemanticEditGraph
             name: Optional swarm name
+            rate_limits: Optional provider name -> bucket gating every
+                LLM call of agents on that provider (e.g. "openai",
+                "anthropic", or a LiteLLM prefix such as "ollama")
         """
         self.agents = agents
         self.orchestrator = orchestrator
+        self.rate_limits = rate_limits or {}
+        # Name -> first agent with that name, kept in step with agents
+        self._by_name: Dict[str, Agent] = {}
+        for agent in agents:
+            self._by_name.setdefault(agent.name, agent)
+            self._limit(agent)
         self.shared_memory = shared_memory
         self.name = name or f"swarm_{id(self)}"
         self._results: Dict[str, AgentResult] = {}
@@ -487,13 +1858,40 @@ class Swarm:
 
     def execute_sync(self, task: str) -> Dict[str, AgentResult]:
         """Synchronous execution wrapper."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        return _run_coro(self.execute(task))
 
-        return loop.run_until_complete(self.execute(task))
+    async def execute_batch(
+        self,
+        tasks: List[str],
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, AgentResult]]:
+        """
+        Execute several independent tasks using the swarm.
+
+        Args:
+            tasks: The tasks to complete
+            max_concurrency: Maximum task runs in flight at once
+
+        Returns:
+            One dict of agent results per task, in the same order as tasks
+        """
+        batch_results = await self.orchestrator.run_batch(
+            self.agents,
+            tasks,
+            self.shared_memory,
+            max_concurrency=max_concurrency,
+        )
+        if batch_results:
+            self._results = batch_results[-1]
+        return batch_results
+
+    def execute_batch_sync(
+        self,
+        tasks: List[str],
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, AgentResult]]:
+        """Synchronous wrapper for execute_batch()."""
+        return _run_coro(self.execute_batch(tasks, max_concurrency))
 
     @property
     def last_results(self) -> Dict[str, AgentResult]:
@@ -502,22 +1900,33 @@ class Swarm:
 
     def get_agent(self, name: str) -> Optional[Agent]:
         """Get an agent by name."""
-        for agent in self.agents:
-            if agent.name == name:
-                return agent
-        return None
+        return self._by_name.get(name)
 
     def add_agent(self, agent: Agent):
         """Add an agent to the swarm."""
         self.agents.append(agent)
+        self._by_name.setdefault(agent.name, agent)
+        self._limit(agent)
+
+    def _limit(self, agent: Agent) -> None:
+        """Attach the rate limit bucket for the agent's provider, if any."""
+        bucket = self.rate_limits.get(_provider(agent.config.model))
+        if bucket is not None:
+            agent._bucket = bucket
 
     def remove_agent(self, name: str) -> bool:
         """Remove an agent by name."""
-        for i, agent in enumerate(self.agents):
-            if agent.name == name:
-                del self.agents[i]
-                return True
-        return False
+        agent = self._by_name.pop(name, None)
+        if agent is None:
+            return False
+
+        self.agents.remove(agent)
+        # Fall back to the next agent sharing the name, if any
+        for other in self.agents:
+            if other.name == name:
+                self._by_name[name] = other
+                break
+        return True
 
 
 class AgentBuilder:
@@ -595,6 +2004,8 @@ Ensure tests are readable and maintainable.""",
         self._shared_memory = shared_memory
         self._default_model = default_model
         self._created_agents: List[Agent] = []
+        self._interpreter_pool: Dict[tuple, "queue.SimpleQueue[Any]"] = {}
+        self._pool_lock = threading.Lock()
 
     def create_agent(
         self,
@@ -638,6 +2049,7 @@ Ensure tests are readable and maintainable.""",
             interpreter=None,  # Create on demand
             memory=self._shared_memory if memory_enabled else None,
             plugins=plugins,
+            builder=self,
         )
 
         self._created_agents.append(agent)
@@ -664,21 +2076,25 @@ Ensure tests are readable and maintainable.""",
             available = ", ".join(self.TEMPLATES.keys())
             raise ValueError(f"Unknown template '{template_name}'. Available: {available}")
 
-        template = copy.deepcopy(self.TEMPLATES[template_name])
+        template = self.TEMPLATES[template_name]
 
-        # Apply overrides
+        # Apply overrides; the only mutable field is copied so agents
+        # never share the template's tool list
+        changes = {"tools": list(template.tools)}
         if name:
-            template.name = name
-        for key, value in overrides.items():
-            if hasattr(template, key):
-                setattr(template, key, value)
+            changes["name"] = name
+        changes.update(
+            (key, value) for key, value in overrides.items() if key in _CONFIG_FIELDS
+        )
+        config = replace(template, **changes)
 
-        if self._default_model and not template.model:
-            template.model = self._default_model
+        if self._default_model and not config.model:
+            config.model = self._default_model
 
         agent = Agent(
-            config=template,
+            config=config,
             memory=self._shared_memory,
+            builder=self,
         )
 
         self._created_agents.append(agent)
@@ -729,6 +2145,54 @@ Ensure tests are readable and maintainable.""",
         """Get all agents created by this builder."""
         return self._created_agents.copy()
 
+    @contextmanager
+    def acquire(self, config: AgentConfig) -> Iterator[Any]:
+        """
+        Borrow a pooled interpreter configured for config.
+
+        Interpreters are pooled by the settings in _pool_key(); the
+        system prompt and other cheap settings are reapplied on each
+        borrow. The interpreter is returned to the pool, with its
+        conversation cleared, when the block exits.
+
+        Example:
+            with builder.acquire(agent.config) as interp:
+                interp.chat("...")
+        """
+        key = _pool_key(config)
+        with self._pool_lock:
+            pool = self._interpreter_pool.setdefault(key, queue.SimpleQueue())
+        try:
+            interp = pool.get_nowait()
+        except queue.Empty:
+            interp = _new_interpreter()
+        _configure_interpreter(interp, config)
+
+        try:
+            yield interp
+        finally:
+            self.release(config, interp)
+
+    def release(self, config: AgentConfig, interp: Any) -> None:
+        """
+        Reset an interpreter and return it to the pool.
+
+        The conversation is cleared and its code kernels are terminated,
+        so variables and running processes don't carry over to the next
+        borrower.
+        """
+        interp.messages = []
+        _terminate_code(interp)
+        with self._pool_lock:
+            pool = self._interpreter_pool.setdefault(
+                _pool_key(config), queue.SimpleQueue()
+            )
+        pool.put(interp)
+
+
+# Field names accepted as from_template() overrides
+_CONFIG_FIELDS = frozenset(f.name for f in fields(AgentConfig))
+
 
 # Plugin interface (defined here for type hints, full impl in plugins.py)
 class AgentPlugin(ABC):
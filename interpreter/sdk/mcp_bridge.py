@@ -20,14 +20,63 @@ Example - Exposing agent as MCP server:
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
-import subprocess
+import os
+import shutil
+import stat
+import sys
+import tempfile
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Discovered tool catalogs, keyed by server config (see MCPClient)
+_TOOL_CACHE_DIR = Path(
+    os.path.expanduser("~"), ".cache", "open-interpreter", "mcp_tools"
+)
+
+# Keep-alive pool shared by HTTP transport requests
+_HTTP_POOL_SIZE = 32
+_HTTP_KEEPALIVE_SECONDS = 60
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Largest response line a stdio server may send; asyncio's 64 KiB default
+# is easily exceeded by file contents or search results
+_STDIO_LINE_LIMIT = 16 * 1024 * 1024
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _pretty(obj: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
 
 
 class MCPTransport(Enum):
@@ -37,7 +86,7 @@ class MCPTransport(Enum):
     SSE = "sse"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MCPTool:
     """
     Represents an MCP tool that can be called.
@@ -46,17 +95,22 @@ class MCPTool:
     description: str
     input_schema: Dict[str, Any]
     server_name: str = ""
+    _llm_tool: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_llm_tool(self) -> Dict[str, Any]:
-        """Convert to LLM tool format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.input_schema,
-        }
+        """Convert to LLM tool format (built once; treat as read-only)."""
+        if self._llm_tool is None:
+            self._llm_tool = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.input_schema,
+            }
+        return self._llm_tool
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MCPResource:
     """
     Represents an MCP resource.
@@ -67,7 +121,7 @@ class MCPResource:
     mime_type: str = "text/plain"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MCPServer:
     """
     Configuration for an MCP server.
@@ -80,7 +134,7 @@ class MCPServer:
     url: Optional[str] = None  # For HTTP transport
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MCPCallResult:
     """Result of calling an MCP tool."""
     success: bool
@@ -94,15 +148,53 @@ class MCPClient:
     Client for communicating with an MCP server.
 
     Handles the low-level protocol details for stdio-based servers.
+
+    Tool signatures rarely change, so the discovered catalog is cached
+    on disk keyed by the server's command, args, env and the command's
+    mtime. Later connects to the same server skip ``tools/list``.
     """
 
-    def __init__(self, server: MCPServer):
+    def __init__(
+        self,
+        server: MCPServer,
+        tool_cache_dir: Optional[Union[str, Path]] = _TOOL_CACHE_DIR,
+        http_session: Any = None,
+        rpc_timeout: Optional[float] = 300.0,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            server: Server configuration
+            tool_cache_dir: Directory for cached tool catalogs (None disables)
+            http_session: aiohttp.ClientSession for HTTP transport; by
+                default the client opens (and closes) its own
+            rpc_timeout: Seconds to wait for a stdio response before
+                giving up on it (None waits forever)
+        """
         self.server = server
-        self._process: Optional[subprocess.Popen] = None
+        self.rpc_timeout = rpc_timeout
+        self.tool_cache_dir = Path(tool_cache_dir) if tool_cache_dir else None
+        self._http = http_session
+        self._owns_http = False
+        self._process: Optional[asyncio.subprocess.Process] = None
         self._tools: Dict[str, MCPTool] = {}
         self._resources: Dict[str, MCPResource] = {}
         self._connected = False
-        self._message_id = 0
+        self._ids = itertools.count(1)  # Masked to 31 bits when used
+        # Requests in flight, resolved by _read_loop as responses arrive
+        self._pending: Dict[int, asyncio.Future] = {}
+        # Progress token -> sink for calls made with call_tool_stream()
+        self._progress_sinks: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._progress_tokens = itertools.count(1)
+        self._reader_task: Optional[asyncio.Task] = None
+        # Request lines queued this loop iteration, written in one go;
+        # _flushed resolves once the scheduled _flush() has run
+        self._outgoing = bytearray()
+        self._flushed: Optional[asyncio.Future] = None
+        # One drain() waiter at a time (required before Python 3.10).
+        # Created on first use so it binds to the running event loop.
+        self._drain_lock: Optional[asyncio.Lock] = None
 
     @property
     def connected(self) -> bool:
@@ -127,20 +219,24 @@ class MCPClient:
                 return False
 
         except Exception as e:
-            self._connected = False
+            await self.disconnect()
             return False
 
     async def _connect_stdio(self) -> bool:
         """Connect via stdio transport."""
-        env = {**subprocess.os.environ, **self.server.env}
-
-        self._process = subprocess.Popen(
-            [self.server.command] + self.server.args,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        # Without overrides the child simply inherits our environment
+        env = os.environ | self.server.env if self.server.env else None
+
+        self._process = await asyncio.create_subprocess_exec(
+            self.server.command,
+            *self.server.args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             env=env,
+            limit=_STDIO_LINE_LIMIT,
         )
+        self._reader_task = asyncio.ensure_future(self._read_loop())
 
         # Initialize connection
         init_result = await self._send_request("initialize", {
@@ -152,78 +248,271 @@ class MCPClient:
             "capabilities": {},
         })
 
-        if init_result:
-            self._connected = True
-            # Fetch available tools
-            await self._discover_tools()
-            return True
+        if not init_result or "error" in init_result:
+            # Whatever changed may have changed the tools too
+            self._invalidate_tool_cache()
+            # Don't leave the child and its reader running
+            await self.disconnect()
+            return False
 
-        return False
+        self._connected = True
+        # Fetch available tools
+        await self._discover_tools()
+        return True
 
     async def _connect_http(self) -> bool:
         """Connect via HTTP transport."""
         # HTTP connections don't maintain persistent state
         # Just verify the server is reachable
         try:
-            import urllib.request
-            url = self.server.url or f"http://localhost:8080"
-            req = urllib.request.Request(f"{url}/health")
-            with urllib.request.urlopen(req, timeout=5) as response:
+            import aiohttp
+
+            session = self._http_session()
+            async with session.get(
+                f"{self._http_url()}/health",
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as response:
                 self._connected = response.status == 200
-                if self._connected:
-                    await self._discover_tools()
-                return self._connected
+            if self._connected:
+                await self._discover_tools()
+            return self._connected
         except Exception:
             return False
 
+    def _http_url(self) -> str:
+        return self.server.url or "http://localhost:8080"
+
+    def _http_session(self) -> Any:
+        """The pooled keep-alive session, created on first use."""
+        if self._http is None:
+            self._http = _new_http_session()
+            self._owns_http = True
+        return self._http
+
     async def disconnect(self) -> None:
         """Disconnect from the server."""
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
         if self._process:
-            self._process.terminate()
             try:
-                self._process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+                self._process.terminate()
+                await asyncio.wait_for(self._process.wait(), timeout=5)
+            except ProcessLookupError:
+                pass  # Already exited
+            except asyncio.TimeoutError:
                 self._process.kill()
+                await self._process.wait()
             self._process = None
 
+        if self._owns_http:
+            await self._http.close()
+            self._http = None
+            self._owns_http = False
+
         self._connected = False
         self._tools.clear()
         self._resources.clear()
 
     async def _send_request(self, method: str, params: Dict) -> Optional[Dict]:
-        """Send a JSON-RPC request to the server."""
-        if not self._process:
-            return None
+        """
+        Send a JSON-RPC request to the server.
 
-        self._message_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._message_id,
-            "method": method,
-            "params": params,
-        }
+        Requests are pipelined: several may be in flight at once, and
+        each waits only for the response carrying its own id.
+        """
+        results = await self._send_requests([(method, params)])
+        return results[0]
+
+    async def _send_requests(
+        self,
+        requests: List[Tuple[str, Dict]],
+    ) -> List[Optional[Dict]]:
+        """
+        Send (method, params) requests in one write, as a JSON-RPC batch.
+
+        A single request is sent as a plain object. Results come back in
+        request order, unwrapped like _send_request().
+        """
+        if self.server.transport == MCPTransport.HTTP:
+            return await self._post_requests(requests)
+
+        if not self._process or not self._reader_task or self._reader_task.done():
+            return [None] * len(requests)
+
+        if self._drain_lock is None:
+            self._drain_lock = asyncio.Lock()
+
+        loop = asyncio.get_running_loop()
+        ids, body = self._encode_requests(requests)
+        for request_id in ids:
+            self._pending[request_id] = loop.create_future()
+        responses = [self._pending[request_id] for request_id in ids]
 
         try:
-            request_line = json.dumps(request) + "\n"
-            self._process.stdin.write(request_line.encode())
-            self._process.stdin.flush()
-
-            # Read response
-            response_line = self._process.stdout.readline()
-            if response_line:
-                response = json.loads(response_line.decode())
-                if "result" in response:
-                    return response["result"]
-                elif "error" in response:
-                    return {"error": response["error"]}
+            await self._write(body + b"\n")
+            async with self._drain_lock:
+                await self._process.stdin.drain()
 
+            # A timeout also clears entries for responses that never come
+            messages = await asyncio.wait_for(
+                asyncio.gather(*responses), timeout=self.rpc_timeout
+            )
+        except asyncio.TimeoutError:
+            error = f"No response within {self.rpc_timeout}s"
+            return [{"error": error}] * len(requests)
         except Exception as e:
-            return {"error": str(e)}
+            return [{"error": str(e)}] * len(requests)
+        finally:
+            for request_id in ids:
+                self._pending.pop(request_id, None)
 
-        return None
+        return [_unwrap_response(message) for message in messages]
+
+    def _encode_requests(
+        self,
+        requests: List[Tuple[str, Dict]],
+    ) -> Tuple[List[int], bytes]:
+        """
+        Serialize requests with fresh ids: one object, or a batch array.
+
+        The envelope around params is a cached bytes template per
+        method, so only params need encoding.
+        """
+        ids = []
+        parts = []
+        for method, params in requests:
+            request_id = next(self._ids) & 0x7FFFFFFF
+            ids.append(request_id)
+            parts.append(b"".join((
+                _ENVELOPE_PREFIX,
+                str(request_id).encode(),
+                _envelope_method(method),
+                _dumps(params),
+                b"}",
+            )))
+        if len(parts) == 1:
+            return ids, parts[0]
+        return ids, b"[" + b",".join(parts) + b"]"
+
+    async def _post_requests(
+        self,
+        requests: List[Tuple[str, Dict]],
+    ) -> List[Optional[Dict]]:
+        """Send requests over the pooled HTTP session."""
+        ids, body = self._encode_requests(requests)
+        try:
+            session = self._http_session()
+            async with session.post(
+                self._http_url(),
+                data=body,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                message = _loads(await response.read())
+        except Exception as e:
+            return [{"error": str(e)}] * len(requests)
+
+        batch = message if isinstance(message, list) else [message]
+        by_id = {m.get("id"): m for m in batch if isinstance(m, dict)}
+        return [_unwrap_response(by_id.get(request_id)) for request_id in ids]
+
+    def _on_progress(self, params: Dict[str, Any]) -> None:
+        """Hand a progress notification to the sink of its call."""
+        sink = self._progress_sinks.get(params.get("progressToken"))
+        if sink is None:
+            return
+        try:
+            sink(params)
+        except Exception:
+            pass  # A faulty sink must not stop the reader
+
+    def _on_server_message(self, message: Dict[str, Any]) -> None:
+        """Handle a request or notification sent by the server."""
+        method = message.get("method")
+        if "id" not in message:
+            if method == "notifications/progress":
+                self._on_progress(message.get("params") or {})
+            return  # Other notifications need no action
+
+        reply: Dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        if method == "ping":
+            reply["result"] = {}
+        else:
+            reply["error"] = {
+                "code": -32601,
+                "message": f"Method not found: {method}",
+            }
+        self._write(_dumps(reply) + b"\n")
+
+    def _write(self, data: bytes) -> "asyncio.Future[None]":
+        """
+        Queue data for stdin; everything queued this tick is one write.
+
+        Returns a future that resolves once the data has been handed to
+        the pipe, so callers can drain() what was actually written.
+        """
+        self._outgoing += data
+        if self._flushed is None:
+            loop = asyncio.get_running_loop()
+            self._flushed = loop.create_future()
+            loop.call_soon(self._flush)
+        return self._flushed
+
+    def _flush(self) -> None:
+        flushed, self._flushed = self._flushed, None
+        try:
+            if self._process and self._outgoing:
+                stdin = self._process.stdin
+                if not stdin.is_closing():
+                    stdin.write(bytes(self._outgoing))
+        finally:
+            self._outgoing.clear()
+            if flushed is not None and not flushed.done():
+                flushed.set_result(None)
+
+    async def _read_loop(self) -> None:
+        """Route each response line to the request waiting on its id."""
+        try:
+            while True:
+                line = await self._process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = _loads(line)
+                except ValueError:
+                    continue  # Not JSON-RPC, e.g. a stray log line
+                # A batch request is answered with an array
+                batch = message if isinstance(message, list) else [message]
+                for response in batch:
+                    if not isinstance(response, dict):
+                        continue
+                    if "method" in response:
+                        # Server-to-client: its ids may collide with ours
+                        self._on_server_message(response)
+                        continue
+                    future = self._pending.pop(response.get("id"), None)
+                    if future is not None and not future.done():
+                        future.set_result(response)
+        finally:
+            # Server went away: nothing else is coming
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_result(None)
+            self._pending.clear()
 
     async def _discover_tools(self) -> None:
-        """Discover available tools from the server."""
+        """Discover available tools from the server, or the disk cache."""
+        cached = self._load_cache()
+        if cached is not None:
+            for tool in cached:
+                self._tools[tool.name] = tool
+            return
+
         result = await self._send_request("tools/list", {})
         if result and "tools" in result:
             for tool_data in result["tools"]:
@@ -234,6 +523,70 @@ class MCPClient:
                     server_name=self.server.name,
                 )
                 self._tools[tool.name] = tool
+            self._save_cache()
+
+    def _tool_cache_key(self) -> str:
+        """Hash the server config plus the command's mtime."""
+        command = shutil.which(self.server.command) or self.server.command
+        try:
+            mtime = os.stat(command).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        config = json.dumps(
+            {
+                "command": self.server.command,
+                "args": self.server.args,
+                "env": self.server.env,
+                "transport": self.server.transport.value,
+                "url": self.server.url,
+                "mtime": mtime,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(config.encode()).hexdigest()
+
+    def _tool_cache_path(self) -> Optional[Path]:
+        if self.tool_cache_dir is None:
+            return None
+        return self.tool_cache_dir / f"{self._tool_cache_key()}.json"
+
+    def _load_cache(self) -> Optional[List[MCPTool]]:
+        """Load cached tools, or None on a miss."""
+        path = self._tool_cache_path()
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text())
+            return [
+                MCPTool(**{**tool, "server_name": self.server.name})
+                for tool in data
+            ]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_cache(self) -> None:
+        """Write the discovered tools to the cache atomically."""
+        path = self._tool_cache_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump([_tool_fields(tool) for tool in self._tools.values()], f)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Caching is best effort
+
+    def _invalidate_tool_cache(self) -> None:
+        """Drop the cached tools for this server."""
+        path = self._tool_cache_path()
+        if path is not None:
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
     async def call_tool(
         self,
@@ -261,25 +614,97 @@ class MCPClient:
             "name": name,
             "arguments": arguments,
         })
+        return _call_result(result)
 
-        if result is None:
-            return MCPCallResult(
-                success=False,
-                content=None,
-                error="No response from server",
-            )
+    async def call_tool_stream(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        sink: Callable[[Dict[str, Any]], Any],
+    ) -> MCPCallResult:
+        """
+        Call an MCP tool, passing progress updates to sink as they arrive.
+
+        The request carries a progress token, so servers that support it
+        send ``notifications/progress`` while the tool runs (e.g. bytes
+        read so far). sink gets each notification's params (progress,
+        total, message) on the event loop and should return quickly.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            sink: Callable receiving progress params
 
-        if "error" in result:
+        Returns:
+            MCPCallResult with the final result
+        """
+        if not self._connected:
             return MCPCallResult(
                 success=False,
                 content=None,
-                error=str(result["error"]),
+                error="Not connected to server",
             )
 
-        return MCPCallResult(
-            success=True,
-            content=result.get("content", result),
-        )
+        token = f"oi-{next(self._progress_tokens)}"
+        self._progress_sinks[token] = sink
+        try:
+            result = await self._send_request("tools/call", {
+                "name": name,
+                "arguments": arguments,
+                "_meta": {"progressToken": token},
+            })
+        finally:
+            del self._progress_sinks[token]
+        return _call_result(result)
+
+    def call_tool_submit(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+    ) -> "asyncio.Future[MCPCallResult]":
+        """
+        Start an MCP tool call without waiting for it.
+
+        Calls submitted in the same event loop iteration reach the server
+        in one write, and all of them are in flight before any is awaited.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Future resolving to the MCPCallResult
+        """
+        return asyncio.ensure_future(self.call_tool(name, arguments))
+
+    async def call_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+    ) -> List[MCPCallResult]:
+        """
+        Call several MCP tools with one JSON-RPC batch.
+
+        Args:
+            calls: (tool name, arguments) pairs
+
+        Returns:
+            One MCPCallResult per call, in the same order
+        """
+        if not self._connected:
+            return [
+                MCPCallResult(
+                    success=False,
+                    content=None,
+                    error="Not connected to server",
+                )
+                for _ in calls
+            ]
+
+        results = await self._send_requests([
+            ("tools/call", {"name": name, "arguments": arguments})
+            for name, arguments in calls
+        ])
+        return [_call_result(result) for result in results]
 
     def get_tools(self) -> List[MCPTool]:
         """Get all available tools."""
@@ -290,6 +715,135 @@ class MCPClient:
         return self._tools.get(name)
 
 
+_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+
+@lru_cache(maxsize=None)
+def _envelope_method(method: str) -> bytes:
+    """The bytes between a request's id and its params, per method."""
+    return b',"method":' + json.dumps(method).encode() + b',"params":'
+
+
+async def _stdin_reader() -> Tuple[Optional[asyncio.StreamReader], Any]:
+    """
+    Attach a StreamReader to stdin; returns (reader, transport).
+
+    Both are None if stdin isn't a pipe, socket or terminal: regular
+    files and in-memory streams can't be polled, so callers fall back to
+    reading them in a worker thread.
+    """
+    try:
+        fd = sys.stdin.fileno()
+        mode = os.fstat(fd).st_mode
+    except (AttributeError, OSError, ValueError):
+        return None, None
+    if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode)):
+        return None, None
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_STDIO_LINE_LIMIT)
+    # A duplicate, so closing the transport leaves sys.stdin open
+    pipe = os.fdopen(os.dup(fd), "rb", buffering=0)
+    try:
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+    except (OSError, ValueError):
+        pipe.close()
+        return None, None
+    return reader, transport
+
+
+def _read_stdin_line() -> bytes:
+    """Read one raw line from stdin (blocking), skipping text decoding."""
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:
+        return sys.stdin.readline().encode()
+    return buffer.readline()
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write encoded JSON to stdout, bypassing text encoding if possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        sys.stdout.flush()
+    else:
+        sys.stdout.flush()  # Keep order with any pending text output
+        buffer.write(data)
+        buffer.flush()
+
+
+def _new_http_session() -> Any:
+    """Open an aiohttp session with a keep-alive connection pool."""
+    import aiohttp
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=_HTTP_POOL_SIZE,
+            keepalive_timeout=_HTTP_KEEPALIVE_SECONDS,
+        )
+    )
+
+
+def _content_text(content: Any) -> str:
+    """
+    Render tool call content for the LLM.
+
+    Strings, and the common MCP reply of a single text block, are
+    returned as is; anything else is pretty-printed JSON.
+    """
+    if isinstance(content, str):
+        return content
+    if (
+        isinstance(content, list)
+        and len(content) == 1
+        and isinstance(content[0], dict)
+        and content[0].get("type") == "text"
+        and isinstance(content[0].get("text"), str)
+    ):
+        return content[0]["text"]
+    return _pretty(content)
+
+
+def _tool_fields(tool: MCPTool) -> Dict[str, Any]:
+    """The constructor fields of a tool, for the discovery cache."""
+    return {f.name: getattr(tool, f.name) for f in fields(tool) if f.init}
+
+
+def _unwrap_response(message: Optional[Dict]) -> Optional[Dict]:
+    """Reduce a JSON-RPC response to its result, or {"error": ...}."""
+    if message is None:
+        return None
+    if "result" in message:
+        return message["result"]
+    if "error" in message:
+        return {"error": message["error"]}
+    return None
+
+
+def _call_result(result: Optional[Dict]) -> MCPCallResult:
+    """Convert an unwrapped tools/call response to an MCPCallResult."""
+    if result is None:
+        return MCPCallResult(
+            success=False,
+            content=None,
+            error="No response from server",
+        )
+
+    if "error" in result:
+        return MCPCallResult(
+            success=False,
+            content=None,
+            error=str(result["error"]),
+        )
+
+    return MCPCallResult(
+        success=True,
+        content=result.get("content", result),
+    )
+
+
 class MCPToolAdapter:
     """
     Adapts MCP tools for use with Open Interpreter.
@@ -314,9 +868,7 @@ class MCPToolAdapter:
         async def tool_func(**kwargs) -> str:
             result = await self.client.call_tool(tool.name, kwargs)
             if result.success:
-                if isinstance(result.content, str):
-                    return result.content
-                return json.dumps(result.content, indent=2)
+                return _content_text(result.content)
             else:
                 return f"Error: {result.error}"
 
@@ -342,6 +894,8 @@ class MCPServerHandler:
     def __init__(self):
         self._agents: Dict[str, Any] = {}
         self._tools: Dict[str, Callable] = {}
+        # Tool name -> whether it must be awaited, decided at registration
+        self._is_coro: Dict[str, bool] = {}
 
     def register_agent(
         self,
@@ -365,7 +919,9 @@ class MCPServerHandler:
         for method_name in methods:
             if hasattr(agent, method_name):
                 tool_name = f"{agent_name}_{method_name}"
-                self._tools[tool_name] = getattr(agent, method_name)
+                method = getattr(agent, method_name)
+                self._tools[tool_name] = method
+                self._is_coro[tool_name] = asyncio.iscoroutinefunction(method)
 
     def register_tool(
         self,
@@ -384,6 +940,7 @@ class MCPServerHandler:
             input_schema: JSON schema for inputs
         """
         self._tools[name] = func
+        self._is_coro[name] = asyncio.iscoroutinefunction(func)
 
     def get_tools_list(self) -> List[Dict]:
         """Get list of available tools in MCP format."""
@@ -446,10 +1003,12 @@ class MCPServerHandler:
                 func = self._tools[tool_name]
 
                 # Call the tool (handle both sync and async)
-                if asyncio.iscoroutinefunction(func):
+                if self._is_coro[tool_name]:
                     content = await func(**arguments)
                 else:
-                    content = func(**arguments)
+                    # Blocking tools run in the default (bounded) executor so
+                    # the server keeps handling other requests meanwhile
+                    content = await asyncio.to_thread(func, **arguments)
 
                 result = {"content": content}
 
@@ -506,11 +1065,28 @@ class MCPBridge:
         result = await bridge.call_tool("filesystem", "read_file", {"path": "/etc/hosts"})
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        tool_cache_dir: Optional[Union[str, Path]] = _TOOL_CACHE_DIR,
+    ):
+        """
+        Initialize the bridge.
+
+        Args:
+            tool_cache_dir: Directory for cached tool catalogs (None disables)
+        """
+        self.tool_cache_dir = tool_cache_dir
+        self._http: Any = None  # Shared by HTTP servers, opened on demand
         self._clients: Dict[str, MCPClient] = {}
         self._adapters: Dict[str, MCPToolAdapter] = {}
+        # Tool name -> first connected client offering it
+        self._tool_index: Dict[str, MCPClient] = {}
+        # LLM tool definitions, rebuilt after servers (dis)connect
+        self._definitions: Optional[List[Dict[str, Any]]] = None
         self._server_handler = MCPServerHandler()
         self._server_running = False
+        self._server_tasks: Set[asyncio.Task] = set()
+        self._stdin_reader: Optional[asyncio.StreamReader] = None
 
     async def connect_server(
         self,
@@ -528,15 +1104,60 @@ class MCPBridge:
         if isinstance(server, dict):
             server = MCPServer(**server)
 
-        client = MCPClient(server)
+        http_session = None
+        if server.transport == MCPTransport.HTTP:
+            if self._http is None:
+                self._http = _new_http_session()
+            http_session = self._http
+
+        client = MCPClient(
+            server,
+            tool_cache_dir=self.tool_cache_dir,
+            http_session=http_session,
+        )
         success = await client.connect()
 
         if success:
+            previous = self._clients.get(server.name)
+            if previous is not None:
+                self._unindex_tools(previous)
             self._clients[server.name] = client
             self._adapters[server.name] = MCPToolAdapter(client)
+            for tool in client.get_tools():
+                self._tool_index.setdefault(tool.name, client)
+            self._definitions = None
 
         return success
 
+    async def connect_servers(
+        self,
+        servers: List[Union[MCPServer, Dict[str, Any]]],
+    ) -> Dict[str, bool]:
+        """
+        Connect to several MCP servers concurrently.
+
+        Startup costs the slowest server's spawn and handshake rather
+        than the sum over all servers.
+
+        Args:
+            servers: MCPServer configs or dicts with server details
+
+        Returns:
+            Dict mapping server names to whether they connected
+        """
+        servers = [
+            MCPServer(**server) if isinstance(server, dict) else server
+            for server in servers
+        ]
+        results = await asyncio.gather(
+            *(self.connect_server(server) for server in servers),
+            return_exceptions=True,
+        )
+        return {
+            server.name: result is True
+            for server, result in zip(servers, results)
+        }
+
     async def disconnect_server(self, name: str) -> None:
         """
         Disconnect from an MCP server.
@@ -545,14 +1166,37 @@ class MCPBridge:
             name: Server name
         """
         if name in self._clients:
-            await self._clients[name].disconnect()
-            del self._clients[name]
+            client = self._clients.pop(name)
             del self._adapters[name]
+            self._unindex_tools(client)
+            self._definitions = None
+            await client.disconnect()
+
+    def _unindex_tools(self, client: MCPClient) -> None:
+        """Drop client's tools from the index, promoting other servers."""
+        for tool in client.get_tools():
+            if self._tool_index.get(tool.name) is not client:
+                continue
+            del self._tool_index[tool.name]
+            for other in self._clients.values():
+                if other is not client and other.get_tool(tool.name):
+                    self._tool_index[tool.name] = other
+                    break
 
     async def disconnect_all(self) -> None:
-        """Disconnect from all servers."""
-        for name in list(self._clients.keys()):
-            await self.disconnect_server(name)
+        """Disconnect from all servers concurrently."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._adapters.clear()
+        self._tool_index.clear()
+        self._definitions = None
+        await asyncio.gather(
+            *(client.disconnect() for client in clients),
+            return_exceptions=True,
+        )
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
 
     def get_connected_servers(self) -> List[str]:
         """Get list of connected server names."""
@@ -573,10 +1217,12 @@ class MCPBridge:
 
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
         """Get all tool definitions in LLM format."""
-        definitions = []
-        for adapter in self._adapters.values():
-            definitions.extend(adapter.get_tool_definitions())
-        return definitions
+        if self._definitions is None:
+            definitions = []
+            for adapter in self._adapters.values():
+                definitions.extend(adapter.get_tool_definitions())
+            self._definitions = definitions
+        return list(self._definitions)
 
     async def call_tool(
         self,
@@ -604,6 +1250,45 @@ class MCPBridge:
 
         return await self._clients[server_name].call_tool(tool_name, arguments)
 
+    async def call_tools(
+        self,
+        calls: List[Tuple[str, str, Dict[str, Any]]],
+    ) -> List[MCPCallResult]:
+        """
+        Call several tools, one JSON-RPC batch per server.
+
+        Batches for different servers are sent concurrently.
+
+        Args:
+            calls: (server name, tool name, arguments) triples
+
+        Returns:
+            One MCPCallResult per call, in the same order
+        """
+        results: List[Optional[MCPCallResult]] = [None] * len(calls)
+        by_server: Dict[str, List[int]] = {}
+        for i, (server_name, _, _) in enumerate(calls):
+            if server_name in self._clients:
+                by_server.setdefault(server_name, []).append(i)
+            else:
+                results[i] = MCPCallResult(
+                    success=False,
+                    content=None,
+                    error=f"Server not connected: {server_name}",
+                )
+
+        batches = await asyncio.gather(*(
+            self._clients[server_name].call_tools(
+                [(calls[i][1], calls[i][2]) for i in indices]
+            )
+            for server_name, indices in by_server.items()
+        ))
+        for indices, batch in zip(by_server.values(), batches):
+            for i, result in zip(indices, batch):
+                results[i] = result
+
+        return results
+
     async def call_tool_any(
         self,
         tool_name: str,
@@ -619,9 +1304,9 @@ class MCPBridge:
         Returns:
             MCPCallResult with the result
         """
-        for client in self._clients.values():
-            if client.get_tool(tool_name):
-                return await client.call_tool(tool_name, arguments)
+        client = self._tool_index.get(tool_name)
+        if client is not None:
+            return await client.call_tool(tool_name, arguments)
 
         return MCPCallResult(
             success=False,
@@ -629,6 +1314,30 @@ class MCPBridge:
             error=f"Tool not found: {tool_name}",
         )
 
+    async def call_tools_any(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+    ) -> List[MCPCallResult]:
+        """
+        Call several tools, each on whichever server offers it.
+
+        Every call is submitted before any result is awaited.
+
+        Args:
+            calls: (tool name, arguments) pairs
+
+        Returns:
+            One MCPCallResult per call, in the same order
+        """
+        futures = []
+        for tool_name, arguments in calls:
+            client = self._tool_index.get(tool_name)
+            if client is not None:
+                futures.append(client.call_tool_submit(tool_name, arguments))
+            else:
+                futures.append(self.call_tool_any(tool_name, arguments))
+        return list(await asyncio.gather(*futures))
+
     def register_agent(
         self,
         agent: Any,
@@ -664,40 +1373,65 @@ class MCPBridge:
         Start as an MCP server using stdio transport.
 
         Reads JSON-RPC requests from stdin and writes responses to stdout.
+        Each request is handled in its own task, so a slow tool doesn't
+        hold up the requests behind it; responses are written as they
+        complete. Returns at EOF once in-flight requests are answered.
         """
-        import sys
-
         self._server_running = True
+        reader, transport = await _stdin_reader()
+        self._stdin_reader = reader
 
-        while self._server_running:
-            try:
-                line = sys.stdin.readline()
+        try:
+            while self._server_running:
+                if reader is not None:
+                    line = await reader.readline()
+                else:
+                    line = await asyncio.to_thread(_read_stdin_line)
                 if not line:
                     break
 
-                request = json.loads(line)
-                response = await self._server_handler.handle_request(request)
-
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
-
-            except json.JSONDecodeError:
-                continue
-            except Exception as e:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": str(e),
-                    },
-                }
-                sys.stdout.write(json.dumps(error_response) + "\n")
-                sys.stdout.flush()
+                task = asyncio.ensure_future(self._serve_line(line))
+                self._server_tasks.add(task)
+                task.add_done_callback(self._server_tasks.discard)
+
+            if self._server_tasks:
+                await asyncio.gather(*self._server_tasks, return_exceptions=True)
+        finally:
+            self._stdin_reader = None
+            if transport is not None:
+                transport.close()
+                os.set_blocking(sys.stdin.fileno(), True)
+
+    async def _serve_line(self, line: bytes) -> None:
+        """Handle one request line and write its response."""
+        request = None
+        try:
+            request = _loads(line)
+            response = await self._server_handler.handle_request(request)
+            # Serialized here so a result that can't be encoded still gets
+            # an error reply instead of leaving the client waiting
+            data = _dumps(response)
+        except json.JSONDecodeError:
+            return
+        except Exception as e:
+            data = _dumps({
+                "jsonrpc": "2.0",
+                "id": request.get("id") if isinstance(request, dict) else None,
+                "error": {
+                    "code": -32700,
+                    "message": str(e),
+                },
+            })
+        # A synchronous write, so concurrent responses never interleave
+        _write_stdout(data + b"\n")
 
     def stop_server(self) -> None:
         """Stop the MCP server."""
         self._server_running = False
+        if self._stdin_reader is not None:
+            self._stdin_reader.feed_eof()  # Wake the pending readline()
+        for task in list(self._server_tasks):
+            task.cancel()
 
     def create_interpreter_tools(self) -> Dict[str, Callable]:
         """
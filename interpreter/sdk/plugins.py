@@ -24,11 +24,16 @@ Example:
     )
 """
 
+import asyncio
+import bisect
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
 
 
 class HookPoint(Enum):
@@ -42,6 +47,18 @@ class HookPoint(Enum):
     ON_ERROR = "on_error"
     ON_TOOL_CALL = "on_tool_call"
 
+    slot: int  # Position in definition order, set just below the class
+
+    @property
+    def reducing(self) -> bool:
+        """Whether each plugin's result feeds into the next."""
+        return self not in _NOTIFY_HOOKS
+
+
+for _slot, _hook in enumerate(HookPoint):
+    _hook.slot = _slot
+del _slot, _hook
+
 
 @dataclass
 class PluginContext:
@@ -90,6 +107,7 @@ class AgentPlugin(ABC):
 
     name: str = "base_plugin"
     priority: int = 100  # Lower = runs first
+    background: bool = False  # Notification hooks run without being awaited
 
     async def on_before_execute(self, agent: Any, task: str) -> str:
         """
@@ -167,19 +185,19 @@ class AgentPlugin(ABC):
         """
         pass
 
-    async def on_error(self, agent: Any, error: Exception, context: PluginContext) -> Optional[str]:
+    async def on_error(self, agent: Any, error: Exception, context: PluginContext) -> None:
         """
         Called when an error occurs.
 
+        A notification: plugins run concurrently, any return value is
+        ignored and the error always propagates.
+
         Args:
             agent: The agent
             error: The exception
             context: Current plugin context
-
-        Returns:
-            Recovery action string, or None to propagate error
         """
-        return None
+        pass
 
     async def on_tool_call(self, agent: Any, tool_name: str, args: Dict) -> Dict:
         """
@@ -209,9 +227,19 @@ class PluginRegistry:
 
     def __init__(self):
         self._plugins: List[AgentPlugin] = []
-        self._by_hook: Dict[HookPoint, List[AgentPlugin]] = {
-            hook: [] for hook in HookPoint
-        }
+        # id(plugin) -> times registered, for O(1) membership checks
+        self._registered: Dict[int, int] = {}
+        # (plugin, bound hook method) for each plugin overriding the hook.
+        # Indexed by HookPoint.slot rather than keyed by the enum, which
+        # saves hashing a member on every dispatch
+        self._by_hook: List[List[Tuple[AgentPlugin, Callable]]] = [
+            [] for _ in HookPoint
+        ]
+        # Priorities parallel to each list above, kept sorted for bisect
+        self._priorities: List[int] = []
+        self._hook_priorities: List[List[int]] = [[] for _ in HookPoint]
+        # Strong refs so background hook tasks aren't collected mid-run
+        self._background: set = set()
 
     def register(self, plugin: AgentPlugin) -> None:
         """
@@ -220,11 +248,17 @@ class PluginRegistry:
         Args:
             plugin: Plugin to register
         """
-        self._plugins.append(plugin)
-        self._plugins.sort(key=lambda p: p.priority)
-
-        # Re-index by hook point
-        self._reindex()
+        _insort(self._plugins, self._priorities, plugin, plugin.priority)
+        self._registered[id(plugin)] = self._registered.get(id(plugin), 0) + 1
+
+        mask = _overridden_mask(type(plugin))
+        for hook, bit in _HOOK_BITS.items():
+            if mask & bit:
+                entry = (plugin, getattr(plugin, _HOOK_METHODS[hook]))
+                _insort(
+                    self._by_hook[hook.slot], self._hook_priorities[hook.slot],
+                    entry, plugin.priority,
+                )
 
     def unregister(self, plugin: AgentPlugin) -> bool:
         """
@@ -236,11 +270,26 @@ class PluginRegistry:
         Returns:
             True if plugin was found and removed
         """
-        if plugin in self._plugins:
-            self._plugins.remove(plugin)
-            self._reindex()
-            return True
-        return False
+        count = self._registered.get(id(plugin))
+        if count is None:
+            return False
+        if count == 1:
+            del self._registered[id(plugin)]
+        else:
+            self._registered[id(plugin)] = count - 1
+
+        i = next(j for j, p in enumerate(self._plugins) if p is plugin)
+        del self._plugins[i]
+        del self._priorities[i]
+
+        mask = _overridden_mask(type(plugin))
+        for hook, bit in _HOOK_BITS.items():
+            if mask & bit:
+                entries = self._by_hook[hook.slot]
+                i = next(j for j, (p, _) in enumerate(entries) if p is plugin)
+                del entries[i]
+                del self._hook_priorities[hook.slot][i]
+        return True
 
     def unregister_by_name(self, name: str) -> int:
         """
@@ -252,10 +301,21 @@ class PluginRegistry:
         Returns:
             Number of plugins removed
         """
-        original_count = len(self._plugins)
-        self._plugins = [p for p in self._plugins if p.name != name]
-        removed = original_count - len(self._plugins)
+        kept: List[AgentPlugin] = []
+        priorities: List[int] = []
+        for plugin in self._plugins:
+            if plugin.name == name:
+                count = self._registered.pop(id(plugin), 1) - 1
+                if count:
+                    self._registered[id(plugin)] = count
+            else:
+                kept.append(plugin)
+                priorities.append(plugin.priority)
+
+        removed = len(self._plugins) - len(kept)
         if removed > 0:
+            self._plugins = kept
+            self._priorities = priorities
             self._reindex()
         return removed
 
@@ -265,23 +325,26 @@ class PluginRegistry:
 
     def get_plugins_for_hook(self, hook: HookPoint) -> List[AgentPlugin]:
         """Get plugins that implement a specific hook."""
-        return self._by_hook.get(hook, [])
+        return [plugin for plugin, _ in self._by_hook[hook.slot]]
 
     def _reindex(self) -> None:
         """Rebuild the by-hook index."""
-        for hook in HookPoint:
-            self._by_hook[hook] = []
+        self._by_hook = [[] for _ in HookPoint]
+        self._hook_priorities = [[] for _ in HookPoint]
 
         for plugin in self._plugins:
-            # Check which hooks are overridden
-            for hook in HookPoint:
-                method_name = f"on_{hook.value}"
-                if hasattr(plugin, method_name):
-                    method = getattr(plugin, method_name)
-                    # Check if method is overridden from base
-                    base_method = getattr(AgentPlugin, method_name, None)
-                    if base_method is None or method.__func__ is not base_method:
-                        self._by_hook[hook].append(plugin)
+            mask = _overridden_mask(type(plugin))
+            for hook, bit in _HOOK_BITS.items():
+                if mask & bit:
+                    method = getattr(plugin, _HOOK_METHODS[hook])
+                    self._by_hook[hook.slot].append((plugin, method))
+                    self._hook_priorities[hook.slot].append(plugin.priority)
+
+    def _background_done(self, task: "asyncio.Future") -> None:
+        """Forget a finished background hook, consuming any exception."""
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()
 
     async def run_hook(
         self,
@@ -300,21 +363,72 @@ class PluginRegistry:
             **kwargs: Additional arguments
 
         Returns:
-            Transformed value after all plugins
+            Transformed value after all plugins. Notification hooks
+            (see HookPoint.reducing) run concurrently and return value as is.
         """
-        plugins = self._by_hook.get(hook, [])
-
-        for plugin in plugins:
-            method_name = f"on_{hook.value}"
-            method = getattr(plugin, method_name, None)
-            if method:
-                result = await method(agent, value, **kwargs)
-                if result is not None:
-                    value = result
+        entries = self._by_hook[hook.slot]
+        if not entries:
+            return value
+
+        if not hook.reducing:
+            awaited = []
+            for plugin, method in entries:
+                if plugin.background:
+                    task = asyncio.ensure_future(method(agent, value, **kwargs))
+                    self._background.add(task)
+                    task.add_done_callback(self._background_done)
+                else:
+                    awaited.append(method(agent, value, **kwargs))
+            # One failing listener shouldn't stop the others
+            await asyncio.gather(*awaited, return_exceptions=True)
+            return value
+
+        for _, method in entries:
+            result = await method(agent, value, **kwargs)
+            if result is not None:
+                value = result
 
         return value
 
 
+# One bit per hook point, for the per-class override masks below
+_HOOK_BITS = {hook: 1 << hook.slot for hook in HookPoint}
+# Hook -> AgentPlugin method name, built once. ON_ERROR and ON_TOOL_CALL
+# values already carry the "on_" prefix.
+_HOOK_METHODS = {
+    hook: hook.value if hook.value.startswith("on_") else f"on_{hook.value}"
+    for hook in HookPoint
+}
+
+# Hooks whose results are ignored, so their plugins can run side by side
+_NOTIFY_HOOKS = frozenset({HookPoint.AFTER_EDIT, HookPoint.ON_ERROR})
+
+# Plugin class -> bitmask of the hooks it overrides
+_OVERRIDE_CACHE: "weakref.WeakKeyDictionary[type, int]" = weakref.WeakKeyDictionary()
+
+
+def _overridden_mask(cls: type) -> int:
+    """Bitmask of the hooks cls overrides from AgentPlugin, memoized."""
+    mask = _OVERRIDE_CACHE.get(cls)
+    if mask is None:
+        mask = 0
+        for hook, bit in _HOOK_BITS.items():
+            method_name = _HOOK_METHODS[hook]
+            method = getattr(cls, method_name, None)
+            # Class attributes are plain functions, sync or async alike
+            if method is not None and method is not getattr(AgentPlugin, method_name):
+                mask |= bit
+        _OVERRIDE_CACHE[cls] = mask
+    return mask
+
+
+def _insort(items: List[Any], priorities: List[int], item: Any, priority: int) -> None:
+    """Insert item after any of equal priority, keeping both lists in step."""
+    i = bisect.bisect_right(priorities, priority)
+    priorities.insert(i, priority)
+    items.insert(i, item)
+
+
 # Built-in plugins
 
 class LoggingPlugin(AgentPlugin):
@@ -336,9 +450,10 @@ class LoggingPlugin(AgentPlugin):
         self.log(f"[{datetime.now().isoformat()}] {agent.name} {status} ({result.execution_time:.2f}s)")
         return result
 
-    async def on_error(self, agent: Any, error: Exception, context: PluginContext) -> Optional[str]:
-        self.log(f"[{datetime.now().isoformat()}] {agent.name} ERROR: {error}")
-        return None
+    async def on_error(self, agent: Any, error: Exception, context: PluginContext) -> None:
+        # The context was stamped when the error was raised; reuse that
+        stamp = context.timestamp if context is not None else datetime.now()
+        self.log(f"[{stamp.isoformat()}] {agent.name} ERROR: {error}")
 
 
 class MetricsPlugin(AgentPlugin):
@@ -431,35 +546,43 @@ class MemoryPlugin(AgentPlugin):
 
     def __init__(self, semantic_graph: Optional[Any] = None):
         self._graph = semantic_graph
+        self._extractor = None  # DiffSymbolExtractor, created on first edit
 
     async def on_after_edit(self, agent: Any, edit_context: EditContext, success: bool) -> None:
         if not success or self._graph is None:
             return
 
         try:
-            from interpreter.core.memory import Edit, EditType, DiffSymbolExtractor
-
-            # Create edit record
-            extractor = DiffSymbolExtractor()
-            _, modified, _ = extractor.find_affected_symbols(
-                edit_context.original_content,
-                edit_context.new_content,
-                edit_context.file_path,
-            )
-
-            edit = Edit(
-                file_path=edit_context.file_path,
-                original_content=edit_context.original_content,
-                new_content=edit_context.new_content,
-                edit_type=EditType.UNKNOWN,
-                affected_symbols=modified,
-            )
-
-            self._graph.record_edit(edit)
-
+            # Diffing symbols and writing the graph are blocking; keep them
+            # off the event loop. SemanticGraph serializes its own writes.
+            await asyncio.to_thread(self._record_edit, edit_context)
         except Exception:
             pass  # Don't fail on memory errors
 
+    def _record_edit(self, edit_context: EditContext) -> None:
+        """Extract the affected symbols and record the edit."""
+        from interpreter.core.memory import Edit, EditType, DiffSymbolExtractor
+
+        if self._extractor is None:
+            self._extractor = DiffSymbolExtractor()
+
+        # Create edit record
+        _, modified, _ = self._extractor.find_affected_symbols(
+            edit_context.original_content,
+            edit_context.new_content,
+            edit_context.file_path,
+        )
+
+        edit = Edit(
+            file_path=edit_context.file_path,
+            original_content=edit_context.original_content,
+            new_content=edit_context.new_content,
+            edit_type=EditType.UNKNOWN,
+            affected_symbols=modified,
+        )
+
+        self._graph.record_edit(edit)
+
 
 class RateLimitPlugin(AgentPlugin):
     """
@@ -475,28 +598,40 @@ class RateLimitPlugin(AgentPlugin):
     ):
         self.max_calls = max_calls_per_minute
         self.max_tokens = max_tokens_per_minute
-        self._call_times: List[datetime] = []
-        self._token_counts: List[tuple] = []  # (timestamp, tokens)
+        # Monotonic timestamps, oldest first
+        self._call_times: Deque[float] = deque()
+        self._token_counts: Deque[Tuple[float, int]] = deque()  # (timestamp, tokens)
+        self._token_sum = 0
+
+    def _expire(self, now: float) -> None:
+        """Drop entries older than the one-minute window."""
+        cutoff = now - 60.0
+        call_times = self._call_times
+        while call_times and call_times[0] <= cutoff:
+            call_times.popleft()
+        token_counts = self._token_counts
+        while token_counts and token_counts[0][0] <= cutoff:
+            _, count = token_counts.popleft()
+            self._token_sum -= count
 
     async def on_before_execute(self, agent: Any, task: str) -> str:
-        import asyncio
-
-        now = datetime.now()
-        minute_ago = now.timestamp() - 60
-
-        # Clean old entries
-        self._call_times = [t for t in self._call_times if t.timestamp() > minute_ago]
-        self._token_counts = [(t, c) for t, c in self._token_counts if t.timestamp() > minute_ago]
+        now = time.monotonic()
+        self._expire(now)
 
-        # Check rate limit
+        # Check rate limits; waiting until the oldest entry leaves the window
+        wait_time = 0.0
         if len(self._call_times) >= self.max_calls:
-            wait_time = 60 - (now.timestamp() - self._call_times[0].timestamp())
-            await asyncio.sleep(max(0, wait_time))
+            wait_time = 60 - (now - self._call_times[0])
+        if self._token_sum >= self.max_tokens:
+            wait_time = max(wait_time, 60 - (now - self._token_counts[0][0]))
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
-        self._call_times.append(now)
+        self._call_times.append(time.monotonic())
         return task
 
     async def on_after_execute(self, agent: Any, result: Any) -> Any:
         if result.tokens_used > 0:
-            self._token_counts.append((datetime.now(), result.tokens_used))
+            self._token_counts.append((time.monotonic(), result.tokens_used))
+            self._token_sum += result.tokens_used
         return result
@@ -5,32 +5,65 @@ Visual blocks and UI elements for the Open Interpreter CLI.
 Cyber Professional theme with violet/cyan accents.
 """
 
-from .theme import (
-    THEME,
-    ROLE_ICONS,
-    LANGUAGE_ICONS,
-    STATUS_ICONS,
-    PROMPT_SYMBOLS,
-    BOX_STYLES,
-    get_role_style,
-    get_role_icon,
-    get_language_icon,
-    get_status_display,
-)
-from .base_block import BaseBlock
-from .message_block import MessageBlock, textify_markdown_code_blocks
-from .code_block import CodeBlock
-from .live_output_panel import LiveOutputPanel, OutputBuffer
-from .prompt_block import PromptBlock, styled_input, styled_confirm
-from .spinner_block import SpinnerBlock, ThinkingSpinner, ExecutingSpinner, with_spinner
-from .status_bar import StatusBar, display_status_bar
+import importlib
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing the package, or one of its
+# submodules directly, doesn't pull in every block and its dependencies.
+_LAZY = {
+    # Theme
+    "THEME": "theme",
+    "ROLE_ICONS": "theme",
+    "LANGUAGE_ICONS": "theme",
+    "STATUS_ICONS": "theme",
+    "PROMPT_SYMBOLS": "theme",
+    "BOX_STYLES": "theme",
+    "get_role_style": "theme",
+    "get_role_icon": "theme",
+    "get_language_icon": "theme",
+    "get_status_display": "theme",
+    # Blocks
+    "BaseBlock": "base_block",
+    "MessageBlock": "message_block",
+    "textify_markdown_code_blocks": "message_block",
+    "CodeBlock": "code_block",
+    "LiveOutputPanel": "live_output_panel",
+    "OutputBuffer": "live_output_panel",
+    "PromptBlock": "prompt_block",
+    "styled_input": "prompt_block",
+    "styled_confirm": "prompt_block",
+    "SpinnerBlock": "spinner_block",
+    "ThinkingSpinner": "spinner_block",
+    "ExecutingSpinner": "spinner_block",
+    "with_spinner": "spinner_block",
+    "StatusBar": "status_bar",
+    "display_status_bar": "status_bar",
+    # New UI components (v0.4.x)
+    "ErrorBlock": "error_block",
+    "display_error": "error_block",
+    "DiffBlock": "diff_block",
+    "show_diff": "diff_block",
+    "InteractiveMenu": "interactive_menu",
+    "interactive_choice": "interactive_menu",
+    "TableDisplay": "table_display",
+    "detect_and_format_table": "table_display",
+    "NetworkStatus": "network_status",
+    "get_network_status": "network_status",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# New UI components (v0.4.x)
-from .error_block import ErrorBlock, display_error
-from .diff_block import DiffBlock, show_diff
-from .interactive_menu import InteractiveMenu, interactive_choice
-from .table_display import TableDisplay, detect_and_format_table
-from .network_status import NetworkStatus, get_network_status
 
 __all__ = [
     # Theme
@@ -7,7 +7,7 @@ Reads from UIState.active_agents and updates via EventBus.
 Part of Phase 2: Agent Visualization
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
@@ -60,6 +60,11 @@ class AgentStrip:
         AgentStatus.CANCELLED: "text_muted",
     }
 
+    # Resolved styles, looked up once rather than per badge
+    _STATUS_STYLES = {status: THEME[key] for status, key in STATUS_COLORS.items()}
+    _DEFAULT_STATUS_STYLE = THEME["text_muted"]
+    _ERROR_STYLE = f"dim {THEME['error']}"
+
     def __init__(self, state: UIState, console: Console = None):
         """
         Initialize the agent strip.
@@ -70,6 +75,14 @@ class AgentStrip:
         """
         self.state = state
         self.console = console or Console()
+        # Badges from the last render, keyed by everything that feeds them
+        self._badge_cache: Dict[Tuple, Text] = {}
+        # Last panel and the state it was rendered from. Direct writes to
+        # active_agents or selected_agent_id don't bump state.version, so
+        # those are part of the key too.
+        self._last_key: Optional[Tuple] = None
+        self._last_panel: Optional[Panel] = None
+        self._running_count: Tuple[Tuple, int] = ((), 0)  # (state key, count)
 
     def render(self) -> Optional[Panel]:
         """
@@ -81,6 +94,14 @@ class AgentStrip:
         if not self.state.active_agents:
             return None
 
+        state_key = (
+            self.state.version,
+            len(self.state.active_agents),
+            self.state.selected_agent_id,
+        )
+        if state_key == self._last_key:
+            return self._last_panel
+
         # Build table with agent badges
         table = Table(
             show_header=False,
@@ -91,23 +112,54 @@ class AgentStrip:
         )
         table.add_column(justify="left")
 
-        # Build agent badges
+        # Build agent badges, reusing unchanged ones from the last render.
+        # Only keys seen this render are kept, so the cache stays bounded.
+        previous = self._badge_cache
+        self._badge_cache = {}
         badges = []
+        ticking = False  # Any badge showing a still-running clock
         for agent_id, agent in self.state.active_agents.items():
-            badge = self._build_agent_badge(agent, agent_id == self.state.selected_agent_id)
+            if agent.completed_at is None and agent.status not in (
+                AgentStatus.RUNNING, AgentStatus.ERROR
+            ):
+                ticking = True
+            is_selected = agent_id == self.state.selected_agent_id
+            key = (agent.role, agent.status, is_selected, self._badge_detail(agent))
+            badge = previous.get(key)
+            if badge is None:
+                badge = self._build_agent_badge(agent, is_selected)
+            self._badge_cache[key] = badge
             badges.append(badge)
 
         # Join badges with spaces
         content = Text(" ").join(badges)
         table.add_row(content)
 
-        return Panel(
+        panel = Panel(
             table,
             box=BOX_STYLES["status"],
             style=f"on {THEME['bg_dark']}",
             border_style=THEME["text_muted"],
             padding=(0, 1),
         )
+        # Elapsed times change without a version bump, so don't reuse those
+        self._last_key = None if ticking else state_key
+        self._last_panel = panel
+        return panel
+
+    @staticmethod
+    def _badge_detail(agent) -> Optional[str]:
+        """Text after the status icon: output preview, error or elapsed time."""
+        if agent.status == AgentStatus.RUNNING:
+            # Show last output line preview if available (pre-truncated)
+            if agent.last_line_preview is not None:
+                return agent.last_line_preview
+            return "thinking..."
+        elif agent.status == AgentStatus.ERROR:
+            # Show error summary if available (pre-truncated)
+            return agent.error_preview or None
+        # Show elapsed time for completed/pending agents
+        return agent.elapsed_display
 
     def _build_agent_badge(self, agent, is_selected: bool) -> Text:
         """
@@ -122,49 +174,28 @@ class AgentStrip:
         Returns:
             Text with the badge
         """
-        badge = Text()
-
-        # Opening bracket
         bracket_style = "bold" if is_selected else "dim"
-        badge.append("[", style=bracket_style)
 
         # Role icon and name
         role_icon = self.ROLE_ICONS.get(agent.role, "🤖")
         role_name = agent.role.value.title()
-        badge.append(f"{role_icon} {role_name}", style="bold" if is_selected else None)
 
         # Status icon
-        status_icon = agent.status_icon
-        status_color_key = self.STATUS_COLORS.get(agent.status, "text_muted")
-        status_color = THEME[status_color_key]
-        badge.append(f": {status_icon}", style=status_color)
+        status_style = self._STATUS_STYLES.get(agent.status, self._DEFAULT_STATUS_STYLE)
 
         # Elapsed time or status message
-        if agent.status == AgentStatus.RUNNING:
-            # Show last output line preview if available
-            if agent.last_lines:
-                preview = agent.last_lines[-1]
-                # Truncate long previews
-                if len(preview) > 20:
-                    preview = preview[:17] + "..."
-                badge.append(f" {preview}", style="dim")
-            else:
-                badge.append(" thinking...", style="dim")
-        elif agent.status == AgentStatus.ERROR:
-            # Show error summary if available
-            if agent.error_summary:
-                error = agent.error_summary
-                if len(error) > 20:
-                    error = error[:17] + "..."
-                badge.append(f" {error}", style=f"dim {THEME['error']}")
-        else:
-            # Show elapsed time for completed/pending agents
-            badge.append(f" {agent.elapsed_display}", style="dim")
-
-        # Closing bracket
-        badge.append("]", style=bracket_style)
-
-        return badge
+        detail = self._badge_detail(agent)
+        detail_text = f" {detail}" if detail is not None else ""
+        detail_style = self._ERROR_STYLE if agent.status == AgentStatus.ERROR else "dim"
+
+        # Built in one call rather than one append per part
+        return Text.assemble(
+            ("[", bracket_style),
+            (f"{role_icon} {role_name}", "bold" if is_selected else None),
+            (f": {agent.status_icon}", status_style),
+            (detail_text, detail_style),
+            ("]", bracket_style),
+        )
 
     def display(self):
         """Print the agent strip to the console."""
@@ -178,10 +209,15 @@ class AgentStrip:
 
     def get_running_count(self) -> int:
         """Get the count of currently running agents."""
-        return sum(
-            1 for agent in self.state.active_agents.values()
-            if agent.status == AgentStatus.RUNNING
-        )
+        key = (self.state.version, len(self.state.active_agents))
+        cached_key, count = self._running_count
+        if cached_key != key:
+            count = sum(
+                1 for agent in self.state.active_agents.values()
+                if agent.status == AgentStatus.RUNNING
+            )
+            self._running_count = (key, count)
+        return count
 
     def get_summary(self) -> str:
         """
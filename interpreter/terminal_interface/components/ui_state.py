@@ -60,6 +60,17 @@ class AgentRole(Enum):
         return cls.CUSTOM
 
 
+# Longest preview/error text shown in an agent badge
+PREVIEW_WIDTH = 20
+
+
+def _preview(text: Optional[str]) -> Optional[str]:
+    """Truncate text to PREVIEW_WIDTH, ending in '...' when cut"""
+    if text is not None and len(text) > PREVIEW_WIDTH:
+        return text[:PREVIEW_WIDTH - 3] + "..."
+    return text
+
+
 @dataclass
 class AgentState:
     """
@@ -75,6 +86,16 @@ class AgentState:
     last_lines: Deque[str] = field(default_factory=lambda: deque(maxlen=5))
     error_summary: Optional[str] = None
     parent_id: Optional[str] = None  # For hierarchical agent trees
+    # Badge-sized copies of last_lines[-1] and error_summary, kept current
+    # by UIState so renders don't truncate every frame
+    last_line_preview: Optional[str] = None
+    error_preview: Optional[str] = None
+
+    def __post_init__(self):
+        if self.last_lines and self.last_line_preview is None:
+            self.last_line_preview = _preview(self.last_lines[-1])
+        if self.error_preview is None:
+            self.error_preview = _preview(self.error_summary)
 
     @property
     def elapsed_seconds(self) -> float:
@@ -142,6 +163,7 @@ class UIState:
     # Agent tracking
     active_agents: Dict[str, AgentState] = field(default_factory=dict)
     selected_agent_id: Optional[str] = None
+    version: int = 0  # Bumped on every agent mutation, for render caching
 
     # Panel visibility (Alt+H toggles, mode-dependent)
     panels_visible: Set[str] = field(default_factory=set)  # "context", "agents", etc.
@@ -209,12 +231,14 @@ class UIState:
         with self._lock:
             self.active_agents.clear()
             self.selected_agent_id = None
+            self.version += 1
 
     def add_agent(self, agent_id: str, role: AgentRole, parent_id: Optional[str] = None) -> AgentState:
         """Register a new agent and return its state"""
         agent = AgentState(id=agent_id, role=role, parent_id=parent_id)
         with self._lock:
             self.active_agents[agent_id] = agent
+            self.version += 1
             # Auto-escalate complexity
             self.complexity_score += 10
         return agent
@@ -229,9 +253,14 @@ class UIState:
                     agent.completed_at = time.time()
                 if error:
                     agent.error_summary = error
+                    agent.error_preview = _preview(error)
+                self.version += 1
 
     def append_agent_output(self, agent_id: str, line: str) -> None:
         """Add a line to an agent's output preview"""
         with self._lock:
             if agent_id in self.active_agents:
-                self.active_agents[agent_id].last_lines.append(line)
+                agent = self.active_agents[agent_id]
+                agent.last_lines.append(line)
+                agent.last_line_preview = _preview(line)
+                self.version += 1
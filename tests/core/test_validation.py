@@ -0,0 +1,446 @@
+"""
+Tests for the edit validation package (syntax checking and test discovery).
+"""
+import asyncio
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from interpreter.core.validation.rollback import write_file_atomic
+from interpreter.core.validation.syntax_checker import SyntaxChecker
+from interpreter.core.validation import test_discovery
+from interpreter.core.validation import validator as validator_module
+from interpreter.core.validation.validator import (
+    EditValidator,
+    SandboxValidator,
+    _is_test_neutral,
+)
+
+
+class TestSyntaxCheckerBatch:
+    """Test SyntaxChecker.check_batch()."""
+
+    def test_check_batch_preserves_order(self):
+        """Results come back in input order across mixed languages."""
+        checker = SyntaxChecker()
+        items = [
+            ("x = 1", "a.py"),
+            ('{"a": 1}', "b.json"),
+            ("def broken(:", "c.py"),
+            ("notes", "d.txt"),
+            ("y = 2", "e.py"),
+        ]
+
+        results = checker.check_batch(items, max_workers=2)
+
+        assert [r.valid for r in results] == [True, True, False, True, True]
+        assert [r.language for r in results] == [
+            "python", "json", "python", "unknown", "python"
+        ]
+
+    @pytest.mark.skipif(shutil.which("tsc") is None, reason="tsc not installed")
+    def test_typescript_batch_files_are_isolated(self):
+        """Files in one tsc run don't share a global scope."""
+        checker = SyntaxChecker()
+
+        results = checker._check_typescript_batch([
+            ("const x = 1;\n", "a.ts"),
+            ("const x = 'two';\n", "b.ts"),
+            ("const y = ;\n", "c.ts"),
+        ])
+
+        assert [r.valid for r in results] == [True, True, False]
+        assert results[2].errors[0].line == 1
+
+    def test_check_batch_empty(self):
+        """An empty batch returns an empty list."""
+        assert SyntaxChecker().check_batch([]) == []
+
+    def test_repeated_check_reuses_result(self):
+        """Checking the same buffer twice returns the memoized result."""
+        checker = SyntaxChecker()
+        first = checker.check("x = 1", "a.py")
+
+        assert checker.check("x = 1", "a.py") is first
+        assert checker.check("x = 1", "b.py") is not first
+        assert checker.check("x = 2", "a.py") is not first
+
+
+class TestJunitParsing:
+    """Test TestDiscovery._parse_junit_xml()."""
+
+    def test_parse_junit_xml(self, tmp_path):
+        """Outcomes, durations and failed names are read from the report."""
+        report = tmp_path / "report.xml"
+        report.write_text(
+            '<testsuites><testsuite name="pytest">'
+            '<testcase classname="tests.test_x" name="test_a" time="0.5"/>'
+            '<testcase classname="tests.test_x" name="test_b" time="0.25">'
+            '<failure message="assert 0"/></testcase>'
+            '<testcase classname="tests.test_x" name="test_c" time="0">'
+            '<skipped/></testcase>'
+            '</testsuite></testsuites>'
+        )
+
+        parsed = test_discovery.TestDiscovery(project_root=str(tmp_path))._parse_junit_xml(
+            str(report)
+        )
+
+        assert parsed["total"] == 3
+        assert parsed["passed"] == 1
+        assert parsed["failed"] == 1
+        assert parsed["skipped"] == 1
+        assert parsed["duration"] == 0.75
+        assert parsed["failed_names"] == ["tests.test_x::test_b"]
+
+    def test_parse_junit_xml_missing(self, tmp_path):
+        """A missing report returns None so callers fall back to text parsing."""
+        discovery = test_discovery.TestDiscovery(project_root=str(tmp_path))
+        assert discovery._parse_junit_xml(str(tmp_path / "nope.xml")) is None
+
+
+class TestChunkedRuns:
+    """Test _merge_run_results()."""
+
+    def test_merge_run_results(self):
+        """Chunked runs combine counts, failures and the slowest duration."""
+        ok = test_discovery.TestRunResult(True, 2, 2, 0, 0, 1.5, "a")
+        failed = test_discovery.TestRunResult(
+            False, 3, 1, 1, 1, 0.5, "b", failed_test_names=["t::x"]
+        )
+
+        merged = test_discovery._merge_run_results([ok, failed])
+
+        assert not merged.passed
+        assert (merged.total_tests, merged.passed_tests) == (5, 3)
+        assert (merged.failed_tests, merged.skipped_tests) == (1, 1)
+        assert merged.duration_seconds == 1.5
+        assert merged.failed_test_names == ["t::x"]
+
+
+class TestRelatedTestDiscovery:
+    """Test TestDiscovery.find_related_tests()."""
+
+    def test_finds_importing_tests(self, tmp_path):
+        """Absolute and relative imports of the target module are detected."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "mod.py").write_text("def f(): pass\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_abs.py").write_text(
+            "from src.mod import f\n\ndef test_f():\n    f()\n"
+        )
+        (tmp_path / "src" / "test_rel.py").write_text(
+            "from .mod import (\n    f,\n)\n"
+        )
+        (tmp_path / "tests" / "test_from_package.py").write_text(
+            "from src import mod\n"
+        )
+        (tmp_path / "tests" / "test_unrelated.py").write_text(
+            "import os\n\ndef test_os():\n    pass\n"
+        )
+
+        discovery = test_discovery.TestDiscovery(project_root=str(tmp_path))
+        related = {t.path for t in discovery.find_related_tests("src/mod.py")}
+
+        assert related == {
+            str(Path("tests") / "test_abs.py"),
+            str(Path("src") / "test_rel.py"),
+            str(Path("tests") / "test_from_package.py"),
+        }
+
+    def test_related_tests_cached_on_disk(self, tmp_path):
+        """Results persist across instances until a test file changes."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "mod.py").write_text("def f(): pass\n")
+        test_file = project / "test_a.py"
+        test_file.write_text("import mod\n")
+
+        def discovery():
+            return test_discovery.TestDiscovery(
+                project_root=str(project), cache_dir=str(tmp_path / "cache")
+            )
+
+        first = discovery()
+        assert [t.path for t in first.find_related_tests("mod.py")] == ["test_a.py"]
+        # The cache lives outside the project tree
+        assert sorted(p.name for p in project.iterdir()) == ["mod.py", "test_a.py"]
+
+        second = discovery()
+        assert "mod.py" in second._load_related_cache()
+        assert [t.path for t in second.find_related_tests("mod.py")] == ["test_a.py"]
+
+        test_file.write_text("import os\n")
+        third = discovery()
+        assert third.find_related_tests("mod.py") == []
+
+    def test_related_tests_from_threads(self, tmp_path):
+        """Concurrent lookups all land in the persisted cache."""
+        for n in range(16):
+            (tmp_path / f"mod{n:02d}.py").write_text("")
+            (tmp_path / f"test_mod{n:02d}.py").write_text(f"import mod{n:02d}\n")
+        cache_dir = tmp_path / "cache"
+        discovery = test_discovery.TestDiscovery(
+            project_root=str(tmp_path), cache_dir=str(cache_dir)
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            found = list(executor.map(
+                discovery.find_related_tests, [f"mod{n:02d}.py" for n in range(16)]
+            ))
+
+        assert [[t.path for t in tests] for tests in found] == [
+            [f"test_mod{n:02d}.py"] for n in range(16)
+        ]
+        reloaded = test_discovery.TestDiscovery(
+            project_root=str(tmp_path), cache_dir=str(cache_dir)
+        )
+        assert len(reloaded._load_related_cache()) == 16
+
+    def test_file_cache_invalidated_on_change(self, tmp_path):
+        """Cached scan results are refreshed when the test file changes."""
+        test_file = tmp_path / "test_mod.py"
+        test_file.write_text("def test_a():\n    pass\n")
+
+        discovery = test_discovery.TestDiscovery(project_root=str(tmp_path))
+        assert discovery._count_tests_in_file("test_mod.py") == 1
+
+        test_file.write_text("def test_a():\n    pass\n\ndef test_b():\n    pass\n")
+        assert discovery._count_tests_in_file("test_mod.py") == 2
+
+
+class TestWriteFileAtomic:
+    """Test write_file_atomic()."""
+
+    def test_writes_through_symlink(self, tmp_path):
+        """A symlinked target is updated and the link itself survives."""
+        real = tmp_path / "real.py"
+        real.write_text("x = 1\n")
+        link = tmp_path / "link.py"
+        link.symlink_to(real)
+
+        write_file_atomic(link, "x = 2\n")
+
+        assert link.is_symlink()
+        assert real.read_text() == "x = 2\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["link.py", "real.py"]
+
+    def test_concurrent_writers_do_not_collide(self, tmp_path):
+        """Writers to the same path each stage their own file."""
+        target = tmp_path / "cache.json"
+        contents = [str(n) * 10_000 for n in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda c: write_file_atomic(target, c), contents))
+
+        assert target.read_text() in contents
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+class TestEditValidator:
+    """Test EditValidator.validate_edit() and validate_edit_async()."""
+
+    def test_async_matches_sync(self, tmp_path):
+        """Both entry points agree, and syntax errors stop validation early."""
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=False
+        )
+
+        for content, valid in [("x = 1\n", True), ("def broken(:\n", False)]:
+            sync_result = validator.validate_edit("mod.py", "", content)
+            async_result = asyncio.run(
+                validator.validate_edit_async("mod.py", "", content)
+            )
+
+            assert sync_result.valid is valid
+            assert async_result.valid is valid
+            assert async_result.errors == sync_result.errors
+            assert async_result.test_result is None
+
+    def test_cosmetic_edit_skips_tests(self, tmp_path):
+        """Reformatting and docstring edits don't run the test suite."""
+        validator = EditValidator(project_root=str(tmp_path), run_type_check=False)
+        original = "def f(x: int) -> int:\n    return x + 1\n"
+        cosmetic = 'def f(x):\n    """Add one."""\n    return (x+1)  # bump\n'
+
+        result = validator.validate_edit("mod.py", original, cosmetic)
+
+        assert result.valid
+        assert result.test_result.output.startswith("Skipped")
+        assert not _is_test_neutral(
+            "mod.py", original, "def f(x):\n    return x + 2\n"
+        )
+
+    def test_type_check_passes_on_filtered_errors(self, tmp_path):
+        """Errors only in imported modules don't fail the edited file."""
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=True
+        )
+        validator._dmypy_available = False
+        # mypy exits 1 for the import, but nothing is reported for a.py
+        validator._stream_mypy = lambda *args, **kwargs: (1, [])
+        assert validator._run_type_check("a.py", "x = 1\n") == {
+            "passed": True, "errors": []
+        }
+
+        validator._stream_mypy = lambda *args, **kwargs: (1, ["a.py:1: error"])
+        assert not validator._run_type_check("a.py", "x: str = 1\n")["passed"]
+
+        async def stream(*args, **kwargs):
+            return 1, []
+        validator._stream_mypy_async = stream
+        assert asyncio.run(
+            validator._run_type_check_async("a.py", "x = 1\n")
+        )["passed"]
+
+    def test_deferred_type_checks_wait_for_flush(self, tmp_path):
+        """Deferred edits get their type check result on flush."""
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=True
+        )
+        validator._mypy_available = True
+        validator._type_check = lambda file_path, content: {"passed": True}
+
+        result = validator.validate_edit("a.txt", "", "", defer_type_check=True)
+        assert result.type_check_result is None
+
+        assert validator.flush_type_checks() == [result]
+        assert result.type_check_result == {"passed": True}
+        assert validator.flush_type_checks() == []
+
+    def test_large_edit_syntax_checked_by_region(self, tmp_path):
+        """Region parsing accepts valid edits and defers errors to a full parse."""
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=False
+        )
+        original = "".join(
+            f"def f{i}(x):\n    return x + {i}\n\n" for i in range(500)
+        )
+        valid = original.replace("return x + 250\n", "return x * 2\n")
+        broken = original.replace("return x + 250\n", "return (x * 2\n")
+
+        assert validator._changed_region_parses("big.py", original, valid)
+        assert validator.validate_edit("big.py", original, valid).valid
+
+        assert not validator._changed_region_parses("big.py", original, broken)
+        result = validator.validate_edit("big.py", original, broken)
+        assert not result.valid
+        assert result.syntax_result.errors[0].line == 752
+
+    def test_no_related_tests_skips_disk(self, tmp_path):
+        """Without related tests the edit is never written to the project."""
+        validator = EditValidator(project_root=str(tmp_path), run_type_check=False)
+
+        result = validator.validate_edit("new_mod.py", "", "x = 1\n")
+
+        assert result.test_result.output == "No related tests found"
+        assert not (tmp_path / "new_mod.py").exists()
+
+    def test_validate_edits_batch(self, tmp_path):
+        """Batch results come back in input order with syntax gating."""
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=False
+        )
+
+        results = validator.validate_edits_batch([
+            ("a.py", "", "x = 1\n"),
+            ("b.py", "", "def broken(:\n"),
+            ("c.json", "", '{"a": 1}'),
+        ])
+
+        assert [r.valid for r in results] == [True, False, True]
+
+    def test_batch_type_checks_finish_before_tests(self, tmp_path, monkeypatch):
+        """No type check runs while a test run has an edit written out."""
+        validator = EditValidator(project_root=str(tmp_path))
+        validator._mypy_available = True
+        events = []
+
+        def type_check(file_path, content):
+            events.append("type")
+            return {"passed": True}
+
+        def run_tests(file_path, original, content):
+            events.append("tests")
+            return None
+
+        monkeypatch.setattr(validator, "_type_check", type_check)
+        monkeypatch.setattr(validator, "_validate_with_tests", run_tests)
+
+        validator.validate_edits_batch(
+            [(f"m{n}.py", "", f"x = {n}\n") for n in range(3)]
+        )
+
+        assert events == ["type"] * 3 + ["tests"] * 3
+
+    def test_warm_up_is_opt_in(self, tmp_path):
+        """Validators don't warm by default, and sandboxes never do."""
+        assert EditValidator(project_root=str(tmp_path))._warm_thread is None
+
+        parent = EditValidator(
+            project_root=str(tmp_path), run_type_check=False, warm_type_check=True
+        )
+        with SandboxValidator(parent) as sandbox:
+            assert not sandbox._sandbox_validator.warm_type_check
+            assert sandbox._sandbox_validator._warm_thread is None
+
+    def test_sandbox_edit_leaves_project_untouched(self, tmp_path):
+        """Linked sandbox files are unlinked before the edit is written."""
+        (tmp_path / "mod.py").write_text("x = 1\n")
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=False
+        )
+
+        with SandboxValidator(validator, copy_full_project=True) as sandbox:
+            result = sandbox.validate_edit("mod.py", "x = 2\n")
+            unchanged = sandbox.validate_edit("mod.py", "x = 1\n")
+
+        assert result.valid
+        assert (tmp_path / "mod.py").read_text() == "x = 1\n"
+        assert unchanged.valid and unchanged.syntax_result.valid
+
+    def test_sandbox_writes_stay_in_sandbox(self, tmp_path, monkeypatch):
+        """Without reflinks, only read-only files are hardlinked."""
+        monkeypatch.setattr(validator_module, "_reflink_supported", False)
+        (tmp_path / "data.txt").write_text("original\n")
+        (tmp_path / "frozen.txt").write_text("frozen\n")
+        (tmp_path / "frozen.txt").chmod(0o444)
+        validator = EditValidator(
+            project_root=str(tmp_path), run_tests=False, run_type_check=False
+        )
+
+        with SandboxValidator(validator, copy_full_project=True) as sandbox:
+            sandbox_dir = Path(sandbox._sandbox_dir)
+            (sandbox_dir / "data.txt").write_text("changed\n")
+            frozen = (sandbox_dir / "frozen.txt").stat()
+
+        assert (tmp_path / "data.txt").read_text() == "original\n"
+        assert frozen.st_ino == (tmp_path / "frozen.txt").stat().st_ino
+
+    def test_sandbox_edit_does_not_follow_symlinks_out(self, tmp_path):
+        """Links leaving the project are copied; links within it stay links."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "shared.py").write_text("X = 1\n")
+        project = tmp_path / "project"
+        (project / "pkg").mkdir(parents=True)
+        (project / "pkg" / "real.py").write_text("Y = 1\n")
+        (project / "shared.py").symlink_to(outside / "shared.py")
+        (project / "alias.py").symlink_to(Path("pkg") / "real.py")
+        validator = EditValidator(
+            project_root=str(project), run_tests=False, run_type_check=False
+        )
+
+        with SandboxValidator(validator, copy_full_project=True) as sandbox:
+            assert sandbox.validate_edit("shared.py", "X = 2\n").valid
+            assert sandbox.validate_edit("alias.py", "Y = 2\n").valid
+            sandbox_dir = Path(sandbox._sandbox_dir)
+            assert (sandbox_dir / "alias.py").is_symlink()
+            assert (sandbox_dir / "alias.py").resolve() == (
+                sandbox_dir / "pkg" / "real.py"
+            ).resolve()
+
+        assert (outside / "shared.py").read_text() == "X = 1\n"
+        assert (project / "pkg" / "real.py").read_text() == "Y = 1\n"
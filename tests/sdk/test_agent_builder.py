@@ -0,0 +1,569 @@
+"""
+Tests for the SDK agent builder (agents, orchestrators, swarms).
+"""
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from interpreter.sdk import agent_builder
+from interpreter.sdk.agent_builder import (
+    Agent,
+    AgentBuilder,
+    AgentResult,
+    AsyncTokenBucket,
+    BatchAPIOrchestrator,
+    EmbeddingBatcher,
+    HistoryStore,
+    ParallelOrchestrator,
+    ResultCache,
+    SemanticCache,
+    Swarm,
+)
+
+
+class FakeInterpreter:
+    """Stands in for OpenInterpreter: echoes the prompt back as a message."""
+
+    delay = 0.0
+
+    calls = 0
+    created = 0
+
+    def __init__(self):
+        self.messages = []
+        self.llm = SimpleNamespace()
+        FakeInterpreter.created += 1
+
+    def chat(self, message=None, stream=True, display=False):
+        if isinstance(message, list):
+            self.messages = message
+            message = message[-1]["content"]
+        else:
+            self.messages.append({"role": "user", "content": message})
+        FakeInterpreter.calls += 1
+        time.sleep(self.delay)
+        if message == "fail":
+            raise RuntimeError("boom")
+        yield {"role": "assistant", "type": "message", "content": f"echo:{message}"}
+        yield {"role": "computer", "type": "console", "content": "done"}
+
+
+@pytest.fixture(autouse=True)
+def fake_interpreter(monkeypatch):
+    """Agents (and their clones) talk to a FakeInterpreter."""
+    monkeypatch.setattr(FakeInterpreter, "calls", 0)
+    monkeypatch.setattr(FakeInterpreter, "created", 0)
+    monkeypatch.setattr(agent_builder, "_new_interpreter", FakeInterpreter)
+
+
+def make_agent(builder, name):
+    return builder.create_agent(name, "system prompt")
+
+
+class TestBatchExecution:
+    """Test Agent.execute_batch() and Swarm.execute_batch()."""
+
+    def test_agent_batch_preserves_order(self):
+        """Results line up with tasks, and clone history is merged back."""
+        agent = make_agent(AgentBuilder(), "solo")
+        tasks = [f"task {i}" for i in range(5)]
+
+        results = asyncio.run(agent.execute_batch(tasks, max_concurrency=3))
+
+        assert [r.output for r in results] == [
+            f"echo:{t}\n[output] done" for t in tasks
+        ]
+        assert sorted(h["task"] for h in agent.get_history()) == sorted(tasks)
+
+    def test_parallel_swarm_batch(self):
+        """Every agent answers every task, grouped per task."""
+        builder = AgentBuilder()
+        agents = [make_agent(builder, "a"), make_agent(builder, "b")]
+        swarm = builder.create_swarm(agents, orchestrator=ParallelOrchestrator())
+
+        results = asyncio.run(swarm.execute_batch(["x", "y"]))
+
+        assert [sorted(r) for r in results] == [["a", "b"], ["a", "b"]]
+        assert results[1]["b"].output.startswith("echo:y")
+
+
+class TestHistoryStore:
+    """Test the columnar HistoryStore."""
+
+    def test_entries_round_trip(self):
+        """Entries rebuild with their fields; old messages are dropped."""
+        history = HistoryStore(max_messages=1)
+        now = datetime.now()
+        for i in range(3):
+            history.append(f"t{i}", AgentResult(
+                success=i != 1,
+                output=f"out{i}",
+                messages=[{"content": i}],
+                execution_time=float(i),
+                tokens_used=10 * i,
+                error="boom" if i == 1 else None,
+            ), now)
+
+        entries = history.to_list()
+
+        assert [e["task"] for e in entries] == ["t0", "t1", "t2"]
+        assert entries[1]["result"].error == "boom"
+        assert entries[2]["result"].tokens_used == 20
+        assert entries[2]["timestamp"] == now
+        assert [e["result"].messages for e in entries] == [None, None, [{"content": 2}]]
+
+    def test_view_is_live_and_read_only(self):
+        """get_history() views follow new entries without copying."""
+        agent = make_agent(AgentBuilder(), "solo")
+        history = agent.get_history()
+
+        agent.execute_sync("one")
+        agent.execute_sync("two")
+
+        assert len(history) == 2
+        assert history[-1]["task"] == "two"
+        assert [e["task"] for e in history[:1]] == ["one"]
+        assert not hasattr(history, "append")
+
+    def test_stats(self):
+        """Stats summarize every entry, with an interpolated p95."""
+        history = HistoryStore()
+        for i in range(1, 11):
+            result = AgentResult(
+                success=i > 2, output="", execution_time=float(i), tokens_used=i
+            )
+            history.append("t", result, datetime.now())
+
+        stats = history.stats()
+
+        assert stats["count"] == 10
+        assert stats["success_rate"] == 0.8
+        assert stats["mean_execution_time"] == 5.5
+        assert abs(stats["p95_execution_time"] - 9.55) < 1e-9
+        assert stats["total_tokens"] == 55
+        assert HistoryStore().stats() == {"count": 0}
+
+
+class TestConfigCopies:
+    """Test that clones and template agents get independent configs."""
+
+    def test_clone_copies_tool_list(self):
+        """Clones can change their tools without touching the original."""
+        agent = AgentBuilder().create_agent("orig", "prompt", tools=["read"])
+
+        clone = agent.clone("copy")
+        clone.config.tools.append("write")
+
+        assert clone.config.name == "copy"
+        assert agent.config.tools == ["read"]
+        assert agent.clone().config.name == "orig"
+
+    def test_template_not_mutated(self):
+        """Overrides apply to the new agent only."""
+        builder = AgentBuilder()
+
+        agent = builder.from_template("scout", name="s2", temperature=0.9)
+        agent.config.tools.append("write")
+
+        template = AgentBuilder.TEMPLATES["scout"]
+        assert (agent.config.name, agent.config.temperature) == ("s2", 0.9)
+        assert (template.name, template.temperature) == ("scout", 0.3)
+        assert "write" not in template.tools
+
+
+class TestInterpreterPool:
+    """Test AgentBuilder.acquire() and its use by batch workers."""
+
+    def test_batch_clones_reuse_pooled_interpreters(self):
+        """Repeated batches construct clone interpreters only once."""
+        agent = make_agent(AgentBuilder(), "solo")
+
+        agent.execute_batch_sync(["a", "b", "c"], max_concurrency=3)
+        agent.execute_batch_sync(["d", "e", "f"], max_concurrency=3)
+
+        # One for the agent's own conversation, two pooled for the clones
+        assert FakeInterpreter.created == 3
+
+    def test_released_interpreter_is_reset(self):
+        """Borrowed interpreters come back with no conversation or kernels."""
+        builder = AgentBuilder()
+        config = make_agent(builder, "a").config
+
+        terminated = []
+        config.max_tokens = 512
+
+        with builder.acquire(config) as interp:
+            interp.messages.append({"role": "user", "content": "hi"})
+            interp.computer = SimpleNamespace(terminate=lambda: terminated.append(1))
+            assert interp.llm.max_tokens == 512
+        assert terminated == [1]
+
+        config.max_tokens = None
+        with builder.acquire(config) as again:
+            assert again is interp
+            assert again.messages == []
+            assert again.system_message == "system prompt"
+            assert again.llm.max_tokens is None
+
+
+class TestStreamingExecution:
+    """Test that chat runs off the event loop, and Agent.stream()."""
+
+    def test_parallel_agents_overlap(self, monkeypatch):
+        """Blocking chat calls run concurrently instead of back to back."""
+        monkeypatch.setattr(FakeInterpreter, "delay", 0.2)
+        builder = AgentBuilder()
+        agents = [make_agent(builder, str(i)) for i in range(4)]
+        swarm = builder.create_swarm(agents, orchestrator=ParallelOrchestrator())
+
+        start = time.perf_counter()
+        results = asyncio.run(swarm.execute("task"))
+
+        assert time.perf_counter() - start < 0.6
+        assert all(r.success for r in results.values())
+
+    def test_stream_yields_sse_events(self):
+        """Deltas are streamed as SSE events, ending with the result."""
+        agent = make_agent(AgentBuilder(), "solo")
+
+        async def collect():
+            return [event async for event in agent.stream("hi")]
+
+        events = asyncio.run(collect())
+        payloads = [json.loads(e[len("data: "):]) for e in events]
+
+        assert all(e.startswith("data: ") and e.endswith("\n\n") for e in events)
+        assert [p["content"] for p in payloads[:2]] == ["echo:hi", "done"]
+        assert payloads[-1]["type"] == "result" and payloads[-1]["success"]
+        assert agent.get_history()[0]["result"].output == ""
+
+    def test_execute_stream_yields_text(self):
+        """Plain deltas stream out; full output is kept only on request."""
+        agent = make_agent(AgentBuilder(), "solo")
+        agent.config.collect_full_output = True
+
+        async def collect():
+            return [text async for text in agent.execute_stream("hi")]
+
+        assert asyncio.run(collect()) == ["echo:hi", "[output] done"]
+        assert agent.get_history()[0]["result"].output == "echo:hi\n[output] done"
+        assert agent.get_history()[0]["result"].messages is None
+
+    def test_early_stop_waits_for_chat_thread(self):
+        """Stopping early terminates running code and joins the worker."""
+        agent = make_agent(AgentBuilder(), "solo")
+        events = []
+
+        class SlowInterpreter:
+            computer = SimpleNamespace(terminate=lambda: events.append("terminate"))
+
+            def chat(self, message=None, stream=True, display=False):
+                try:
+                    yield {"role": "assistant", "type": "message", "content": "a"}
+                    time.sleep(0.2)
+                    yield {"role": "assistant", "type": "message", "content": "b"}
+                finally:
+                    events.append("closed")
+
+        agent._interpreter = SlowInterpreter()
+
+        async def run():
+            chat = agent._achat("hi")
+            await chat.__anext__()
+            await chat.aclose()
+            events.append("returned")
+
+        asyncio.run(run())
+
+        assert events == ["terminate", "closed", "returned"]
+
+    def test_chat_error_is_reported(self):
+        """Exceptions raised inside the chat thread fail the result."""
+        agent = make_agent(AgentBuilder(), "solo")
+
+        result = agent.execute_sync("fail")
+
+        assert not result.success
+        assert result.error == "boom"
+
+
+class TestSemanticCache:
+    """Test SemanticCache and its use in Agent.execute()."""
+
+    def test_nearest_prompt_above_threshold(self):
+        """Lookups return the closest entry only when it is close enough."""
+        cache = SemanticCache(
+            min_proximity=0.9, embed=lambda text: [text.count("a"), text.count("b")]
+        )
+        cache.set("aaaa", AgentResult(success=True, output="a"))
+        cache.set("bbbb", AgentResult(success=True, output="b"))
+
+        assert cache.get("aaab").output == "a"
+        assert cache.get("abab") is None
+
+    def test_oldest_entry_overwritten(self):
+        """Beyond max_entries the oldest result is replaced."""
+        cache = SemanticCache(max_entries=2)
+        for word in ["alpha", "beta", "gamma"]:
+            cache.set(word, AgentResult(success=True, output=word))
+
+        assert len(cache) == 2
+        assert cache.get("alpha") is None
+        assert cache.get("gamma").output == "gamma"
+
+    def test_fallback_only_matches_same_text(self, monkeypatch):
+        """Without sentence-transformers, reordered words are a miss."""
+        monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+        cache = SemanticCache(min_proximity=0.5)
+        cache.set("delete a.py, keep b.py", AgentResult(success=True, output="x"))
+
+        assert cache.get("Delete a.py,  keep b.py").output == "x"
+        assert cache.get("delete b.py, keep a.py") is None
+
+    def test_concurrent_embeds_share_one_call(self):
+        """Requests inside the batch window are embedded together."""
+        calls = []
+
+        def embed_batch(texts):
+            calls.append(list(texts))
+            return [[len(text)] for text in texts]
+
+        batcher = EmbeddingBatcher(embed_batch, batch_window_ms=5, max_batch_size=3)
+
+        async def embed_all():
+            return await asyncio.gather(*(batcher.embed("x" * n) for n in range(5)))
+
+        assert asyncio.run(embed_all()) == [[n] for n in range(5)]
+        assert [len(batch) for batch in calls] == [3, 2]
+
+    def test_repeat_task_skips_interpreter(self):
+        """A repeated task is answered from the cache."""
+        agent = AgentBuilder().create_agent(
+            "cached", "system prompt", semantic_cache_enabled=True
+        )
+
+        first = agent.execute_sync("review auth.py")
+        second = agent.execute_sync("Review auth.py")
+
+        assert FakeInterpreter.calls == 1
+        assert second.output == first.output
+        assert len(agent.get_history()) == 2
+
+    def test_result_cache_survives_new_agents(self, tmp_path, monkeypatch):
+        """A fresh agent with the same config reuses results stored on disk."""
+        monkeypatch.setattr(
+            agent_builder, "ResultCache", lambda: ResultCache(tmp_path)
+        )
+        builder = AgentBuilder()
+        outputs = []
+        for prompt in ["system prompt", "system prompt", "other prompt"]:
+            agent = builder.create_agent(
+                "ci", prompt, persistent_cache=True, collect_full_output=True
+            )
+            outputs.append(agent.execute_sync("review auth.py").output)
+
+        assert FakeInterpreter.calls == 2
+        assert outputs[0] == outputs[1]
+        assert (tmp_path / "broken").write_bytes(b"junk")
+        assert ResultCache(tmp_path).get("broken") is None
+
+
+class TestSyncWrappers:
+    """Test the synchronous execute_sync() wrappers."""
+
+    def test_repeated_calls_share_a_loop(self):
+        """Back-to-back calls reuse the thread's loop and the agent lock."""
+        agent = make_agent(AgentBuilder(), "solo")
+
+        assert agent.execute_sync("one").success
+        lock = agent._execute_lock
+        assert agent.execute_sync("two").success
+        assert agent._execute_lock is lock
+
+    def test_calls_from_threads_are_serialized(self, monkeypatch):
+        """Each thread runs its own loop, yet the agent runs one task at a time."""
+        active, peak = [0], [0]
+
+        class Tracking(FakeInterpreter):
+            delay = 0.05
+
+            def chat(self, *args, **kwargs):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                try:
+                    yield from super().chat(*args, **kwargs)
+                finally:
+                    active[0] -= 1
+
+        monkeypatch.setattr(agent_builder, "_new_interpreter", Tracking)
+        agent = make_agent(AgentBuilder(), "solo")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(agent.execute_sync, ["a", "b", "c"]))
+
+        assert all(r.success for r in results)
+        assert peak[0] == 1
+
+    def test_running_loop_rejected(self):
+        """Calling from inside a coroutine raises instead of deadlocking."""
+        agent = make_agent(AgentBuilder(), "solo")
+
+        async def call():
+            agent.execute_sync("task")
+
+        with pytest.raises(RuntimeError, match="await the async version"):
+            asyncio.run(call())
+
+
+class TestSequentialOrchestrator:
+    """Test context handoff between sequential agents."""
+
+    def test_output_passed_as_messages(self):
+        """Each agent sees the previous output as its own message."""
+        builder = AgentBuilder()
+        agents = [make_agent(builder, "a"), make_agent(builder, "b")]
+        swarm = builder.create_swarm(agents)
+
+        results = swarm.execute_sync("task")
+
+        assert results["b"].output.startswith("echo:task")
+        assert [m["content"] for m in agents[1].interpreter.messages] == [
+            "Previous agent (a) output:",
+            results["a"].output,
+            "task",
+        ]
+
+
+class TestParallelOrchestrator:
+    """Test ParallelOrchestrator concurrency and rate limits."""
+
+    def test_max_concurrency_bounds_in_flight(self, monkeypatch):
+        """No more than max_concurrency agents execute at once."""
+        in_flight = []
+        peak = []
+
+        async def execute(self, task, context=None, stream=False):
+            in_flight.append(self)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(self)
+            return AgentResult(success=True, output=self.name)
+
+        monkeypatch.setattr(Agent, "execute", execute)
+        builder = AgentBuilder()
+        agents = [make_agent(builder, str(i)) for i in range(6)]
+
+        results = asyncio.run(
+            ParallelOrchestrator(max_concurrency=2).run(agents, "task")
+        )
+
+        assert max(peak) == 2
+        assert list(results) == [str(i) for i in range(6)]
+
+    def test_rate_limit_spaces_starts(self):
+        """Execution starts are spaced 60 / rate_limit_rpm seconds apart."""
+        builder = AgentBuilder()
+        agents = [make_agent(builder, str(i)) for i in range(3)]
+        orchestrator = ParallelOrchestrator(rate_limit_rpm=600)
+
+        start = time.perf_counter()
+        results = asyncio.run(orchestrator.run(agents, "task"))
+
+        assert time.perf_counter() - start >= 0.2
+        assert all(r.success for r in results.values())
+
+    def test_swarm_bucket_gates_provider_calls(self):
+        """Agents on a rate-limited provider share one bucket; others don't."""
+        builder = AgentBuilder()
+        limited = [make_agent(builder, str(i)) for i in range(3)]
+        local = builder.create_agent("local", "system prompt", model="ollama/llama3")
+        bucket = AsyncTokenBucket(rate_per_sec=10, burst=1)
+        swarm = Swarm(
+            limited + [local],
+            ParallelOrchestrator(),
+            rate_limits={"openai": bucket},
+        )
+
+        start = time.perf_counter()
+        results = swarm.execute_sync("task")
+
+        assert time.perf_counter() - start >= 0.2
+        assert all(r.success for r in results.values())
+        assert all(agent._bucket is bucket for agent in limited)
+        assert local._bucket is None
+
+
+class FakeBatchClient:
+    """Minimal OpenAI client: the batch completes on the first poll."""
+
+    def __init__(self):
+        self.requests = []
+        self.files = self
+        self.batches = self
+
+    def create(self, **kwargs):
+        if "purpose" in kwargs:
+            self.requests = [
+                json.loads(line) for line in kwargs["file"][1].decode().splitlines()
+            ]
+            return SimpleNamespace(id="file-in")
+        return SimpleNamespace(id="batch-1", status="in_progress")
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(
+            id=batch_id,
+            status="completed",
+            output_file_id="file-out",
+            error_file_id=None,
+        )
+
+    def content(self, file_id):
+        lines = []
+        for request in self.requests:
+            prompt = request["body"]["messages"][-1]["content"]
+            if prompt == "fail":
+                response = {"status_code": 400, "body": {"error": "bad request"}}
+            else:
+                message = {"content": f"{request['custom_id']}={prompt}"}
+                response = {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [{"message": message}],
+                        "usage": {"total_tokens": 7},
+                    },
+                }
+            lines.append(json.dumps({
+                "id": "req",
+                "custom_id": request["custom_id"],
+                "response": response,
+            }))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class TestBatchAPIOrchestrator:
+    """Test BatchAPIOrchestrator request building and demuxing."""
+
+    def test_results_demuxed_by_custom_id(self):
+        """Every (agent, task) request maps back to its own result."""
+        builder = AgentBuilder()
+        agents = [make_agent(builder, "a"), make_agent(builder, "b")]
+        client = FakeBatchClient()
+        swarm = builder.create_swarm(
+            agents,
+            orchestrator=BatchAPIOrchestrator(client=client, poll_interval=0),
+        )
+
+        results = swarm.execute_batch_sync(["x", "fail"])
+
+        assert len(client.requests) == 4
+        assert results[0]["b"].output == "b:0=x"
+        assert results[0]["a"].tokens_used == 7
+        assert not results[1]["a"].success
+        assert results[1]["a"].error == "bad request"
+        assert FakeInterpreter.calls == 0
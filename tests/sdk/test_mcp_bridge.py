@@ -0,0 +1,797 @@
+"""
+Tests for the SDK MCP bridge (client, tool discovery, bridge).
+"""
+import asyncio
+import io
+import itertools
+import json
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from interpreter.sdk import mcp_bridge
+from interpreter.sdk.mcp_bridge import (
+    MCPBridge,
+    MCPCallResult,
+    MCPClient,
+    MCPServer,
+    MCPServerHandler,
+    MCPTool,
+    MCPToolAdapter,
+    MCPTransport,
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+MCP_BRIDGE_PATH = mcp_bridge.__file__
+
+# Minimal stdio MCP server: logs each method it receives to argv[1] and
+# answers tools/call from a thread, so slow calls overlap
+FAKE_SERVER = textwrap.dedent(
+    """
+    import json, os, sys, threading, time
+
+    log = open(sys.argv[1], "a")
+    out = threading.Lock()
+
+    def reply(request, result, delay=0.0):
+        params = request.get("params") or {}
+        token = params.get("_meta", {}).get("progressToken")
+        steps = params.get("arguments", {}).get("steps", 0)
+        for step in range(steps):
+            note = {"progressToken": token, "progress": step + 1}
+            with out:
+                print(json.dumps({"method": "notifications/progress", "params": note}))
+                sys.stdout.flush()
+        time.sleep(delay)
+        with out:
+            print(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}))
+            sys.stdout.flush()
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        if isinstance(request, list):
+            log.write("batch\\n")
+            log.flush()
+            responses = [
+                {"jsonrpc": "2.0", "id": r["id"], "result": {"content": r["params"]}}
+                for r in request
+            ]
+            with out:
+                print(json.dumps(responses))
+                sys.stdout.flush()
+            continue
+        log.write(request["method"] + "\\n")
+        log.flush()
+        if request["method"] == "tools/list":
+            reply(request, {"tools": [{"name": "echo", "description": "Echo"}]})
+        elif request["method"] == "tools/call":
+            arguments = request["params"]["arguments"]
+            threading.Thread(
+                target=reply,
+                args=(request, {"content": arguments}, arguments.get("sleep", 0)),
+            ).start()
+        else:
+            time.sleep(float(os.environ.get("FAKE_DELAY", "0")))
+            reply(request, {"capabilities": {}})
+    """
+)
+
+
+def fake_server(tmp_path, name="fake", **env):
+    log = tmp_path / f"{name}.log"
+    server = MCPServer(
+        name=name,
+        command=sys.executable,
+        args=["-c", FAKE_SERVER, str(log)],
+        env=env,
+    )
+    return server, log
+
+
+class TestToolDiscoveryCache:
+    """Test MCPClient's on-disk tool catalog cache."""
+
+    def test_second_connect_skips_tools_list(self, tmp_path):
+        """Warm connects load tools from disk instead of calling tools/list."""
+        server, log = fake_server(tmp_path)
+
+        async def connect_twice():
+            tools = []
+            for _ in range(2):
+                client = MCPClient(server, tool_cache_dir=tmp_path / "cache")
+                assert await client.connect()
+                tools.append([tool.name for tool in client.get_tools()])
+                await client.disconnect()
+            return tools
+
+        assert asyncio.run(connect_twice()) == [["echo"], ["echo"]]
+        assert log.read_text().split().count("tools/list") == 1
+
+    def test_failed_initialize_drops_cache_and_process(self, tmp_path):
+        """An initialize error clears the cache entry and doesn't connect."""
+        server, _ = fake_server(tmp_path)
+        cache_dir = tmp_path / "cache"
+        script = textwrap.dedent(
+            """
+            import json, sys
+
+            for line in sys.stdin:
+                request = json.loads(line)
+                error = {"code": -32603, "message": "broken"}
+                print(json.dumps(
+                    {"jsonrpc": "2.0", "id": request["id"], "error": error}
+                ), flush=True)
+            """
+        )
+
+        async def run():
+            warm = MCPClient(server, tool_cache_dir=cache_dir)
+            assert await warm.connect()
+            await warm.disconnect()
+
+            server.args = ["-c", script]
+            broken = MCPClient(server, tool_cache_dir=cache_dir)
+            broken._tool_cache_key = warm._tool_cache_key
+            connected = await broken.connect()
+            return broken, connected, warm._load_cache()
+
+        broken, connected, cached = asyncio.run(run())
+
+        assert not connected and not broken.connected
+        assert broken._process is None and broken._reader_task is None
+        assert cached is None
+
+    def test_changed_config_misses_cache(self, tmp_path):
+        """A different server config gets its own cache entry."""
+        server, _ = fake_server(tmp_path)
+        other = MCPServer(
+            name="fake", command=server.command, args=server.args, env={"X": "1"}
+        )
+        cache_dir = tmp_path / "cache"
+
+        assert (
+            MCPClient(server, tool_cache_dir=cache_dir)._tool_cache_key()
+            != MCPClient(other, tool_cache_dir=cache_dir)._tool_cache_key()
+        )
+        assert MCPClient(other, tool_cache_dir=cache_dir)._load_cache() is None
+
+    def test_env_overrides_reach_server(self, tmp_path, monkeypatch):
+        """Servers inherit the environment, with server.env layered on top."""
+        monkeypatch.setenv("MCP_TEST_INHERITED", "yes")
+        script = (
+            "import json, os, sys\n"
+            "for line in sys.stdin:\n"
+            "    r = json.loads(line)\n"
+            "    env = {k: os.environ.get(k) for k in ('MCP_TEST_INHERITED', 'X')}\n"
+            "    out = {'jsonrpc': '2.0', 'id': r['id'], 'result': {'env': env}}\n"
+            "    print(json.dumps(out), flush=True)\n"
+        )
+
+        async def init_result(env):
+            client = MCPClient(
+                MCPServer(
+                    name="env", command=sys.executable, args=["-c", script], env=env
+                ),
+                tool_cache_dir=None,
+            )
+            await client.connect()
+            result = await client._send_request("initialize", {})
+            await client.disconnect()
+            return result["env"]
+
+        assert asyncio.run(init_result({})) == {
+            "MCP_TEST_INHERITED": "yes", "X": None
+        }
+        assert asyncio.run(init_result({"X": "1"})) == {
+            "MCP_TEST_INHERITED": "yes", "X": "1"
+        }
+
+
+class TestBridgeConnections:
+    """Test MCPBridge connection management."""
+
+    def test_servers_connect_concurrently(self, tmp_path):
+        """Slow handshakes overlap instead of adding up."""
+        servers = [
+            fake_server(tmp_path, f"s{i}", FAKE_DELAY="0.3")[0] for i in range(3)
+        ]
+        bridge = MCPBridge(tool_cache_dir=None)
+
+        async def run():
+            start = time.perf_counter()
+            connected = await bridge.connect_servers(servers)
+            elapsed = time.perf_counter() - start
+            await bridge.disconnect_all()
+            return connected, elapsed
+
+        connected, elapsed = asyncio.run(run())
+
+        assert connected == {"s0": True, "s1": True, "s2": True}
+        assert elapsed < 0.8
+        assert bridge.get_connected_servers() == []
+
+    def test_disconnect_all_overlaps_and_clears_state(self, tmp_path, monkeypatch):
+        """Slow shutdowns overlap, and no server state is left behind."""
+        servers = [fake_server(tmp_path, f"s{i}")[0] for i in range(3)]
+        bridge = MCPBridge(tool_cache_dir=None)
+        disconnect = MCPClient.disconnect
+
+        async def slow_disconnect(self):
+            await asyncio.sleep(0.2)
+            await disconnect(self)
+
+        async def run():
+            await bridge.connect_servers(servers)
+            clients = list(bridge._clients.values())
+            bridge.get_tool_definitions()
+            monkeypatch.setattr(MCPClient, "disconnect", slow_disconnect)
+            start = time.perf_counter()
+            await bridge.disconnect_all()
+            return clients, time.perf_counter() - start
+
+        clients, elapsed = asyncio.run(run())
+
+        assert elapsed < 0.4
+        assert not any(client.connected for client in clients)
+        assert bridge._clients == bridge._adapters == bridge._tool_index == {}
+        assert bridge.get_tool_definitions() == []
+
+    def test_concurrent_calls_share_one_pipe(self, tmp_path):
+        """Calls on one server are serialized and matched to their responses."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None)
+
+        async def run():
+            await client.connect()
+            results = await asyncio.gather(
+                *(client.call_tool("echo", {"n": n}) for n in range(5))
+            )
+            await client.disconnect()
+            return results
+
+        assert [r.content for r in asyncio.run(run())] == [
+            {"n": n} for n in range(5)
+        ]
+
+    def test_handshake_does_not_block_loop(self, tmp_path):
+        """Other coroutines keep running while a server is slow to answer."""
+        server, _ = fake_server(tmp_path, FAKE_DELAY="0.3")
+        client = MCPClient(server, tool_cache_dir=None)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            await client.connect()
+            ticker.cancel()
+            await client.disconnect()
+
+        asyncio.run(run())
+
+        assert len(ticks) > 10
+
+    def test_bulk_calls_batched_per_server(self, tmp_path):
+        """Each server gets one batch; results keep the caller's order."""
+        servers = [fake_server(tmp_path, name)[0] for name in ("a", "b")]
+        bridge = MCPBridge(tool_cache_dir=None)
+        calls = [
+            ("a", "echo", {"n": 0}),
+            ("b", "echo", {"n": 1}),
+            ("missing", "echo", {}),
+            ("a", "echo", {"n": 3}),
+        ]
+
+        async def run():
+            await bridge.connect_servers(servers)
+            results = await bridge.call_tools(calls)
+            await bridge.disconnect_all()
+            return results
+
+        results = asyncio.run(run())
+
+        assert [r.success for r in results] == [True, True, False, True]
+        assert results[3].content == {"name": "echo", "arguments": {"n": 3}}
+        assert (tmp_path / "a.log").read_text().split().count("batch") == 1
+        # A lone call goes out as a plain request
+        assert (tmp_path / "b.log").read_text().split()[-1] == "tools/call"
+
+    def test_call_tool_any_uses_first_server_with_tool(self, tmp_path):
+        """The tool index falls back to the next server on disconnect."""
+        servers = [fake_server(tmp_path, name)[0] for name in ("a", "b")]
+        bridge = MCPBridge(tool_cache_dir=None)
+
+        async def run():
+            await bridge.connect_server(servers[0])
+            await bridge.connect_server(servers[1])
+            first = bridge._tool_index["echo"].server.name
+            await bridge.disconnect_server("a")
+            second = bridge._tool_index["echo"].server.name
+            result = await bridge.call_tool_any("echo", {"n": 1})
+            await bridge.disconnect_server("b")
+            missing = await bridge.call_tool_any("echo", {})
+            return first, second, result, missing
+
+        first, second, result, missing = asyncio.run(run())
+
+        assert (first, second) == ("a", "b")
+        assert result.content == {"n": 1}
+        assert not missing.success and bridge._tool_index == {}
+
+    def test_tool_definitions_rebuilt_on_connect(self, tmp_path):
+        """Definitions are reused between turns and refreshed on changes."""
+        servers = [fake_server(tmp_path, name)[0] for name in ("a", "b")]
+        bridge = MCPBridge(tool_cache_dir=tmp_path / "cache")
+
+        async def run():
+            await bridge.connect_server(servers[0])
+            first = bridge.get_tool_definitions()
+            again = bridge.get_tool_definitions()
+            await bridge.connect_server(servers[1])
+            both = bridge.get_tool_definitions()
+            await bridge.disconnect_all()
+            return first, again, both
+
+        first, again, both = asyncio.run(run())
+
+        assert again == first and again[0] is first[0]
+        assert [d["name"] for d in both] == ["echo", "echo"]
+        assert bridge.get_tool_definitions() == []
+
+    def test_call_tools_any_submits_before_awaiting(self, tmp_path):
+        """Calls fan out to their servers and overlap; unknown tools fail."""
+        server, _ = fake_server(tmp_path)
+        bridge = MCPBridge(tool_cache_dir=None)
+        calls = [("echo", {"sleep": 0.2}), ("nope", {}), ("echo", {"sleep": 0.2})]
+
+        async def run():
+            await bridge.connect_server(server)
+            start = time.perf_counter()
+            results = await bridge.call_tools_any(calls)
+            elapsed = time.perf_counter() - start
+            await bridge.disconnect_all()
+            return results, elapsed
+
+        results, elapsed = asyncio.run(run())
+
+        assert [r.success for r in results] == [True, False, True]
+        assert elapsed < 0.35
+
+
+class TestRequestPipelining:
+    """Test concurrent JSON-RPC requests on one server."""
+
+    def test_slow_calls_overlap(self, tmp_path):
+        """Responses arriving out of order reach the right callers."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None)
+        delays = [0.3, 0.1, 0.2, 0.0]
+
+        async def run():
+            await client.connect()
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(client.call_tool("echo", {"sleep": d}) for d in delays)
+            )
+            elapsed = time.perf_counter() - start
+            await client.disconnect()
+            return results, elapsed
+
+        results, elapsed = asyncio.run(run())
+
+        assert [r.content["sleep"] for r in results] == delays
+        assert elapsed < 0.5
+        assert client._pending == {}
+
+    def test_server_exit_fails_pending_calls(self, tmp_path):
+        """Calls waiting on a dead server return instead of hanging."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None)
+
+        async def run():
+            await client.connect()
+            call = asyncio.ensure_future(client.call_tool("echo", {"sleep": 5}))
+            await asyncio.sleep(0.1)
+            client._process.kill()
+            result = await asyncio.wait_for(call, timeout=2)
+            await client.disconnect()
+            return result
+
+        result = asyncio.run(run())
+
+        assert not result.success
+
+    def test_unanswered_request_times_out(self, tmp_path):
+        """A dropped response fails its caller and leaves nothing pending."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None, rpc_timeout=0.1)
+
+        async def run():
+            await client.connect()
+            result = await client.call_tool("echo", {"sleep": 1})
+            await client.disconnect()
+            return result
+
+        result = asyncio.run(run())
+
+        assert "No response within 0.1s" in result.error
+        assert client._pending == {}
+
+    def test_message_ids_wrap_at_31_bits(self):
+        """Request ids stay within a signed 32-bit range."""
+        client = MCPClient(MCPServer(name="x", command="x"), tool_cache_dir=None)
+        client._ids = itertools.count(0x7FFFFFFF)
+
+        ids, _ = client._encode_requests([("ping", {}), ("ping", {})])
+
+        assert ids == [0x7FFFFFFF, 0]
+
+    def test_progress_streamed_to_sink(self, tmp_path):
+        """Progress notifications reach the sink before the result returns."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None)
+        seen = []
+
+        async def run():
+            await client.connect()
+            result = await client.call_tool_stream(
+                "echo", {"steps": 3}, lambda params: seen.append(params["progress"])
+            )
+            plain = await client.call_tool("echo", {"steps": 2})
+            await client.disconnect()
+            return result, plain
+
+        result, plain = asyncio.run(run())
+
+        assert result.success and plain.success
+        assert seen == [1, 2, 3]
+        assert client._progress_sinks == {}
+
+    def test_server_requests_answered_not_routed(self, tmp_path):
+        """Server pings reusing a pending id are answered, not taken as results."""
+        script = textwrap.dedent(
+            """
+            import json, sys
+
+            def send(message):
+                print(json.dumps(dict(message, jsonrpc="2.0")), flush=True)
+
+            for line in sys.stdin:
+                request = json.loads(line)
+                if request["method"] != "tools/call":
+                    send({"id": request["id"], "result": {"tools": []}})
+                    continue
+                replies = []
+                for method in ("ping", "roots/list"):
+                    send({"id": request["id"], "method": method})
+                    replies.append(json.loads(sys.stdin.readline()))
+                send({"method": "notifications/message", "params": {}})
+                send({"id": request["id"], "result": {"content": replies}})
+            """
+        )
+        server = MCPServer(name="asks", command=sys.executable, args=["-c", script])
+        client = MCPClient(server, tool_cache_dir=None, rpc_timeout=5)
+
+        async def run():
+            await client.connect()
+            result = await client.call_tool("echo", {})
+            await client.disconnect()
+            return result
+
+        result = asyncio.run(run())
+
+        ping, roots = result.content
+        assert ping["result"] == {}
+        assert roots["error"]["code"] == -32601
+        assert ping["id"] == roots["id"]
+
+    def test_same_tick_requests_share_a_write(self, tmp_path):
+        """Requests issued together reach the pipe in a single write."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None)
+        writes = []
+        events = []
+
+        async def run():
+            await client.connect()
+            stdin = client._process.stdin
+            write, drain = stdin.write, stdin.drain
+            stdin.write = lambda data: (writes.append(data), write(data))[1]
+
+            async def logged_drain():
+                events.append(len(writes))
+                await drain()
+
+            stdin.drain = logged_drain
+            results = await asyncio.gather(
+                *(client.call_tool("echo", {"n": n}) for n in range(4))
+            )
+            await client.disconnect()
+            return results
+
+        results = asyncio.run(run())
+
+        assert [r.content["n"] for r in results] == [0, 1, 2, 3]
+        assert len(writes) == 1
+        # Every drain() waits for the batched write it is meant to flush
+        assert events == [1, 1, 1, 1]
+
+    def test_large_response_line(self, tmp_path):
+        """Responses beyond asyncio's default 64 KiB line limit are read."""
+        server, _ = fake_server(tmp_path)
+        client = MCPClient(server, tool_cache_dir=None)
+        text = "x" * 200_000
+
+        async def run():
+            await client.connect()
+            result = await client.call_tool("echo", {"text": text})
+            await client.disconnect()
+            return result
+
+        assert asyncio.run(run()).content["text"] == text
+
+
+class TestRequestEncoding:
+    """Test MCPClient._encode_requests()."""
+
+    def test_templated_envelope_is_valid_json_rpc(self):
+        """Single requests are objects, several form a batch array."""
+        client = MCPClient(MCPServer(name="x", command="x"), tool_cache_dir=None)
+
+        ids, single = client._encode_requests([("tools/list", {})])
+        _, batch = client._encode_requests(
+            [("tools/call", {"name": "a\"b", "arguments": {}}), ("ping", {})]
+        )
+
+        assert ids == [1]
+        assert json.loads(single) == {
+            "jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}
+        }
+        assert [r["id"] for r in json.loads(batch)] == [2, 3]
+        assert json.loads(batch)[0]["params"]["name"] == 'a"b'
+
+
+class TestDataclasses:
+    """Test the MCP record types."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_records_are_slotted(self):
+        """Per-tool and per-call records carry no instance __dict__."""
+        records = [
+            MCPTool(name="t", description="", input_schema={}),
+            MCPCallResult(success=True, content=None),
+            MCPServer(name="s", command="x"),
+        ]
+
+        assert not any(hasattr(record, "__dict__") for record in records)
+
+
+class TestToolAdapter:
+    """Test MCPToolAdapter tool functions."""
+
+    def test_text_content_returned_without_reencoding(self):
+        """Plain text and single text blocks pass through; the rest is JSON."""
+        contents = [
+            "plain",
+            [{"type": "text", "text": "block"}],
+            {"rows": [1, 2]},
+        ]
+
+        class Client:
+            async def call_tool(self, name, arguments):
+                return MCPCallResult(success=True, content=contents[arguments["i"]])
+
+        tool_func = MCPToolAdapter(Client()).create_tool_function(
+            MCPTool(name="t", description="", input_schema={})
+        )
+        outputs = [asyncio.run(tool_func(i=i)) for i in range(3)]
+
+        assert outputs[:2] == ["plain", "block"]
+        assert json.loads(outputs[2]) == {"rows": [1, 2]}
+        assert outputs[2].startswith('{\n  "rows"')
+
+
+class TestServerHandler:
+    """Test MCPServerHandler.handle_request()."""
+
+    def test_sync_and_async_tools(self):
+        """Tools and agent methods are awaited only when they are coroutines."""
+
+        class EchoAgent:
+            name = "echo"
+
+            async def execute(self, task):
+                return f"did {task}"
+
+        handler = MCPServerHandler()
+        handler.register_tool("double", lambda x: 2 * x)
+        handler.register_agent(EchoAgent())
+
+        def call(name, arguments):
+            request = {
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": arguments},
+            }
+            return asyncio.run(handler.handle_request(request))["result"]
+
+        assert handler._is_coro == {"double": False, "echo_execute": True}
+        assert call("double", {"x": 4}) == {"content": 8}
+        assert call("echo_execute", {"task": "x"}) == {"content": "did x"}
+
+
+class TestStdioServer:
+    """Test MCPBridge.start_stdio_server()."""
+
+    def test_requests_answered_line_by_line(self, monkeypatch):
+        """Each request line gets one response; bad JSON is skipped."""
+        bridge = MCPBridge(tool_cache_dir=None)
+        bridge.register_tool("add", lambda a, b: a + b)
+        bridge.register_tool("bad", lambda: object())
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+            "not json",
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/call",
+                "params": {"name": "add", "arguments": {"a": 1, "b": 2}},
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "tools/call",
+                "params": {"name": "bad", "arguments": {}},
+            },
+        ]
+        stdin = "".join(
+            (r if isinstance(r, str) else json.dumps(r)) + "\n" for r in requests
+        )
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        asyncio.run(bridge.start_stdio_server())
+
+        stdout.flush()
+        responses = sorted(
+            (json.loads(line) for line in stdout.buffer.getvalue().splitlines()),
+            key=lambda r: r["id"],
+        )
+        assert [r["id"] for r in responses] == [1, 2, 3]
+        assert responses[0]["result"]["tools"][0]["name"] == "add"
+        assert responses[1]["result"] == {"content": 3}
+        assert responses[2]["error"]["code"] == -32700
+
+    def test_regular_file_stdin(self, tmp_path, monkeypatch):
+        """A redirected file is read as raw bytes from a worker thread."""
+        bridge = MCPBridge(tool_cache_dir=None)
+        bridge.register_tool("greet", lambda: "h\u00e9llo")
+        requests = tmp_path / "requests.jsonl"
+        requests.write_text(
+            json.dumps({
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": "greet", "arguments": {}},
+            }) + "\n"
+        )
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        with open(requests) as stdin:
+            monkeypatch.setattr(sys, "stdin", stdin)
+            asyncio.run(bridge.start_stdio_server())
+
+        stdout.flush()
+        response = json.loads(stdout.buffer.getvalue())
+        assert response["result"]["content"] == "h\u00e9llo"
+
+    def test_slow_tool_does_not_block_next_request(self, tmp_path):
+        """Over a real pipe, a fast request is answered before slow ones."""
+        script = tmp_path / "serve.py"
+        script.write_text(textwrap.dedent(
+            f"""
+            import asyncio, importlib.util, time
+
+            spec = importlib.util.spec_from_file_location(
+                "mcp_bridge", {MCP_BRIDGE_PATH!r}
+            )
+            mcp_bridge = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mcp_bridge)
+
+            async def slow():
+                await asyncio.sleep(0.3)
+                return "slow"
+
+            bridge = mcp_bridge.MCPBridge(tool_cache_dir=None)
+            bridge.register_tool("slow", slow)
+            bridge.register_tool("blocking", lambda: time.sleep(0.15) or "blocking")
+            bridge.register_tool("fast", lambda: "fast")
+            asyncio.run(bridge.start_stdio_server())
+            """
+        ))
+        requests = "".join(
+            json.dumps({
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": {}},
+            }) + "\n"
+            for i, name in enumerate(["slow", "blocking", "fast"])
+        )
+
+        done = subprocess.run(
+            [sys.executable, str(script)],
+            input=requests,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+
+        responses = [json.loads(line) for line in done.stdout.splitlines()]
+        assert [r["result"]["content"] for r in responses] == [
+            "fast", "blocking", "slow"
+        ]
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp not installed")
+class TestHttpTransport:
+    """Test MCPClient over HTTP with a pooled session."""
+
+    def test_calls_reuse_one_session(self):
+        """Health check, discovery and calls go through the bridge's session."""
+        from aiohttp import web
+
+        async def health(request):
+            return web.Response(text="ok")
+
+        async def rpc(request):
+            body = await request.json()
+            if body["method"] == "tools/list":
+                result = {"tools": [{"name": "echo"}]}
+            else:
+                result = {"content": body["params"]["arguments"]}
+            return web.json_response(
+                {"jsonrpc": "2.0", "id": body["id"], "result": result}
+            )
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/health", health)
+            app.router.add_post("/", rpc)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            bridge = MCPBridge(tool_cache_dir=None)
+            server = MCPServer(
+                name="web",
+                command="",
+                transport=MCPTransport.HTTP,
+                url=f"http://127.0.0.1:{port}",
+            )
+            assert await bridge.connect_server(server)
+            session = bridge._http
+            result = await bridge.call_tool("web", "echo", {"n": 1})
+            tools = [tool.name for tool in bridge.get_all_tools()]
+            await bridge.disconnect_all()
+            await runner.cleanup()
+            return result, tools, session
+
+        result, tools, session = asyncio.run(run())
+
+        assert result.content == {"n": 1}
+        assert tools == ["echo"]
+        assert session.closed
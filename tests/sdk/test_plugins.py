@@ -0,0 +1,224 @@
+"""
+Tests for the SDK plugin system (registry, hooks, built-in plugins).
+"""
+import asyncio
+import threading
+from datetime import datetime
+
+from interpreter.sdk import plugins
+from interpreter.sdk.plugins import AgentPlugin, HookPoint, PluginRegistry
+
+
+class Upper(AgentPlugin):
+    name = "upper"
+
+    async def on_before_execute(self, agent, task):
+        return task.upper()
+
+    async def on_after_execute(self, agent, result):
+        return result
+
+
+class TestPluginRegistry:
+    """Test PluginRegistry indexing and hook dispatch."""
+
+    def test_only_overridden_hooks_indexed(self):
+        """Plugins are listed under the hooks their class overrides."""
+        registry = PluginRegistry()
+        registry.register(Upper())
+        registry.register(type("Noop", (AgentPlugin,), {})())
+
+        indexed = {
+            hook for hook in HookPoint if registry.get_plugins_for_hook(hook)
+        }
+
+        assert indexed == {HookPoint.BEFORE_EXECUTE, HookPoint.AFTER_EXECUTE}
+        assert [hook.slot for hook in HookPoint] == list(range(len(HookPoint)))
+        assert plugins._OVERRIDE_CACHE[Upper] == (
+            plugins._HOOK_BITS[HookPoint.BEFORE_EXECUTE]
+            | plugins._HOOK_BITS[HookPoint.AFTER_EXECUTE]
+        )
+        assert asyncio.run(
+            registry.run_hook(HookPoint.BEFORE_EXECUTE, None, "task")
+        ) == "TASK"
+
+    def test_hook_method_names(self):
+        """Every hook maps to an AgentPlugin method, including on_* values."""
+        assert plugins._HOOK_METHODS[HookPoint.BEFORE_LLM] == "on_before_llm"
+        assert plugins._HOOK_METHODS[HookPoint.ON_ERROR] == "on_error"
+        assert plugins._HOOK_METHODS[HookPoint.ON_TOOL_CALL] == "on_tool_call"
+        for name in plugins._HOOK_METHODS.values():
+            assert callable(getattr(AgentPlugin, name))
+
+        registry = PluginRegistry()
+        logger = plugins.LoggingPlugin(log_func=lambda line: None)
+        registry.register(logger)
+        assert registry.get_plugins_for_hook(HookPoint.ON_ERROR) == [logger]
+
+    def test_register_keeps_priority_order(self):
+        """Plugins stay priority-ordered, ties in registration order."""
+        registry = PluginRegistry()
+        late, first, tie = Upper(), Upper(), Upper()
+        late.priority, first.priority, tie.priority = 200, 10, 200
+        for plugin in (late, first, tie):
+            registry.register(plugin)
+
+        hooked = registry.get_plugins_for_hook(HookPoint.BEFORE_EXECUTE)
+        assert registry.get_plugins() == [first, late, tie]
+        assert hooked == [first, late, tie]
+
+        assert registry.unregister(late)
+        assert not registry.unregister(late)
+        assert registry.get_plugins_for_hook(HookPoint.AFTER_EXECUTE) == [first, tie]
+
+        registry.register(late)
+        assert registry.get_plugins() == [first, tie, late]
+
+    def test_unregister_by_identity(self):
+        """Unregistering tracks each registration, including by name."""
+        registry = PluginRegistry()
+        twice, other = Upper(), Upper()
+        other.name = "other"
+        registry.register(twice)
+        registry.register(twice)
+        registry.register(other)
+
+        assert registry.unregister(twice)
+        assert registry.get_plugins() == [twice, other]
+        assert registry.unregister_by_name("upper") == 1
+        assert not registry.unregister(twice)
+        assert registry.get_plugins_for_hook(HookPoint.BEFORE_EXECUTE) == [other]
+
+    def test_run_hook_without_plugins_passes_value_through(self):
+        """A hook nobody overrides returns the value untouched."""
+        registry = PluginRegistry()
+        registry.register(Upper())
+        value = {"k": 1}
+
+        assert asyncio.run(
+            registry.run_hook(HookPoint.BEFORE_LLM, None, value)
+        ) is value
+
+    def test_notification_hooks_run_concurrently(self):
+        """After-edit listeners overlap, and one failing doesn't stop the rest."""
+        seen = []
+
+        class Listener(AgentPlugin):
+            async def on_after_edit(self, agent, edit_context, success):
+                seen.append(("start", self.name))
+                await asyncio.sleep(0)
+                if self.name == "bad":
+                    raise RuntimeError("boom")
+                seen.append(("end", self.name))
+
+        class Background(Listener):
+            background = True
+
+        registry = PluginRegistry()
+        for name, cls in [("a", Listener), ("bad", Listener), ("bg", Background)]:
+            plugin = cls()
+            plugin.name = name
+            registry.register(plugin)
+
+        async def run():
+            result = await registry.run_hook(
+                HookPoint.AFTER_EDIT, None, "ctx", success=True
+            )
+            pending = set(registry._background)
+            await asyncio.gather(*pending)
+            return result
+
+        assert not HookPoint.AFTER_EDIT.reducing
+        assert not HookPoint.ON_ERROR.reducing
+        assert HookPoint.BEFORE_EXECUTE.reducing
+        assert asyncio.run(run()) == "ctx"
+        assert seen.index(("start", "bad")) < seen.index(("end", "a"))
+        assert set(seen) == {
+            ("start", "a"), ("start", "bad"), ("start", "bg"),
+            ("end", "a"), ("end", "bg"),
+        }
+
+
+class TestRateLimitPlugin:
+    """Test RateLimitPlugin's sliding window."""
+
+    def test_waits_for_oldest_call_to_expire(self, monkeypatch):
+        """Calls and tokens beyond the limit wait out the one-minute window."""
+        clock = [1000.0]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(plugins.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(plugins.asyncio, "sleep", fake_sleep)
+        limiter = plugins.RateLimitPlugin(
+            max_calls_per_minute=2, max_tokens_per_minute=50
+        )
+        result = type("Result", (), {"tokens_used": 30})()
+
+        async def call(dt):
+            clock[0] += dt
+            await limiter.on_before_execute(None, "task")
+            await limiter.on_after_execute(None, result)
+
+        asyncio.run(call(0))
+        asyncio.run(call(10))
+        assert sleeps == []
+        assert limiter._token_sum == 60
+
+        asyncio.run(call(5))  # Third call in 15s waits for the first to age out
+        assert sleeps == [45.0]
+
+        asyncio.run(call(61))
+        assert len(limiter._call_times) == 1
+        assert limiter._token_sum == 30
+
+
+class TestLoggingPlugin:
+    """Test LoggingPlugin output."""
+
+    def test_error_uses_context_timestamp(self):
+        """on_error logs the time recorded on the PluginContext."""
+        lines = []
+        logger = plugins.LoggingPlugin(log_func=lines.append)
+        agent = type("Agent", (), {"name": "scout"})()
+        context = plugins.PluginContext(
+            agent_name="scout",
+            hook_point=HookPoint.ON_ERROR,
+            timestamp=datetime(2024, 1, 2, 3, 4, 5),
+        )
+
+        asyncio.run(logger.on_error(agent, ValueError("bad"), context))
+
+        assert lines == ["[2024-01-02T03:04:05] scout ERROR: bad"]
+
+
+class TestMemoryPlugin:
+    """Test MemoryPlugin edit recording."""
+
+    def test_records_edit_off_the_event_loop(self):
+        """Edits are diffed and recorded in a worker thread."""
+        class Graph:
+            def __init__(self):
+                self.edits = []
+
+            def record_edit(self, edit):
+                self.edits.append((edit, threading.current_thread()))
+
+        graph = Graph()
+        memory = plugins.MemoryPlugin(semantic_graph=graph)
+        context = plugins.EditContext(
+            file_path="mod.py",
+            original_content="def f():\n    return 1\n",
+            new_content="def f():\n    return 2\n",
+        )
+
+        asyncio.run(memory.on_after_edit(None, context, True))
+        asyncio.run(memory.on_after_edit(None, context, False))
+
+        [(edit, thread)] = graph.edits
+        assert thread is not threading.main_thread()
+        assert edit.file_path == "mod.py"
+        assert memory._extractor is not None
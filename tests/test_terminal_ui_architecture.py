@@ -56,6 +56,7 @@ from interpreter.terminal_interface.components.ui_backend import (
     is_tty,
     prompt_toolkit_available,
 )
+from interpreter.terminal_interface.components.agent_strip import AgentStrip
 
 
 # ============================================================================
@@ -239,6 +240,22 @@ class TestAgentState:
         agent.completed_at = agent.started_at + 5.0
         assert agent.elapsed_seconds == 5.0
 
+    def test_previews_truncated_on_update(self):
+        """Test badge previews are cut to PREVIEW_WIDTH when fields change"""
+        state = UIState()
+        agent = state.add_agent("a", AgentRole.SCOUT)
+        assert agent.last_line_preview is None
+
+        state.append_agent_output("a", "short")
+        assert agent.last_line_preview == "short"
+        state.append_agent_output("a", "x" * 30)
+        assert agent.last_line_preview == "x" * 17 + "..."
+
+        state.update_agent_status("a", AgentStatus.ERROR, error="e" * 25)
+        assert agent.error_preview == "e" * 17 + "..."
+        failed = AgentState(id="b", role=AgentRole.SCOUT, error_summary="boom")
+        assert failed.error_preview == "boom"
+
     def test_elapsed_display(self):
         """Test human-readable elapsed time"""
         agent = AgentState(id="test", role=AgentRole.SCOUT)
@@ -1264,6 +1281,108 @@ class TestCreateCompleter:
         assert isinstance(completer, CombinedCompleter)
 
 
+# ============================================================================
+# AgentStrip Tests
+# ============================================================================
+
+class TestAgentStrip:
+    """Tests for AgentStrip rendering"""
+
+    def test_unchanged_badges_reused(self):
+        """Test badges are rebuilt only when their content changes"""
+        state = UIState()
+        state.add_agent("a", AgentRole.SCOUT)
+        state.add_agent("b", AgentRole.SURGEON)
+        state.update_agent_status("b", AgentStatus.RUNNING)
+        strip = AgentStrip(state)
+
+        strip.render()
+        first = dict(strip._badge_cache)
+        running_key = next(k for k in first if k[1] == AgentStatus.RUNNING)
+        assert running_key[3] == "thinking..."
+
+        strip.render()
+        assert all(strip._badge_cache[k] is badge for k, badge in first.items())
+
+        state.append_agent_output("b", "a much longer line of tool output")
+        strip.render()
+        running = [k for k in strip._badge_cache if k[1] == AgentStatus.RUNNING]
+        assert [k[3] for k in running] == ["a much longer lin..."]
+        assert len(strip._badge_cache) == 2
+
+    def test_badge_text(self):
+        """Test badge content for error and selected agents"""
+        state = UIState()
+        state.add_agent("a", AgentRole.VALIDATOR)
+        state.update_agent_status("a", AgentStatus.ERROR, error="boom")
+        state.selected_agent_id = "a"
+        strip = AgentStrip(state)
+
+        badge = strip._build_agent_badge(state.active_agents["a"], True)
+
+        assert badge.plain == "[✅ Validator: ✗ boom]"
+        assert strip.render() is not None
+
+    def test_panel_reused_until_state_changes(self):
+        """Test render returns the cached panel while nothing changed"""
+        state = UIState()
+        state.add_agent("a", AgentRole.SCOUT)
+        strip = AgentStrip(state)
+
+        # A pending agent's clock is ticking, so its panel isn't reused
+        assert strip.render() is not strip.render()
+
+        state.update_agent_status("a", AgentStatus.RUNNING)
+        panel = strip.render()
+        assert strip.render() is panel
+        assert strip.get_running_count() == 1
+
+        state.append_agent_output("a", "step 1")
+        assert strip.render() is not panel
+        panel = strip.render()
+
+        state.selected_agent_id = "a"
+        assert strip.render() is not panel
+
+        state.update_agent_status("a", AgentStatus.COMPLETE)
+        assert strip.get_running_count() == 0
+        assert strip.render() is strip.render()
+
+
+class TestComponentsPackage:
+    """Tests for the lazy components package exports"""
+
+    def test_lazy_exports_resolve(self):
+        """Test every exported name loads from its submodule on access"""
+        import importlib
+        from interpreter.terminal_interface import components
+
+        assert set(components._LAZY) == set(components.__all__)
+        for name, module_name in components._LAZY.items():
+            module = importlib.import_module(
+                f"interpreter.terminal_interface.components.{module_name}"
+            )
+            assert getattr(components, name) is getattr(module, name)
+            assert name in vars(components)
+
+        with pytest.raises(AttributeError):
+            components.NotAComponent
+
+    def test_v04_components_exported(self):
+        """Test the v0.4.x components stay in the public API"""
+        from interpreter.terminal_interface.components import (
+            DiffBlock,
+            ErrorBlock,
+            InteractiveMenu,
+            NetworkStatus,
+            TableDisplay,
+        )
+        from interpreter.terminal_interface import components
+
+        for cls in (ErrorBlock, DiffBlock, InteractiveMenu, TableDisplay, NetworkStatus):
+            assert cls.__name__ in components.__all__
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================